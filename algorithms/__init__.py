@@ -1,5 +1,29 @@
 from .bfs import BFSAlgorithm
 from .dijkstra import DijkstraAlgorithm
 from .a_star import AStarAlgorithm
+from .bidirectional_dijkstra import BidirectionalDijkstraAlgorithm
+from .csr_bfs import CSRBFSAlgorithm
+from .csr_dijkstra import CSRDijkstraAlgorithm
+from .csr_a_star import CSRAStarAlgorithm
+from .contraction_hierarchies import ContractionHierarchiesAlgorithm
+from .cached_dijkstra import CachedDijkstraAlgorithm
+from .distance_matrix import distance_matrix
+from .isochrone import Isochrone, isochrones, isochrones_in_minutes, minutes_to_weight, reachable_within
 
-__all__ = ["BFSAlgorithm", "DijkstraAlgorithm", "AStarAlgorithm"]
+__all__ = [
+    "BFSAlgorithm",
+    "DijkstraAlgorithm",
+    "AStarAlgorithm",
+    "BidirectionalDijkstraAlgorithm",
+    "CSRBFSAlgorithm",
+    "CSRDijkstraAlgorithm",
+    "CSRAStarAlgorithm",
+    "ContractionHierarchiesAlgorithm",
+    "CachedDijkstraAlgorithm",
+    "distance_matrix",
+    "Isochrone",
+    "isochrones",
+    "isochrones_in_minutes",
+    "minutes_to_weight",
+    "reachable_within",
+]
@@ -1,7 +1,9 @@
-from core import GraphAlgorithm
-from core.decorators import log_execution, measure_time
+from core import GraphAlgorithm, CSRGraph
+from core.path import Path
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
+from core.heuristics import bind_heuristic, validate_heuristic, HEURISTIC_TRAVEL_TIME, HEURISTIC_EUCLIDEAN
+from core.priority_queues import PriorityQueue, make_priority_queue, validate_priority_queue, QUEUE_HEAPQ
 from typing import Tuple, AsyncGenerator
-import heapq
 import math
 
 
@@ -10,11 +12,55 @@ class AStarAlgorithm(GraphAlgorithm):
     Implements the A* algorithm for pathfinding using asynchronous generators for efficient iteration.
 
     The algorithm operates on a graph and finds the shortest path from a start node to an end node.
-    It uses a heuristic function (Euclidean distance) to guide the search.
+    It uses a heuristic function to guide the search. The default "travel_time" heuristic is the
+    great-circle distance divided by the fastest edge speed of the graph, which is in the same unit
+    as the edge weights and never overestimates, so the path stays optimal while far fewer nodes
+    are settled. "alt" additionally uses precomputed landmark distances (see
+    `core.landmarks.LandmarkHeuristic`), "euclidean" keeps the original distance in raw
+    coordinate degrees and "none" turns A* into Dijkstra.
+
+    `run` performs the same search as `execute` in a plain loop, without visualization.
+
+    Attributes:
+        heuristic (str): The heuristic mode, one of `core.heuristics.HEURISTIC_MODES`.
+        landmarks (LandmarkHeuristic): Landmark tables used by the "alt" mode, or None to
+            build them with the default settings on first use.
+        priority_queue (str): The priority queue kind, one of `core.priority_queues.PRIORITY_QUEUES`.
+        queue_options (dict): Keyword arguments for the priority queue, such as `scale` for "radix".
+        queue (PriorityQueue): The priority queue of the last search, or None before the first one.
     """
 
+    def __init__(
+            self, graph, visualizer, styler, heuristic: str = HEURISTIC_TRAVEL_TIME, landmarks=None,
+            priority_queue: str = QUEUE_HEAPQ, queue_options: dict = None
+    ):
+        """
+        Constructs the AStarAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            heuristic (str, optional): The heuristic mode. Defaults to "travel_time".
+            landmarks (LandmarkHeuristic, optional): Landmark tables for the "alt" mode. Defaults to None.
+            priority_queue (str, optional): The priority queue kind. Defaults to "heapq".
+            queue_options (dict, optional): Keyword arguments for the priority queue. Defaults to None.
+
+        Raises:
+            ValueError: If the heuristic mode or the priority queue kind is not supported.
+        """
+        super().__init__(graph, visualizer, styler)
+        self.heuristic = validate_heuristic(heuristic)
+        self.landmarks = landmarks
+        self.priority_queue = validate_priority_queue(priority_queue)
+        self.queue_options = queue_options or {}
+        self.queue = None
+        self._node_index = None
+        self._bound_target = None
+        self._bound_heuristic = None
+
     @log_execution
-    @measure_time
+    @measure_time(phase=PHASE_SEARCH)
     async def execute(self, start: int, end: int, plot: bool = False):
         """
         Executes the A* algorithm to find the shortest path from a start node to an end node.
@@ -27,41 +73,85 @@ class AStarAlgorithm(GraphAlgorithm):
         Returns:
             None
         """
-        self.initialize_graph()
+        self.initialize_graph(plot)
         self.styler.style_node(self.graph, start, size=50)
         self.styler.style_node(self.graph, end, size=50)
 
-        priority_queue = [(0, start)]  #: (f_score, node)
-        self.graph.nodes[start]["g_score"] = 0
-        self.graph.nodes[start]["f_score"] = self._heuristic(start, end)
-
+        priority_queue = self._start_search(start, end)
         async for current_node in self._node_iterator(priority_queue, end, plot):
             if current_node == end:
                 return
 
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs the A* algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        self.initialize_graph(False)
+        priority_queue = self._start_search(start, end)
+        state = self.state
+        while priority_queue:
+            _, current_node = priority_queue.pop()
+            if not state.is_settled(current_node):
+                self._expand(current_node, end, priority_queue)
+            if current_node == end:
+                break
+        return self.finish(start, end)
+
+    def _start_search(self, start: int, end: int) -> PriorityQueue:
+        """
+        Binds the heuristic to the end node and creates the priority queue of a new search.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            PriorityQueue: The queue holding the start node, keyed by f_score.
+        """
+        if self.heuristic != HEURISTIC_EUCLIDEAN:
+            csr = CSRGraph.for_graph(self.graph)
+            self._node_index = csr.index
+            self._bound_target = end
+            self._bound_heuristic = bind_heuristic(
+                self.heuristic, csr, csr.index[end], csr.index[start], self.landmarks
+            )
+        priority_queue = make_priority_queue(self.priority_queue, **self.queue_options)
+        priority_queue.push(start, 0)
+        self.queue = priority_queue
+        self.state.update(start, 0)
+        return priority_queue
+
     async def _node_iterator(
-            self, priority_queue: list, end: int, plot: bool
+            self, priority_queue: PriorityQueue, end: int, plot: bool
     ) -> AsyncGenerator[int, None]:
         """
         Asynchronous generator that iterates over nodes in a priority queue.
 
         Args:
-            priority_queue (list): The priority queue used to determine the next node to visit.
+            priority_queue (PriorityQueue): The priority queue used to determine the next node to visit.
             end (int): The target node for the algorithm.
             plot (bool): Flag indicating whether to capture frames for visualization. Defaults to False.
 
         Yields:
             int: The current node being processed.
         """
+        state = self.state
+        time_slice = self.time_slice
         step = 0
         while priority_queue:
-            _, current_node = heapq.heappop(priority_queue)
-
-            if not self.graph.nodes[current_node]["visited"]:
-                self.graph.nodes[current_node]["visited"] = True
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            _, current_node = priority_queue.pop()
 
-                for edge in self.graph.out_edges(current_node, keys=True):
-                    self._process_edge(edge, end, priority_queue)
+            if not state.is_settled(current_node):
+                self._expand(current_node, end, priority_queue, plot)
 
                 if plot and step % 10 == 0:
                     await self.visualizer.capture_frame()
@@ -69,43 +159,79 @@ class AStarAlgorithm(GraphAlgorithm):
 
             yield current_node
 
-    def _process_edge(self, edge: Tuple[int, int, int], end: int, priority_queue: list):
+    def _expand(self, node: int, end: int, priority_queue: PriorityQueue, plot: bool = False):
+        """
+        Settles a node and relaxes its out-edges.
+
+        Args:
+            node (int): The node taken from the priority queue.
+            end (int): The target node for the algorithm.
+            priority_queue (PriorityQueue): The priority queue used to schedule nodes for processing.
+            plot (bool, optional): Whether to style the edges for visualization. Defaults to False.
+        """
+        self.state.settle(node)
+        for edge in self.graph.out_edges(node, keys=True):
+            self._process_edge(edge, end, priority_queue, plot)
+
+    def _process_edge(self, edge: Tuple[int, int, int], end: int, priority_queue: PriorityQueue, plot: bool = False):
         """
         Processes an edge during the A* algorithm's execution.
 
-        Updates the g_score and f_score for the neighbor node if a shorter path is found.
+        Updates the g_score of the neighbor node and schedules it by its f_score if a shorter path is found.
 
         Args:
             edge (Tuple[int, int, int]): A tuple representing the edge (start_node, neighbor_node, edge_id).
             end (int): The target node for the algorithm.
-            priority_queue (list): The priority queue used to schedule nodes for processing.
+            priority_queue (PriorityQueue): The priority queue used to schedule nodes for processing.
+            plot (bool, optional): Whether to style the edge for visualization. Defaults to False.
 
         Returns:
             None
         """
         neighbor = edge[1]
         weight = self.graph.edges[edge]["weight"]
-        g_score = self.graph.nodes[edge[0]]["g_score"] + weight
+        g_score = self.state.distance(edge[0]) + weight
+
+        if g_score < self.state.distance(neighbor):
+            self.state.update(neighbor, g_score, edge[0], edge[2])
+            f_score = g_score + self._heuristic(neighbor, end)
+            priority_queue.push(neighbor, f_score)
 
-        if g_score < self.graph.nodes[neighbor]["g_score"]:
-            self.graph.nodes[neighbor]["g_score"] = g_score
-            self.graph.nodes[neighbor]["f_score"] = g_score + self._heuristic(neighbor, end)
-            self.graph.nodes[neighbor]["previous"] = edge[0]
-            heapq.heappush(priority_queue, (self.graph.nodes[neighbor]["f_score"], neighbor))
+        if plot:
+            self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
 
-        self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished search; queue operations come from the counters of `queue`.
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        super()._count_search(counters)
+        queue = self.queue
+        counters.heap_pushes = queue.pushes
+        counters.heap_pops = queue.pops + queue.stale_pops
+        counters.stale_pops = queue.stale_pops
+        counters.max_frontier = queue.peak_size
 
     def _heuristic(self, node1: int, node2: int) -> float:
         """
-        Calculates the heuristic value (Euclidean distance) between two nodes.
+        Calculates the heuristic value between two nodes according to the heuristic mode.
 
         Args:
             node1 (int): The first node's identifier.
             node2 (int): The second node's identifier.
 
         Returns:
-            float: The Euclidean distance between the two nodes.
+            float: The estimated cost between the two nodes.
         """
+        if self.heuristic != HEURISTIC_EUCLIDEAN:
+            if node2 != self._bound_target:
+                csr = CSRGraph.for_graph(self.graph)
+                self._node_index = csr.index
+                self._bound_target = node2
+                self._bound_heuristic = bind_heuristic(self.heuristic, csr, csr.index[node2], None, self.landmarks)
+            return self._bound_heuristic(self._node_index[node1])
         x1, y1 = self.graph.nodes[node1]["x"], self.graph.nodes[node1]["y"]
         x2, y2 = self.graph.nodes[node2]["x"], self.graph.nodes[node2]["y"]
         return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
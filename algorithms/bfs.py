@@ -1,6 +1,9 @@
 from core import GraphAlgorithm
-from core.decorators import log_execution, measure_time
+from core.path import Path
+from core.counters import make_deque
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
 from typing import Tuple, AsyncGenerator
+from collections import deque
 
 
 class BFSAlgorithm(GraphAlgorithm):
@@ -12,6 +15,12 @@ class BFSAlgorithm(GraphAlgorithm):
     `GraphAlgorithm` base class and provides methods for executing
     BFS on a graph structure with optional visualization support.
 
+    Nodes are marked as discovered when they are enqueued, so every node enters
+    the `deque` at most once, and the search stops as soon as the end node is
+    discovered rather than when it is dequeued.
+
+    `run` performs the same traversal as `execute` in a plain loop, without visualization.
+
     Attributes:
         graph: The graph structure to traverse.
         styler: A utility for styling nodes and edges in the graph.
@@ -19,7 +28,7 @@ class BFSAlgorithm(GraphAlgorithm):
     """
 
     @log_execution
-    @measure_time
+    @measure_time(phase=PHASE_SEARCH)
     async def execute(self, start: int, end: int, plot: bool = False):
         """
         Executes the BFS algorithm to traverse a graph from a start node to an end node.
@@ -35,65 +44,97 @@ class BFSAlgorithm(GraphAlgorithm):
         Raises:
             Exception: Any exceptions raised during graph initialization or traversal.
         """
-        self.initialize_graph()
+        self.initialize_graph(plot)
         self.styler.style_node(self.graph, start, size=50)
         self.styler.style_node(self.graph, end, size=50)
 
-        queue = [start]
+        queue = make_deque([start], self._counters)
+        self.state.update(start, 0)
         async for current_node in self._node_iterator(queue, plot):
             if current_node == end:
                 return
 
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs the BFS algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the BFS traversal.
+            end (int): The target node to reach during the traversal.
+
+        Returns:
+            Path: The path with the fewest edges, or an empty path if `end` is unreachable.
+        """
+        self.initialize_graph(False)
+        state = self.state
+        queue = make_deque([start], self._counters)
+        state.update(start, 0)
+        while queue and not state.is_reached(end):
+            current_node = queue.popleft()
+            state.settle(current_node)
+            for edge in self.graph.out_edges(current_node, keys=True):
+                if self._process_edge(edge, queue) == end:
+                    break
+        return self.finish(start, end)
+
     async def _node_iterator(
-            self, queue: list, plot: bool
+            self, queue: deque, plot: bool
     ) -> AsyncGenerator[int, None]:
         """
-        Asynchronous generator that iterates over nodes in the BFS queue.
+        Asynchronous generator that expands the BFS queue and yields newly discovered nodes.
 
         Args:
-            queue (list): The queue containing nodes to be processed.
+            queue (deque): The queue containing discovered nodes still to be expanded.
             plot (bool): Whether to visualize each step of the traversal.
 
         Yields:
-            int: The current node being processed.
+            int: A node that has just been discovered, starting with the nodes already in the queue.
 
         Raises:
             Exception: Any exceptions encountered during node iteration.
         """
+        state = self.state
+        for node in queue:
+            yield node
+        time_slice = self.time_slice
         step = 0
         while queue:
-            current_node = queue.pop(0)
-
-            if not self.graph.nodes[current_node]["visited"]:
-                self.graph.nodes[current_node]["visited"] = True
-
-                for edge in self.graph.out_edges(current_node, keys=True):
-                    self._process_edge(edge, queue)
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            current_node = queue.popleft()
+            state.settle(current_node)
 
-                if plot and step % 10 == 0:
-                    await self.visualizer.capture_frame()
-                step += 1
+            for edge in self.graph.out_edges(current_node, keys=True):
+                neighbor = self._process_edge(edge, queue, plot)
+                if neighbor is not None:
+                    yield neighbor
 
-            yield current_node
+            if plot and step % 10 == 0:
+                await self.visualizer.capture_frame()
+            step += 1
 
-    def _process_edge(self, edge: Tuple[int, int, int], queue: list):
+    def _process_edge(self, edge: Tuple[int, int, int], queue: deque, plot: bool = False):
         """
         Processes an edge during the BFS traversal.
 
-        This method styles the edge and adds the neighbor node to the queue if it has not been visited.
+        This method styles the edge and enqueues the neighbor node if it has not been discovered yet.
 
         Args:
             edge (Tuple[int, int, int]): The edge to process, represented as a tuple (source, target, key).
-            queue (list): The queue to which unvisited neighbor nodes will be added.
+            queue (deque): The queue to which newly discovered neighbor nodes will be added.
+            plot (bool, optional): Whether to style the edge for visualization. Defaults to False.
 
         Returns:
-            None: This method modifies the graph and queue in place.
+            Any: The neighbor node if it was discovered through this edge, otherwise None.
 
         Raises:
             Exception: Any exceptions related to graph node or edge processing.
         """
-        self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
+        if plot:
+            self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
         neighbor = edge[1]
-        if not self.graph.nodes[neighbor]["visited"]:
-            self.graph.nodes[neighbor]["previous"] = edge[0]
-            queue.append(neighbor)
+        if self.state.is_reached(neighbor):
+            return None
+        self.state.update(neighbor, self.state.distance(edge[0]) + 1, edge[0], edge[2])
+        queue.append(neighbor)
+        return neighbor
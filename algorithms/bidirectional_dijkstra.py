@@ -0,0 +1,261 @@
+from core import GraphAlgorithm, SearchState
+from core.path import Path
+from core.counters import heap_operations
+from core.decorators import log_execution, measure_time, PHASE_SEARCH, PHASE_RECONSTRUCT
+from typing import Tuple, AsyncGenerator
+import heapq
+
+
+class BidirectionalDijkstraAlgorithm(GraphAlgorithm):
+    """
+    Implements bidirectional Dijkstra for point-to-point shortest paths.
+
+    A forward search from the start node follows out-edges while a backward search
+    from the end node follows in-edges; the side whose queue has the smaller minimum
+    is expanded next. Every edge that connects the two search spaces is a candidate
+    meeting point, and the search stops as soon as the two queue minima together
+    can no longer beat the best candidate. On road graphs this settles roughly half
+    as many nodes as `DijkstraAlgorithm`, which grows a full disk around the start.
+
+    `run` performs the same search as `execute` in a plain loop, without visualization.
+
+    Attributes:
+        backward_state (SearchState): Search state of the backward search; predecessors
+            point towards the end node.
+        meeting_node (Any): The node where the best forward and backward paths meet,
+            or None if no path was found.
+    """
+
+    def __init__(self, graph, visualizer, styler):
+        """
+        Constructs the BidirectionalDijkstraAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+        """
+        super().__init__(graph, visualizer, styler)
+        self._backward_state = None
+        self.meeting_node = None
+        self._best_distance = float("inf")
+        self._heappush, self._heappop = heapq.heappush, heapq.heappop
+
+    @property
+    def backward_state(self) -> SearchState:
+        """SearchState: The backward search state, rebuilt only when the node count changes."""
+        if self._backward_state is None or self._backward_state.size != self.graph.number_of_nodes():
+            self._backward_state = SearchState(self.graph.nodes)
+        return self._backward_state
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Executes bidirectional Dijkstra to compute the shortest path in the graph.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+            plot (bool, optional): Whether to visualize the graph traversal.
+                Defaults to False.
+
+        Returns:
+            None
+        """
+        self.initialize_graph(plot)
+        self.backward_state.reset()
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        forward_queue, backward_queue = self._start_search(start, end)
+        async for _ in self._node_iterator(forward_queue, backward_queue, plot):
+            pass
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs bidirectional Dijkstra synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        self.initialize_graph(False)
+        self.backward_state.reset()
+        forward_queue, backward_queue = self._start_search(start, end)
+        while forward_queue and backward_queue:
+            if forward_queue[0][0] + backward_queue[0][0] >= self._best_distance:
+                break
+            self._step(forward_queue, backward_queue)
+        return self.finish(start, end)
+
+    def _start_search(self, start: int, end: int) -> Tuple[list, list]:
+        """
+        Records the start and end nodes and creates the queues of a new search.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Tuple[list, list]: The forward and backward heaps of `(distance, node)` tuples.
+        """
+        self.state.update(start, 0)
+        self.backward_state.update(end, 0)
+        self.meeting_node = start if start == end else None
+        self._best_distance = 0 if start == end else float("inf")
+        forward_queue, backward_queue = [(0, start)], [(0, end)]
+        heap_operations(self._counters, forward_queue)
+        self._heappush, self._heappop = heap_operations(self._counters, backward_queue)
+        return forward_queue, backward_queue
+
+    async def _node_iterator(
+            self, forward_queue: list, backward_queue: list, plot: bool
+    ) -> AsyncGenerator[int, None]:
+        """
+        Asynchronous generator alternating between the forward and backward searches.
+
+        Args:
+            forward_queue (list): Heap of `(distance, node)` tuples of the forward search.
+            backward_queue (list): Heap of `(distance, node)` tuples of the backward search.
+            plot (bool): Whether to capture frames during traversal for visualization.
+
+        Yields:
+            int: The node that has just been settled by either search.
+        """
+        time_slice = self.time_slice
+        step = 0
+        while forward_queue and backward_queue:
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            if forward_queue[0][0] + backward_queue[0][0] >= self._best_distance:
+                return
+
+            current_node, expanded = self._step(forward_queue, backward_queue, plot)
+            if expanded:
+                if plot and step % 10 == 0:
+                    await self.visualizer.capture_frame()
+                step += 1
+
+            yield current_node
+
+    def _step(self, forward_queue: list, backward_queue: list, plot: bool = False) -> Tuple[int, bool]:
+        """
+        Pops the next node of the side with the smaller queue minimum and expands it.
+
+        Args:
+            forward_queue (list): Heap of `(distance, node)` tuples of the forward search.
+            backward_queue (list): Heap of `(distance, node)` tuples of the backward search.
+            plot (bool, optional): Whether to style the edges for visualization. Defaults to False.
+
+        Returns:
+            Tuple[int, bool]: The popped node and whether it was settled by this step
+                (False for stale queue entries).
+        """
+        forward = forward_queue[0][0] <= backward_queue[0][0]
+        queue = forward_queue if forward else backward_queue
+        state = self.state if forward else self.backward_state
+        current_distance, current_node = self._heappop(queue)
+
+        if state.is_settled(current_node):
+            return current_node, False
+        state.settle(current_node)
+
+        if forward:
+            edges = self.graph.out_edges(current_node, keys=True)
+        else:
+            edges = self.graph.in_edges(current_node, keys=True)
+        for edge in edges:
+            self._process_edge(edge, current_distance, queue, forward, plot)
+        return current_node, True
+
+    def _process_edge(
+            self, edge: Tuple[int, int, int], current_distance: float, queue: list, forward: bool, plot: bool = False
+    ):
+        """
+        Relaxes an edge in one of the two searches and updates the best meeting point.
+
+        Args:
+            edge (Tuple[int, int, int]): The edge as (source, target, key) in graph orientation.
+            current_distance (float): The distance of the node being expanded from its search origin.
+            queue (list): The priority queue of the search being expanded.
+            forward (bool): Whether the forward search is being expanded.
+            plot (bool, optional): Whether to style the edge for visualization. Defaults to False.
+
+        Returns:
+            None
+        """
+        current_node, neighbor = (edge[0], edge[1]) if forward else (edge[1], edge[0])
+        state, other_state = (self.state, self.backward_state) if forward else (self.backward_state, self.state)
+        new_distance = current_distance + self.graph.edges[edge]["weight"]
+
+        if new_distance < state.distance(neighbor):
+            state.update(neighbor, new_distance, current_node, edge[2])
+            self._heappush(queue, (new_distance, neighbor))
+
+        if other_state.is_reached(neighbor):
+            candidate = state.distance(neighbor) + other_state.distance(neighbor)
+            if candidate < self._best_distance:
+                self._best_distance = candidate
+                self.meeting_node = neighbor
+
+        if plot:
+            self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
+
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished search from both search states.
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        settled_count = relaxed = 0
+        for state, degrees in ((self.state, self.graph.out_degree), (self.backward_state, self.graph.in_degree)):
+            settled = [node for node, generation in state.settled.items() if generation == state.generation]
+            settled_count += len(settled)
+            relaxed += sum(degree for _, degree in degrees(settled))
+        counters.nodes_settled = settled_count
+        counters.edges_relaxed = relaxed
+        counters.stale_pops = max(counters.heap_pops - counters.nodes_settled, 0)
+
+    def path(self, start: int, end: int) -> list:
+        """
+        Returns the path found by the last search.
+
+        The forward predecessors lead from the meeting node back to `start`, and the
+        backward predecessors lead from the meeting node on to `end`.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if no path was found.
+        """
+        return self.reconstruct(start, end).tolist()
+
+    @measure_time(phase=PHASE_RECONSTRUCT)
+    def reconstruct(self, start: int, end: int) -> Path:
+        """
+        Returns the path found by the last search as a `Path`.
+
+        The backward search records the keys of the edges it relaxed in graph
+        orientation, so its part of the path is reversed together with its keys.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The nodes, edge keys and cumulative costs, or an empty path if no path was found.
+        """
+        if self.meeting_node is None:
+            return Path.empty()
+        head, head_keys = self.state.trace(start, self.meeting_node)
+        tail, tail_keys = self.backward_state.trace(end, self.meeting_node)
+        if not head or not tail:
+            return Path.empty()
+        return Path.from_keys(self.graph, head + tail[-2::-1], head_keys + tail_keys[::-1])
@@ -0,0 +1,124 @@
+from core import CSRGraphAlgorithm
+from core.decorators import log_execution, measure_time, PHASE_SEARCH, PHASE_RECONSTRUCT
+from core.path import Path
+from core.tree_cache import ShortestPathTreeCache
+
+
+class CachedDijkstraAlgorithm(CSRGraphAlgorithm):
+    """
+    Dijkstra's algorithm answering queries from a cache of shortest path trees.
+
+    The first query from a start node runs Dijkstra only until the end node is
+    settled and keeps the paused search. Later queries from the same start node
+    either read the answer from the settled part of the tree or resume the search
+    until the farther end node is settled, so a batch of queries sharing a start
+    node costs about as much as one search to the farthest end node.
+
+    With `collect_counters`, the counters report the search work of the query itself:
+    the nodes settled and edges relaxed while resuming or starting its tree, and
+    nothing for a query answered from the settled part of a tree.
+
+    Attributes:
+        cache (ShortestPathTreeCache): The cache of shortest path trees, which may be
+            shared between instances working on the same graph.
+    """
+
+    def __init__(self, graph, visualizer, styler, cache: ShortestPathTreeCache = None):
+        """
+        Constructs the CachedDijkstraAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            cache (ShortestPathTreeCache, optional): The tree cache to use. Defaults to a new
+                cache for `graph` with the default memory budget.
+        """
+        super().__init__(graph, visualizer, styler)
+        self.cache = cache if cache is not None else ShortestPathTreeCache(graph)
+        self._tree = None
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Computes the shortest path from a start node to an end node using the tree cache.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+            plot (bool, optional): Whether to visualize the found path. Defaults to False.
+
+        Returns:
+            None
+        """
+        self.initialize_graph(plot)
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        self._tree = self.cache.tree(start, end, self._counters)
+
+        if plot:
+            csr = self.csr
+            path = self._tree.path(csr.index[end])
+            for step, (u, v) in enumerate(zip(path, path[1:])):
+                self.style_csr_edge(csr, csr.edge_index(u, v), color="#2432B0", alpha=1, linewidth=3)
+                if step % 10 == 0:
+                    await self.visualizer.capture_frame()
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Computes the shortest path using the tree cache synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        self.initialize_graph(False)
+        self._tree = self.cache.tree(start, end, self._counters)
+        return self.finish(start, end)
+
+    def path(self, start: int, end: int) -> list:
+        """
+        Returns the shortest path from the cached tree of the start node.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if no path was found.
+        """
+        csr = self.csr
+        if self._tree is None or self._tree.source != csr.index[start]:
+            return []
+        return [csr.node_ids[index].item() for index in self._tree.path(csr.index[end])]
+
+    @measure_time(phase=PHASE_RECONSTRUCT)
+    def reconstruct(self, start: int, end: int) -> Path:
+        """
+        Returns the shortest path from the cached tree of the start node as a `Path`.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The nodes, edge keys and cumulative costs, or an empty path if no path was found.
+        """
+        csr = self.csr
+        if self._tree is None or self._tree.source != csr.index[start]:
+            return Path.empty()
+        return Path.from_csr(csr, self._tree.path(csr.index[end]))
+
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished query; the tree counted its own search work.
+
+        Args:
+            counters (SearchCounters): The counters of the query.
+        """
+        counters.stale_pops = counters.heap_pops - counters.nodes_settled
@@ -0,0 +1,162 @@
+from core import CSRGraphAlgorithm, SearchState
+from core.contraction_hierarchy import ContractionHierarchy
+from core.decorators import log_execution, measure_time, PHASE_SEARCH, PHASE_RECONSTRUCT
+from core.path import Path
+import numpy as np
+
+
+class ContractionHierarchiesAlgorithm(CSRGraphAlgorithm):
+    """
+    Answers point-to-point queries with a precomputed contraction hierarchy.
+
+    The hierarchy is built once per graph (on `prepare` or the first query) and
+    reused by every later query, which then only runs two small upward searches.
+    The found path is unpacked to original edges, so `path` returns the same kind
+    of node path as the other algorithms.
+
+    Attributes:
+        backward_state (SearchState): Search state of the upward search from the end node.
+    """
+
+    def __init__(self, graph, visualizer, styler, hierarchy: ContractionHierarchy = None):
+        """
+        Constructs the ContractionHierarchiesAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            hierarchy (ContractionHierarchy, optional): A prebuilt hierarchy of the graph, for
+                example one loaded with `ContractionHierarchy.load`. Defaults to a hierarchy
+                built (once) from the graph.
+        """
+        super().__init__(graph, visualizer, styler)
+        self._hierarchy = hierarchy
+        self._backward_state = None
+        self._path = []
+
+    @property
+    def hierarchy(self) -> ContractionHierarchy:
+        """ContractionHierarchy: The hierarchy used for queries, built on first use."""
+        if self._hierarchy is None or self._hierarchy.node_count != self.csr.node_count:
+            self._hierarchy = ContractionHierarchy.for_csr(self.csr)
+        return self._hierarchy
+
+    @property
+    def backward_state(self) -> SearchState:
+        """SearchState: The backward search state, rebuilt only when the node count changes."""
+        if self._backward_state is None or self._backward_state.size != self.csr.node_count:
+            self._backward_state = SearchState(self.csr.node_count)
+        return self._backward_state
+
+    def prepare(self):
+        """Builds the contraction hierarchy ahead of the first query."""
+        return self.hierarchy
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Executes a contraction hierarchy query to compute the shortest path in the graph.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+            plot (bool, optional): Whether to visualize the unpacked path.
+                Defaults to False.
+
+        Returns:
+            None
+        """
+        csr = self.csr
+        hierarchy = self.hierarchy
+        self.initialize_graph(plot)
+        self.backward_state.reset()
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        _, self._path = hierarchy.query(
+            csr.index[start], csr.index[end], self.state, self.backward_state, self._counters
+        )
+
+        if plot:
+            for step, (u, v) in enumerate(zip(self._path, self._path[1:])):
+                self.style_csr_edge(csr, csr.edge_index(u, v), color="#2432B0", alpha=1, linewidth=3)
+                if step % 10 == 0:
+                    await self.visualizer.capture_frame()
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Answers a contraction hierarchy query synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Path: The shortest path unpacked to original edges, or an empty path if `end` is unreachable.
+        """
+        csr = self.csr
+        hierarchy = self.hierarchy
+        self.initialize_graph(False)
+        self.backward_state.reset()
+        _, self._path = hierarchy.query(
+            csr.index[start], csr.index[end], self.state, self.backward_state, self._counters
+        )
+        return self.finish(start, end)
+
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished query from both search states.
+
+        The forward search relaxes upward edges and the backward search downward edges
+        of the hierarchy, so those are the edges counted.
+
+        Args:
+            counters (SearchCounters): The counters of the query.
+        """
+        hierarchy = self.hierarchy
+        settled_count = relaxed = 0
+        for state, offsets in ((self.state, hierarchy.up_offsets), (self.backward_state, hierarchy.down_offsets)):
+            settled = np.flatnonzero(np.asarray(state.settled) == state.generation)
+            settled_count += len(settled)
+            relaxed += int((offsets[settled + 1] - offsets[settled]).sum())
+        counters.nodes_settled = settled_count
+        counters.edges_relaxed = relaxed
+        counters.stale_pops = max(counters.heap_pops - counters.nodes_settled, 0)
+
+    def path(self, start: int, end: int) -> list:
+        """
+        Returns the path found by the last search, unpacked to original edges.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if no path was found.
+        """
+        csr = self.csr
+        if not self._path or self._path[0] != csr.index[start] or self._path[-1] != csr.index[end]:
+            return []
+        return [csr.node_ids[index].item() for index in self._path]
+
+    @measure_time(phase=PHASE_RECONSTRUCT)
+    def reconstruct(self, start: int, end: int) -> Path:
+        """
+        Returns the path found by the last search as a `Path`.
+
+        Shortcuts are unpacked to original edges; between two nodes the cheapest
+        parallel edge is the one the hierarchy was built from.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The nodes, edge keys and cumulative costs, or an empty path if no path was found.
+        """
+        csr = self.csr
+        if not self._path or self._path[0] != csr.index[start] or self._path[-1] != csr.index[end]:
+            return Path.empty()
+        return Path.from_csr(csr, self._path)
@@ -0,0 +1,167 @@
+from core import CSRGraphAlgorithm
+from core.path import Path
+from core.counters import heap_operations
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
+from core.heuristics import bind_heuristic, validate_heuristic, HEURISTIC_TRAVEL_TIME
+from typing import AsyncGenerator, Callable
+
+
+class CSRAStarAlgorithm(CSRGraphAlgorithm):
+    """
+    Implements the A* algorithm on the compact CSR representation of the graph.
+
+    It supports the same heuristic modes as `AStarAlgorithm`, computed from coordinate
+    lists indexed by dense node index rather than from node attribute dictionaries.
+    `execute` and `run` share the relaxation built by `_relaxation`.
+
+    Attributes:
+        heuristic (str): The heuristic mode, one of `core.heuristics.HEURISTIC_MODES`.
+        landmarks (LandmarkHeuristic): Landmark tables used by the "alt" mode, or None to
+            build them with the default settings on first use.
+    """
+
+    def __init__(self, graph, visualizer, styler, heuristic: str = HEURISTIC_TRAVEL_TIME, landmarks=None):
+        """
+        Constructs the CSRAStarAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            heuristic (str, optional): The heuristic mode. Defaults to "travel_time".
+            landmarks (LandmarkHeuristic, optional): Landmark tables for the "alt" mode. Defaults to None.
+
+        Raises:
+            ValueError: If the heuristic mode is not supported.
+        """
+        super().__init__(graph, visualizer, styler)
+        self.heuristic = validate_heuristic(heuristic)
+        self.landmarks = landmarks
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Executes the A* algorithm to find the shortest path from a start node to an end node.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+            plot (bool, optional): Flag indicating whether to plot the algorithm's progress. Defaults to False.
+
+        Returns:
+            None
+        """
+        csr = self.csr
+        self.initialize_graph(plot)
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        priority_queue = [(0, source)]  #: (f_score, node index)
+        estimate = bind_heuristic(self.heuristic, csr, target, source, self.landmarks)
+        async for current_node in self._node_iterator(csr, priority_queue, estimate, target, plot):
+            if current_node == target:
+                break
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs the A* algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        csr = self.csr
+        self.initialize_graph(False)
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        priority_queue = [(0, source)]
+        estimate = bind_heuristic(self.heuristic, csr, target, source, self.landmarks)
+        settle = self._relaxation(csr, priority_queue, estimate, False)
+        _, heappop = heap_operations(self._counters)
+        while priority_queue:
+            _, current_node = heappop(priority_queue)
+            if settle(current_node) and current_node == target:
+                break
+        return self.finish(start, end)
+
+    async def _node_iterator(
+            self, csr, priority_queue: list, estimate, target: int, plot: bool
+    ) -> AsyncGenerator[int, None]:
+        """
+        Asynchronous generator settling nodes in order of their f-score.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            priority_queue (list): A heap of `(f_score, node index)` tuples.
+            estimate (Callable[[int], float]): The heuristic bound to the target node.
+            target (int): Dense index of the target node.
+            plot (bool): Flag indicating whether to capture frames for visualization.
+
+        Yields:
+            int: The dense index of the node that has just been settled.
+        """
+        settle = self._relaxation(csr, priority_queue, estimate, plot)
+        _, heappop = heap_operations(self._counters)
+        time_slice = self.time_slice
+        step = 0
+        while priority_queue:
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            _, current_node = heappop(priority_queue)
+            if not settle(current_node):
+                continue
+
+            if plot and step % 10 == 0:
+                await self.visualizer.capture_frame()
+            step += 1
+
+            yield current_node
+
+    def _relaxation(self, csr, priority_queue: list, estimate, plot: bool) -> Callable[[int], bool]:
+        """
+        Builds the function settling a node and relaxing its out-edges, shared by `execute` and `run`.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            priority_queue (list): A heap of `(f_score, node index)` tuples.
+            estimate (Callable[[int], float]): The heuristic bound to the target node.
+            plot (bool): Whether to style the relaxed edges for visualization.
+
+        Returns:
+            Callable[[int], bool]: Settles a node, or returns False if it was already settled.
+        """
+        offsets, targets, weights = csr.as_lists()
+        state = self.state
+        stamps, distances, predecessors, settled = state.stamps, state.distances, state.predecessors, state.settled
+        incoming = state.edges
+        generation = state.generation
+        heappush, _ = heap_operations(self._counters, priority_queue)
+
+        def settle(current_node: int) -> bool:
+            if settled[current_node] == generation:
+                return False
+            settled[current_node] = generation
+            current_distance = distances[current_node]
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                g_score = current_distance + weights[edge]
+                if stamps[neighbor] != generation or g_score < distances[neighbor]:
+                    stamps[neighbor] = generation
+                    distances[neighbor] = g_score
+                    predecessors[neighbor] = current_node
+                    incoming[neighbor] = edge
+                    heappush(priority_queue, (g_score + estimate(neighbor), neighbor))
+                if plot:
+                    self.style_csr_edge(csr, edge, color="#2432B0", alpha=1, linewidth=3)
+            return True
+
+        return settle
@@ -0,0 +1,249 @@
+from core import CSRGraphAlgorithm
+from core.path import Path
+from core.shortest_paths import bfs_frontiers
+from core.counters import make_deque
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
+from typing import AsyncGenerator, Callable
+from collections import deque
+import numpy as np
+
+
+class CSRBFSAlgorithm(CSRGraphAlgorithm):
+    """
+    Breadth-First Search (BFS) on the compact CSR representation of the graph.
+
+    Nodes are marked as discovered when they are enqueued, so every node enters
+    the `deque` at most once, and the search stops as soon as the end node is
+    discovered. The result is the path with the fewest edges.
+
+    In level-synchronous mode whole frontiers are expanded at once with vectorized
+    NumPy operations over the CSR arrays (see `bfs_frontiers`), which is faster on
+    large graphs where frontiers hold thousands of nodes.
+
+    `run` performs the same traversal as `execute` in a plain loop, without visualization.
+
+    Attributes:
+        level_synchronous (bool): Whether frontiers are expanded a level at a time.
+    """
+
+    def __init__(self, graph, visualizer, styler, level_synchronous: bool = False):
+        """
+        Constructs the CSRBFSAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            level_synchronous (bool, optional): Whether to expand whole frontiers with vectorized
+                operations instead of one node at a time. Defaults to False.
+        """
+        super().__init__(graph, visualizer, styler)
+        self.level_synchronous = level_synchronous
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Executes the BFS algorithm to traverse a graph from a start node to an end node.
+
+        Args:
+            start (int): The starting node for the BFS traversal.
+            end (int): The target node to reach during the traversal.
+            plot (bool, optional): Whether to visualize the traversal process. Defaults to False.
+
+        Returns:
+            None: This method performs traversal and does not return a value.
+        """
+        csr = self.csr
+        self.initialize_graph(plot)
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        if self.level_synchronous:
+            async for _ in self._frontier_iterator(csr, source, target, plot):
+                pass
+            return
+
+        async for _ in self._node_iterator(csr, source, target, plot):
+            pass
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs the BFS algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the BFS traversal.
+            end (int): The target node to reach during the traversal.
+
+        Returns:
+            Path: The path with the fewest edges, or an empty path if `end` is unreachable.
+        """
+        csr = self.csr
+        self.initialize_graph(False)
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        if self.level_synchronous:
+            for frontier in bfs_frontiers(csr, source, target):
+                self._record_level(*frontier)
+        elif source != target:
+            queue = make_deque([source], self._counters)
+            expand = self._expansion(csr, queue, target, False)
+            while queue and not expand(queue.popleft()):
+                pass
+        return self.finish(start, end)
+
+    async def _node_iterator(
+            self, csr, source: int, target: int, plot: bool
+    ) -> AsyncGenerator[int, None]:
+        """
+        Asynchronous generator expanding one node at a time.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            source (int): Dense index of the start node.
+            target (int): Dense index of the end node; discovering it ends the search.
+            plot (bool): Whether to visualize each step of the traversal.
+
+        Yields:
+            int: The dense index of the node that has just been expanded.
+        """
+        if source == target:
+            return
+        queue = make_deque([source], self._counters)
+        expand = self._expansion(csr, queue, target, plot)
+        time_slice = self.time_slice
+        step = 0
+        while queue:
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            current_node = queue.popleft()
+            found = expand(current_node)
+
+            if plot and step % 10 == 0:
+                await self.visualizer.capture_frame()
+            step += 1
+
+            yield current_node
+            if found:
+                return
+
+    def _expansion(self, csr, queue: deque, target: int, plot: bool) -> Callable[[int], bool]:
+        """
+        Builds the function expanding a node, shared by `execute` and `run`.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            queue (deque): The queue to which newly discovered nodes are appended.
+            target (int): Dense index of the end node.
+            plot (bool): Whether to style the traversed edges for visualization.
+
+        Returns:
+            Callable[[int], bool]: Discovers the undiscovered neighbors of a node and
+                returns True once the end node has been discovered. When the search collects
+                counters, it also marks the node as settled so the counters can find it.
+        """
+        offsets, targets, _ = csr.as_lists()
+        state = self.state
+        stamps, distances, predecessors, incoming = state.stamps, state.distances, state.predecessors, state.edges
+        generation = state.generation
+        append = queue.append
+
+        def expand(current_node: int) -> bool:
+            level = distances[current_node] + 1
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                if plot:
+                    self.style_csr_edge(csr, edge, color="#2432B0", alpha=1, linewidth=3)
+                if stamps[neighbor] != generation:
+                    stamps[neighbor] = generation
+                    distances[neighbor] = level
+                    predecessors[neighbor] = current_node
+                    incoming[neighbor] = edge
+                    append(neighbor)
+                    if neighbor == target:
+                        return True
+            return False
+
+        if self._counters is None:
+            return expand
+        settled = state.settled
+
+        def counted_expand(current_node: int) -> bool:
+            settled[current_node] = generation
+            return expand(current_node)
+
+        return counted_expand
+
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished search.
+
+        In level-synchronous mode the queue operations are derived from the recorded
+        levels: every reached node was pushed, the largest level is the largest frontier,
+        and the levels above the deepest one were expanded (and count as settled).
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        if not self.level_synchronous:
+            super()._count_search(counters)
+            return
+        state, offsets = self.state, self.csr.offsets
+        reached = np.flatnonzero(np.asarray(state.stamps) == state.generation)
+        levels = np.asarray(state.distances, dtype=np.float64)[reached].astype(np.int64)
+        expanded = reached[levels < levels.max()] if len(reached) > 1 else reached
+        counters.heap_pushes = len(reached)
+        counters.heap_pops = counters.nodes_settled = len(expanded)
+        counters.max_frontier = int(np.bincount(levels).max())
+        counters.edges_relaxed = int((offsets[expanded + 1] - offsets[expanded]).sum())
+        counters.stale_pops = 0
+
+    async def _frontier_iterator(
+            self, csr, source: int, target: int, plot: bool
+    ) -> AsyncGenerator[int, None]:
+        """
+        Asynchronous generator recording one BFS level at a time in the search state.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            source (int): Dense index of the start node.
+            target (int): Dense index of the end node; the level discovering it is the last.
+            plot (bool): Whether to visualize each level of the traversal.
+
+        Yields:
+            int: The number of nodes discovered in the level.
+        """
+        time_slice = self.time_slice
+        for nodes, parents, edges in bfs_frontiers(csr, source, target):
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            self._record_level(nodes, parents, edges)
+
+            if plot:
+                for edge in edges.tolist():
+                    self.style_csr_edge(csr, edge, color="#2432B0", alpha=1, linewidth=3)
+                await self.visualizer.capture_frame()
+
+            yield len(nodes)
+
+    def _record_level(self, nodes, parents, edges):
+        """
+        Records the nodes discovered in one BFS level in the search state.
+
+        Args:
+            nodes (numpy.ndarray): Dense indices of the discovered nodes.
+            parents (numpy.ndarray): The node each one was discovered from.
+            edges (numpy.ndarray): The CSR position of the edge each one was discovered through.
+        """
+        state = self.state
+        stamps, distances, predecessors, incoming = state.stamps, state.distances, state.predecessors, state.edges
+        generation = state.generation
+        for node, parent, edge in zip(nodes.tolist(), parents.tolist(), edges.tolist()):
+            stamps[node] = generation
+            distances[node] = distances[parent] + 1
+            predecessors[node] = parent
+            incoming[node] = edge
@@ -0,0 +1,147 @@
+from core import CSRGraphAlgorithm
+from core.path import Path
+from core.counters import heap_operations
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
+from typing import AsyncGenerator, Callable
+
+
+class CSRDijkstraAlgorithm(CSRGraphAlgorithm):
+    """
+    Implements Dijkstra's shortest path algorithm on the compact CSR representation
+    of the graph.
+
+    The search visits nodes in the same order as `DijkstraAlgorithm`, but each
+    relaxation is a handful of list indexing operations on dense node indices
+    instead of node and edge attribute dictionary lookups. Edges are only styled
+    when the search is visualized.
+
+    `execute` and `run` share the relaxation built by `_relaxation`; `run` drives it
+    from a plain loop for callers that do not visualize the search.
+    """
+
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def execute(self, start: int, end: int, plot: bool = False):
+        """
+        Executes Dijkstra's algorithm to compute the shortest path in the graph.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+            plot (bool, optional): Whether to visualize the graph traversal.
+                Defaults to False.
+
+        Returns:
+            None
+        """
+        csr = self.csr
+        self.initialize_graph(plot)
+        self.styler.style_node(self.graph, start, size=50)
+        self.styler.style_node(self.graph, end, size=50)
+
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        priority_queue = [(0, source)]  # : (distance, node index)
+        async for current_node in self._node_iterator(csr, priority_queue, plot):
+            if current_node == target:
+                break
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs Dijkstra's algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        csr = self.csr
+        self.initialize_graph(False)
+        source, target = csr.index[start], csr.index[end]
+        self.state.update(source, 0)
+
+        priority_queue = [(0, source)]
+        settle = self._relaxation(csr, priority_queue, False)
+        _, heappop = heap_operations(self._counters)
+        while priority_queue:
+            current_distance, current_node = heappop(priority_queue)
+            if settle(current_node, current_distance) and current_node == target:
+                break
+        return self.finish(start, end)
+
+    async def _node_iterator(
+            self, csr, priority_queue: list, plot: bool
+    ) -> AsyncGenerator[int, None]:
+        """
+        Asynchronous generator settling nodes in order of their distance.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            priority_queue (list): A heap of `(distance, node index)` tuples.
+            plot (bool): Whether to capture frames during traversal for visualization.
+
+        Yields:
+            int: The dense index of the node that has just been settled.
+        """
+        settle = self._relaxation(csr, priority_queue, plot)
+        _, heappop = heap_operations(self._counters)
+        time_slice = self.time_slice
+        step = 0
+        while priority_queue:
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            current_distance, current_node = heappop(priority_queue)
+            if not settle(current_node, current_distance):
+                continue
+
+            if plot and step % 10 == 0:
+                await self.visualizer.capture_frame()
+            step += 1
+
+            yield current_node
+
+    def _relaxation(self, csr, priority_queue: list, plot: bool) -> Callable[[int, float], bool]:
+        """
+        Builds the function settling a node and relaxing its out-edges, shared by `execute` and `run`.
+
+        The CSR lists and search state containers are bound once per search, so the
+        returned function only does the per-node work.
+
+        Args:
+            csr (CSRGraph): The graph representation being searched.
+            priority_queue (list): A heap of `(distance, node index)` tuples.
+            plot (bool): Whether to style the relaxed edges for visualization.
+
+        Returns:
+            Callable[[int, float], bool]: Settles a node at a distance, or returns False
+                if it was already settled.
+        """
+        offsets, targets, weights = csr.as_lists()
+        state = self.state
+        stamps, distances, predecessors, settled = state.stamps, state.distances, state.predecessors, state.settled
+        incoming = state.edges
+        generation = state.generation
+        heappush, _ = heap_operations(self._counters, priority_queue)
+
+        def settle(current_node: int, current_distance: float) -> bool:
+            if settled[current_node] == generation:
+                return False
+            settled[current_node] = generation
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                new_distance = current_distance + weights[edge]
+                if stamps[neighbor] != generation or new_distance < distances[neighbor]:
+                    stamps[neighbor] = generation
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_node
+                    incoming[neighbor] = edge
+                    heappush(priority_queue, (new_distance, neighbor))
+                if plot:
+                    self.style_csr_edge(csr, edge, color="#2432B0", alpha=1, linewidth=3)
+            return True
+
+        return settle
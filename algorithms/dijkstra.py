@@ -1,7 +1,8 @@
 from core import GraphAlgorithm
-from core.decorators import log_execution, measure_time
+from core.path import Path
+from core.decorators import log_execution, measure_time, PHASE_SEARCH
+from core.priority_queues import PriorityQueue, make_priority_queue, validate_priority_queue, QUEUE_HEAPQ
 from typing import Tuple, AsyncGenerator
-import heapq
 
 
 class DijkstraAlgorithm(GraphAlgorithm):
@@ -13,10 +14,42 @@ class DijkstraAlgorithm(GraphAlgorithm):
     end node in a weighted graph, leveraging priority queues for optimal
     performance. The implementation supports real-time visualization and
     node/edge styling.
+
+    The priority queue implementation is selectable per instance (see
+    `core.priority_queues`); its operation counters for the last search are kept
+    in `queue`.
+
+    `execute` runs the search as an asynchronous generator so it can be visualized
+    and time-sliced; `run` runs the same relaxation in a plain loop for callers that
+    only need the path.
+
+    Attributes:
+        priority_queue (str): The priority queue kind, one of `core.priority_queues.PRIORITY_QUEUES`.
+        queue_options (dict): Keyword arguments for the priority queue, such as `scale` for "radix".
+        queue (PriorityQueue): The priority queue of the last search, or None before the first one.
     """
 
+    def __init__(self, graph, visualizer, styler, priority_queue: str = QUEUE_HEAPQ, queue_options: dict = None):
+        """
+        Constructs the DijkstraAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+            priority_queue (str, optional): The priority queue kind. Defaults to "heapq".
+            queue_options (dict, optional): Keyword arguments for the priority queue. Defaults to None.
+
+        Raises:
+            ValueError: If the priority queue kind is not supported.
+        """
+        super().__init__(graph, visualizer, styler)
+        self.priority_queue = validate_priority_queue(priority_queue)
+        self.queue_options = queue_options or {}
+        self.queue = None
+
     @log_execution
-    @measure_time
+    @measure_time(phase=PHASE_SEARCH)
     async def execute(self, start: int, end: int, plot: bool = False):
         """
         Executes Dijkstra's algorithm to compute the shortest path in the graph.
@@ -30,40 +63,77 @@ class DijkstraAlgorithm(GraphAlgorithm):
         Returns:
             None
         """
-        self.initialize_graph()
+        self.initialize_graph(plot)
         self.styler.style_node(self.graph, start, size=50)
         self.styler.style_node(self.graph, end, size=50)
 
-        priority_queue = [(0, start)]  # : (distance, node)
-        self.graph.nodes[start]["distance"] = 0
-
+        priority_queue = self._start_search(start)
         async for current_node in self._node_iterator(priority_queue, plot):
             if current_node == end:
                 return
 
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs Dijkstra's algorithm synchronously, without visualization.
+
+        Args:
+            start (int): The starting node for the algorithm.
+            end (int): The target node for the algorithm.
+
+        Returns:
+            Path: The shortest path, or an empty path if `end` is unreachable.
+        """
+        self.initialize_graph(False)
+        priority_queue = self._start_search(start)
+        state = self.state
+        while priority_queue:
+            current_distance, current_node = priority_queue.pop()
+            if not state.is_settled(current_node):
+                self._expand(current_node, current_distance, priority_queue)
+            if current_node == end:
+                break
+        return self.finish(start, end)
+
+    def _start_search(self, start: int) -> PriorityQueue:
+        """
+        Records the start node and creates the priority queue of a new search.
+
+        Args:
+            start (int): The starting node for the algorithm.
+
+        Returns:
+            PriorityQueue: The queue holding the start node.
+        """
+        priority_queue = make_priority_queue(self.priority_queue, **self.queue_options)
+        priority_queue.push(start, 0)
+        self.queue = priority_queue
+        self.state.update(start, 0)
+        return priority_queue
+
     async def _node_iterator(
-            self, priority_queue: list, plot: bool
+            self, priority_queue: PriorityQueue, plot: bool
     ) -> AsyncGenerator[int, None]:
         """
         Asynchronous generator for traversing nodes in the priority queue.
 
         Args:
-            priority_queue (list): A list of tuples representing the nodes
-                to process, with their associated distances.
+            priority_queue (PriorityQueue): The queue of nodes to process, keyed by
+                their tentative distances.
             plot (bool): Whether to capture frames during traversal for visualization.
 
         Yields:
             int: The current node being processed.
         """
+        state = self.state
+        time_slice = self.time_slice
         step = 0
         while priority_queue:
-            current_distance, current_node = heapq.heappop(priority_queue)
-
-            if not self.graph.nodes[current_node]["visited"]:
-                self.graph.nodes[current_node]["visited"] = True
+            if time_slice.tick() and not await self.yield_slice():
+                return
+            current_distance, current_node = priority_queue.pop()
 
-                for edge in self.graph.out_edges(current_node, keys=True):
-                    self._process_edge(edge, current_distance, priority_queue)
+            if not state.is_settled(current_node):
+                self._expand(current_node, current_distance, priority_queue, plot)
 
                 if plot and step % 10 == 0:
                     await self.visualizer.capture_frame()
@@ -71,8 +141,36 @@ class DijkstraAlgorithm(GraphAlgorithm):
 
             yield current_node
 
+    def _expand(self, node: int, distance: float, priority_queue: PriorityQueue, plot: bool = False):
+        """
+        Settles a node and relaxes its out-edges.
+
+        Args:
+            node (int): The node taken from the priority queue.
+            distance (float): The distance of the node from the start node.
+            priority_queue (PriorityQueue): The priority queue used for managing nodes to visit next.
+            plot (bool, optional): Whether to style the edges for visualization. Defaults to False.
+        """
+        self.state.settle(node)
+        for edge in self.graph.out_edges(node, keys=True):
+            self._process_edge(edge, distance, priority_queue, plot)
+
+    def _count_search(self, counters):
+        """
+        Completes the counters of a finished search; queue operations come from the counters of `queue`.
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        super()._count_search(counters)
+        queue = self.queue
+        counters.heap_pushes = queue.pushes
+        counters.heap_pops = queue.pops + queue.stale_pops
+        counters.stale_pops = queue.stale_pops
+        counters.max_frontier = queue.peak_size
+
     def _process_edge(
-            self, edge: Tuple[int, int, int], current_distance: float, priority_queue: list
+            self, edge: Tuple[int, int, int], current_distance: float, priority_queue: PriorityQueue, plot: bool = False
     ):
         """
         Processes an edge during the traversal of the graph in Dijkstra's algorithm.
@@ -84,8 +182,10 @@ class DijkstraAlgorithm(GraphAlgorithm):
                 containing the source node, target node, and edge key.
             current_distance (float): The distance from the start node to the
                 current node.
-            priority_queue (list): The priority queue used for managing nodes
+            priority_queue (PriorityQueue): The priority queue used for managing nodes
                 to visit next.
+            plot (bool, optional): Whether to style the edge for visualization.
+                Defaults to False.
 
         Returns:
             None
@@ -94,9 +194,9 @@ class DijkstraAlgorithm(GraphAlgorithm):
         weight = self.graph.edges[edge]["weight"]
         new_distance = current_distance + weight
 
-        if new_distance < self.graph.nodes[neighbor]["distance"]:
-            self.graph.nodes[neighbor]["distance"] = new_distance
-            self.graph.nodes[neighbor]["previous"] = edge[0]
-            heapq.heappush(priority_queue, (new_distance, neighbor))
+        if new_distance < self.state.distance(neighbor):
+            self.state.update(neighbor, new_distance, edge[0], edge[2])
+            priority_queue.push(neighbor, new_distance)
 
-        self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
+        if plot:
+            self.styler.style_edge(self.graph, edge, color="#2432B0", alpha=1, linewidth=3)
@@ -0,0 +1,63 @@
+from core import CSRGraph
+from core.shortest_paths import single_source_dijkstra
+import numpy as np
+
+
+def distance_matrix(graph, sources, targets, return_predecessors: bool = False, weight: str = "weight"):
+    """
+    Computes shortest path costs between every source and every target node.
+
+    Instead of one point-to-point search per pair, one single-source search is run
+    per distinct source on the compact `CSRGraph` of the graph, and each search stops
+    as soon as all targets are settled. When predecessors are not needed and there
+    are fewer distinct targets than sources, the searches run backwards from the
+    targets over the reversed graph instead, so the number of searches is always
+    the smaller of the two.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        sources (Sequence): Node identifiers of the rows of the matrix.
+        targets (Sequence): Node identifiers of the columns of the matrix.
+        return_predecessors (bool, optional): Whether to also return the shortest path
+            trees of the searches. Defaults to False.
+        weight (str, optional): The edge attribute holding the weight. Defaults to "weight".
+
+    Returns:
+        numpy.ndarray | tuple: The `len(sources) x len(targets)` matrix of costs, with
+            infinity for unreachable pairs. With `return_predecessors`, a tuple
+            `(matrix, predecessors)`, where row `i` of the `len(sources) x n` array
+            `predecessors` holds the predecessor of every dense node index (see
+            `CSRGraph.node_ids`) in the tree of `sources[i]`, or -1. Nodes outside the
+            settled part of a tree have no predecessor; paths can be read with
+            `core.shortest_paths.predecessor_path`.
+
+    Raises:
+        KeyError: If a source or target node is not in the graph.
+    """
+    csr = CSRGraph.for_graph(graph, weight)
+    source_indices = np.array([csr.index[node] for node in sources], dtype=np.int64)
+    target_indices = np.array([csr.index[node] for node in targets], dtype=np.int64)
+    unique_sources = np.unique(source_indices)
+    unique_targets = np.unique(target_indices)
+    matrix = np.full((len(source_indices), len(target_indices)), np.inf)
+
+    if not return_predecessors and len(unique_targets) < len(unique_sources):
+        reverse = csr.reverse()
+        remaining = unique_sources.tolist()
+        for target in unique_targets.tolist():
+            distances = single_source_dijkstra(reverse, target, remaining)[0]
+            matrix[:, target_indices == target] = distances[source_indices][:, np.newaxis]
+        return matrix
+
+    predecessors = np.full((len(source_indices), csr.node_count), -1, dtype=np.int64) if return_predecessors else None
+    remaining = unique_targets.tolist()
+    for source in unique_sources.tolist():
+        distances, tree = single_source_dijkstra(csr, source, remaining)
+        rows = source_indices == source
+        matrix[rows] = distances[target_indices]
+        if return_predecessors:
+            predecessors[rows] = tree
+
+    if return_predecessors:
+        return matrix, predecessors
+    return matrix
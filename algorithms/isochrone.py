@@ -0,0 +1,158 @@
+from core import CSRGraph
+from core.shortest_paths import single_source_dijkstra
+import numpy as np
+
+#: Seconds of travel per unit of the weights produced by `initialize_graph`. Weights are
+#: `length / maxspeed` in metres per km/h, and one metre at one km/h takes 3.6 seconds.
+SECONDS_PER_WEIGHT = 3.6
+
+
+class Isochrone:
+    """
+    The part of a graph reachable from a source node within a cost budget.
+
+    Attributes:
+        source (Any): The source node identifier.
+        budget (float): The cost budget, in the unit of the edge weights.
+        costs (dict): Shortest path cost of every reached node, keyed by node identifier.
+        boundary_edges (list): Edges leaving the reached area as `(u, v, key, fraction)`
+            tuples, where `u` is reached, `v` is not, and `fraction` is the share of the
+            edge that can be travelled within the budget.
+    """
+
+    def __init__(self, source, budget: float, costs: dict, boundary_edges: list):
+        """
+        Initializes the Isochrone.
+
+        Args:
+            source (Any): The source node identifier.
+            budget (float): The cost budget.
+            costs (dict): Shortest path cost of every reached node.
+            boundary_edges (list): `(u, v, key, fraction)` tuples of the edges leaving the reached area.
+        """
+        self.source = source
+        self.budget = budget
+        self.costs = costs
+        self.boundary_edges = boundary_edges
+
+    @property
+    def nodes(self) -> set:
+        """set: The reached node identifiers."""
+        return set(self.costs)
+
+    @property
+    def minutes(self) -> float:
+        """float: The budget as travel time in minutes, for weights produced by `initialize_graph`."""
+        return self.budget * SECONDS_PER_WEIGHT / 60
+
+
+def minutes_to_weight(minutes: float) -> float:
+    """
+    Converts a travel time to the unit of the weights produced by `initialize_graph`.
+
+    Args:
+        minutes (float): The travel time in minutes.
+
+    Returns:
+        float: The equivalent budget in weight units (about 83.3 for 5 minutes).
+    """
+    return minutes * 60 / SECONDS_PER_WEIGHT
+
+
+def isochrones(graph, source, budgets, weight: str = "weight") -> list:
+    """
+    Computes the areas reachable from a source node within several cost budgets.
+
+    Budgets are in the unit of the edge weights, not in minutes; use
+    `isochrones_in_minutes` for travel times on graphs from `initialize_graph`.
+
+    A single Dijkstra search runs up to the largest budget and stops there, so adding
+    smaller budgets costs no extra searching. Each budget is then a threshold on the
+    settled costs, and its boundary edges are selected with vectorized comparisons
+    over the edge arrays of the compact `CSRGraph`.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        source (Any): The source node identifier.
+        budgets (Sequence[float]): The cost budgets, in the unit of the edge weights.
+        weight (str, optional): The edge attribute holding the weight. Defaults to "weight".
+
+    Returns:
+        list: One `Isochrone` per budget, in the order of `budgets`.
+
+    Raises:
+        KeyError: If the source node is not in the graph.
+        ValueError: If no budget is given or a budget is negative.
+    """
+    budgets = [float(budget) for budget in budgets]
+    if not budgets or min(budgets) < 0:
+        raise ValueError("At least one non-negative budget is required.")
+
+    csr = CSRGraph.for_graph(graph, weight)
+    distances = single_source_dijkstra(csr, csr.index[source], limit=max(budgets))[0]
+
+    edge_sources = np.repeat(np.arange(csr.node_count), np.diff(csr.offsets))
+    source_costs = distances[edge_sources]
+    target_costs = distances[csr.targets]
+    order = np.argsort(distances, kind="stable")
+    sorted_costs = distances[order]
+
+    result = []
+    for budget in budgets:
+        count = int(np.searchsorted(sorted_costs, budget, side="right"))
+        reached = order[:count]
+        costs = dict(zip(csr.node_ids[reached].tolist(), distances[reached].tolist()))
+
+        leaving = np.flatnonzero((source_costs <= budget) & (target_costs > budget))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fractions = np.clip((budget - source_costs[leaving]) / csr.weights[leaving], 0.0, 1.0)
+        boundary_edges = list(zip(
+            csr.node_ids[edge_sources[leaving]].tolist(),
+            csr.node_ids[csr.targets[leaving]].tolist(),
+            csr.keys[leaving].tolist(),
+            np.nan_to_num(fractions, nan=1.0).tolist(),
+        ))
+        result.append(Isochrone(source, budget, costs, boundary_edges))
+    return result
+
+
+def reachable_within(graph, source, budget: float, weight: str = "weight") -> Isochrone:
+    """
+    Computes the area reachable from a source node within one cost budget.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        source (Any): The source node identifier.
+        budget (float): The cost budget, in the unit of the edge weights (see `minutes_to_weight`).
+        weight (str, optional): The edge attribute holding the weight. Defaults to "weight".
+
+    Returns:
+        Isochrone: The reached nodes, their costs and the boundary edges.
+
+    Raises:
+        KeyError: If the source node is not in the graph.
+        ValueError: If the budget is negative.
+    """
+    return isochrones(graph, source, [budget], weight)[0]
+
+
+def isochrones_in_minutes(graph, source, minutes) -> list:
+    """
+    Computes the areas reachable from a source node within several travel times.
+
+    The travel times are converted with `minutes_to_weight`, so the graph must carry
+    the travel time weights produced by `initialize_graph`.
+
+    Args:
+        graph (networkx.MultiDiGraph): The graph weighted by `initialize_graph`.
+        source (Any): The source node identifier.
+        minutes (Sequence[float]): The travel times in minutes, such as `[5, 10, 15]`.
+
+    Returns:
+        list: One `Isochrone` per travel time, in the order of `minutes`.
+
+    Raises:
+        KeyError: If the source node is not in the graph.
+        ValueError: If no travel time is given or one is negative.
+    """
+    return isochrones(graph, source, [minutes_to_weight(limit) for limit in minutes])
@@ -0,0 +1,117 @@
+"""
+Delta-Stepping Benchmark Module
+
+Compares one-to-all searches of `DijkstraAlgorithm`, the heap-based CSR Dijkstra and
+the delta-stepping engine on graphs of increasing size, from a city to a voivodeship.
+
+Run it as a module, for example:
+
+    python -m benchmarks.delta_stepping --place "Gliwice, Poland" \
+        --place "Silesian Voivodeship, Poland" --delta 0 --delta 50 --workers 0 --workers 4
+
+Functions:
+    benchmark_delta_stepping: Times the engines on one graph and returns one row per run.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import numpy as np
+from algorithms import DijkstraAlgorithm
+from core import CSRGraph, GraphStyler
+from core.delta_stepping import DeltaSteppingEngine
+from core.shortest_paths import single_source_dijkstra
+
+
+def benchmark_delta_stepping(graph, sources: int = 3, deltas=(None,), workers=(0,), seed: int = 0) -> list:
+    """
+    Times full one-to-all searches of every engine from the same random source nodes.
+
+    `DijkstraAlgorithm` is asked for the farthest reachable node, which makes it settle
+    the whole reachable graph like the one-to-all engines. Every delta-stepping result
+    is checked against the CSR Dijkstra distances.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        sources (int, optional): The number of random source nodes. Defaults to 3.
+        deltas (Iterable[float], optional): The bucket widths to try; None selects the
+            engine default. Defaults to (None,).
+        workers (Iterable[int], optional): The worker counts to try. Defaults to (0,).
+        seed (int, optional): Seed for the source node selection. Defaults to 0.
+
+    Returns:
+        list: One dict per run with the engine, its settings, the graph size and the time in seconds.
+
+    Raises:
+        AssertionError: If delta-stepping disagrees with Dijkstra.
+    """
+    csr = CSRGraph.for_graph(graph)
+    rng = random.Random(seed)
+    chosen = [rng.randrange(csr.node_count) for _ in range(sources)]
+    size = {"nodes": csr.node_count, "edges": csr.edge_count}
+    rows = []
+
+    def record(engine, source, seconds, **settings):
+        rows.append({"engine": engine, **settings, **size, "source": csr.node_ids[source].item(), "seconds": seconds})
+
+    dijkstra = DijkstraAlgorithm(graph, None, GraphStyler())
+    reference = {}
+    for source in chosen:
+        start = time.perf_counter()
+        reference[source] = single_source_dijkstra(csr, source)[0]
+        record("csr_dijkstra", source, time.perf_counter() - start)
+
+        finite = np.isfinite(reference[source])
+        farthest = int(np.argmax(np.where(finite, reference[source], -1)))
+        start = time.perf_counter()
+        dijkstra.run(csr.node_ids[source].item(), csr.node_ids[farthest].item())
+        record("dijkstra", source, time.perf_counter() - start)
+
+    for delta in deltas:
+        for worker_count in workers:
+            with DeltaSteppingEngine(csr, delta, worker_count) as engine:
+                for source in chosen:
+                    start = time.perf_counter()
+                    distances, _ = engine.run(source)
+                    seconds = time.perf_counter() - start
+                    assert np.allclose(distances, reference[source], equal_nan=True)
+                    record("delta_stepping", source, seconds, delta=engine.delta, workers=worker_count,
+                           phases=engine.phases, parallel_phases=engine.parallel_phases)
+    return rows
+
+
+if __name__ == "__main__":
+    """
+    Benchmarks the engines on the given places and writes the rows as JSON.
+    """
+    from utils import initialize_graph
+
+    parser = argparse.ArgumentParser(description="Benchmark delta-stepping against Dijkstra.")
+    parser.add_argument("--place", action="append", help="Place name; may be repeated.")
+    parser.add_argument("--sources", type=int, default=3, help="Random source nodes per graph.")
+    parser.add_argument("--delta", type=float, action="append", help="Bucket width; 0 selects the default.")
+    parser.add_argument("--workers", type=int, action="append", help="Worker processes; may be repeated.")
+    parser.add_argument("--output", default="results/benchmarks/delta_stepping.json", help="Output JSON file.")
+    arguments = parser.parse_args()
+
+    results = []
+    for place in arguments.place or ["Gliwice, Poland", "Silesian Voivodeship, Poland"]:
+        print(f"Benchmarking {place}...")
+        results.extend(
+            {"place": place, **row}
+            for row in benchmark_delta_stepping(
+                initialize_graph(place),
+                arguments.sources,
+                [delta or None for delta in arguments.delta or [0]],
+                arguments.workers or [0, os.cpu_count() or 1],
+            )
+        )
+
+    os.makedirs(os.path.dirname(arguments.output), exist_ok=True)
+    with open(arguments.output, "w") as file:
+        json.dump(results, file, indent=2)
+    for row in results:
+        print(row)
+    print(f"Saved benchmark results: {arguments.output}")
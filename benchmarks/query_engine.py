@@ -0,0 +1,109 @@
+"""
+Query Engine Benchmark Module
+
+Measures the throughput of the process-pool query engine for increasing worker counts,
+against answering the same queries one at a time with `DijkstraAlgorithm`.
+
+Run it as a module, for example:
+
+    python -m benchmarks.query_engine --place "Gliwice, Poland" --queries 500 --workers 1 --workers 8
+
+Functions:
+    benchmark_query_engine: Times one batch of random queries per worker count and returns one row per run.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from algorithms import DijkstraAlgorithm
+from core import GraphStyler
+from core.query_engine import QUERY_DIJKSTRA, QueryEngine
+
+
+def benchmark_query_engine(
+        graph, queries: int = 200, workers=(0,), algorithm: str = QUERY_DIJKSTRA, batch_size: int = 16,
+        sequential: int = 20, seed: int = 0,
+) -> list:
+    """
+    Times a batch of random queries on engines with different worker counts.
+
+    The time of an engine includes dispatching the queries and collecting the results,
+    but not starting the pool, which is paid once per process.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        queries (int, optional): The number of random queries. Defaults to 200.
+        workers (Iterable[int], optional): The worker counts to try. Defaults to (0,).
+        algorithm (str, optional): The query algorithm. Defaults to "dijkstra".
+        batch_size (int, optional): The number of queries per dispatched batch. Defaults to 16.
+        sequential (int, optional): The number of queries answered one at a time with
+            `DijkstraAlgorithm` as the baseline. Defaults to 20.
+        seed (int, optional): Seed for the query selection. Defaults to 0.
+
+    Returns:
+        list: One dict per run with the engine, its settings, the graph size, the time
+            in seconds and the throughput in queries per second.
+    """
+    rng = random.Random(seed)
+    nodes = list(graph.nodes)
+    batch = [(algorithm, rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+    size = {"nodes": graph.number_of_nodes(), "edges": graph.number_of_edges()}
+    rows = []
+
+    dijkstra = DijkstraAlgorithm(graph, None, GraphStyler())
+    start = time.perf_counter()
+    for _, source, target in batch[:sequential]:
+        dijkstra.run(source, target)
+    seconds = time.perf_counter() - start
+    rows.append({"engine": "dijkstra", **size, "queries": sequential, "seconds": seconds,
+                 "queries_per_second": sequential / seconds if seconds else None})
+
+    for worker_count in workers:
+        with QueryEngine(graph, workers=worker_count, batch_size=batch_size) as engine:
+            start = time.perf_counter()
+            answered = sum(1 for _ in engine.run(batch))
+            seconds = time.perf_counter() - start
+        rows.append({"engine": "query_engine", "algorithm": algorithm, "workers": worker_count,
+                     "batch_size": batch_size, **size, "queries": answered, "seconds": seconds,
+                     "queries_per_second": answered / seconds if seconds else None})
+    return rows
+
+
+if __name__ == "__main__":
+    """
+    Benchmarks the query engine on the given places and writes the rows as JSON.
+    """
+    from utils import initialize_graph
+
+    parser = argparse.ArgumentParser(description="Benchmark the process-pool query engine.")
+    parser.add_argument("--place", action="append", help="Place name; may be repeated.")
+    parser.add_argument("--queries", type=int, default=200, help="Random queries per graph.")
+    parser.add_argument("--workers", type=int, action="append", help="Worker processes; may be repeated.")
+    parser.add_argument("--algorithm", default=QUERY_DIJKSTRA, help="Query algorithm.")
+    parser.add_argument("--batch-size", type=int, default=16, help="Queries per dispatched batch.")
+    parser.add_argument("--output", default="results/benchmarks/query_engine.json", help="Output JSON file.")
+    arguments = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    results = []
+    for place in arguments.place or ["Gliwice, Poland"]:
+        print(f"Benchmarking {place}...")
+        results.extend(
+            {"place": place, **row}
+            for row in benchmark_query_engine(
+                initialize_graph(place),
+                arguments.queries,
+                arguments.workers or sorted({0, 1, max(cpus // 2, 1), cpus}),
+                arguments.algorithm,
+                arguments.batch_size,
+            )
+        )
+
+    os.makedirs(os.path.dirname(arguments.output), exist_ok=True)
+    with open(arguments.output, "w") as file:
+        json.dump(results, file, indent=2)
+    for row in results:
+        print(row)
+    print(f"Saved benchmark results: {arguments.output}")
@@ -0,0 +1,329 @@
+"""
+Benchmark Regression Module
+
+Compares benchmark suite reports against stored baselines and flags slowdowns.
+
+A baseline is a `benchmarks.suite` report stored per graph. Checking re-runs the
+suite with the baseline's algorithms and settings, so both reports time the same
+seeded workload, and compares the latency samples of every algorithm:
+
+- "bootstrap" (default) pairs the queries of the two workloads, takes the median
+  latency of every query over the trials and bootstraps a confidence interval for
+  the geometric mean of the current/baseline ratios.
+- "mann_whitney" runs a one-sided Mann-Whitney U test on all samples of the two
+  reports (normal approximation with tie correction).
+
+An algorithm regressed when the slowdown is statistically significant and its
+median latency grew by more than the threshold. Run it as a module, for example:
+
+    python -m benchmarks.regression --place "Gliwice, Poland" --update-baseline
+    python -m benchmarks.regression --place "Gliwice, Poland" --threshold 0.1
+
+The second command exits with status 1 if any algorithm regressed. Stored baselines
+can also be checked from pytest with `pytest -m performance tests/test_benchmark_regression.py`.
+
+Functions:
+    baseline_path: Returns the baseline file of a graph.
+    save_baseline: Stores a report as the baseline of its graph.
+    load_baseline: Loads the baseline of a graph.
+    mann_whitney: One-sided Mann-Whitney U test for a slowdown.
+    bootstrap_ratio: Bootstrap confidence interval of the latency ratio.
+    compare_reports: Compares a report against a baseline, one row per algorithm.
+    check_regressions: Re-runs the suite for a baseline and compares the results.
+    regressions: Selects the rows of regressed algorithms.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import numpy as np
+from benchmarks.suite import run_suite, save_report
+
+#: Default directory of the stored baselines.
+BASELINE_DIR = "results/benchmarks/baselines"
+
+#: Statistical methods accepted by `compare_reports`.
+METHOD_BOOTSTRAP = "bootstrap"
+METHOD_MANN_WHITNEY = "mann_whitney"
+METHODS = (METHOD_BOOTSTRAP, METHOD_MANN_WHITNEY)
+
+#: Outcomes of a comparison.
+STATUS_REGRESSION = "regression"
+STATUS_IMPROVEMENT = "improvement"
+STATUS_UNCHANGED = "unchanged"
+
+# Report fields that must match for two reports to time the same workload.
+_WORKLOAD_SETTINGS = ("pairs", "seed")
+
+
+def baseline_path(graph_name: str, directory: str = BASELINE_DIR) -> str:
+    """
+    Returns the baseline file of a graph.
+
+    Args:
+        graph_name (str): The graph name of the report, such as its place.
+        directory (str, optional): The baseline directory. Defaults to `BASELINE_DIR`.
+
+    Returns:
+        str: The path of the JSON file.
+    """
+    slug = "".join(character if character.isalnum() else "_" for character in (graph_name or "graph").lower())
+    return os.path.join(directory, f"{slug.strip('_')}.json")
+
+
+def save_baseline(report: dict, directory: str = BASELINE_DIR) -> str:
+    """
+    Stores a report as the baseline of its graph, replacing any previous one.
+
+    Args:
+        report (dict): A report returned by `benchmarks.suite.run_suite`.
+        directory (str, optional): The baseline directory. Defaults to `BASELINE_DIR`.
+
+    Returns:
+        str: The path of the stored baseline.
+    """
+    path = baseline_path(report["graph"]["name"], directory)
+    save_report(report, path)
+    return path
+
+
+def load_baseline(graph_name: str, directory: str = BASELINE_DIR) -> dict:
+    """
+    Loads the baseline of a graph.
+
+    Args:
+        graph_name (str): The graph name of the report.
+        directory (str, optional): The baseline directory. Defaults to `BASELINE_DIR`.
+
+    Returns:
+        dict: The stored report.
+
+    Raises:
+        FileNotFoundError: If no baseline is stored for the graph.
+    """
+    with open(baseline_path(graph_name, directory)) as file:
+        return json.load(file)
+
+
+def _ranks(values: np.ndarray) -> tuple:
+    """
+    Ranks values, giving tied values their average rank.
+
+    Args:
+        values (numpy.ndarray): The values to rank.
+
+    Returns:
+        tuple: The 1-based ranks and the sizes of the groups of tied values.
+    """
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    average = np.cumsum(counts) - (counts - 1) / 2
+    return average[inverse], counts
+
+
+def mann_whitney(baseline, current) -> float:
+    """
+    One-sided Mann-Whitney U test for `current` being slower than `baseline`.
+
+    Uses the normal approximation with tie and continuity corrections, which is
+    accurate for the sample sizes of benchmark reports.
+
+    Args:
+        baseline (array_like): The baseline latency samples.
+        current (array_like): The current latency samples.
+
+    Returns:
+        float: The p-value of the hypothesis that current samples tend to be larger.
+    """
+    baseline = np.asarray(baseline, dtype=np.float64).ravel()
+    current = np.asarray(current, dtype=np.float64).ravel()
+    n1, n2 = len(baseline), len(current)
+    n = n1 + n2
+    ranks, ties = _ranks(np.concatenate([baseline, current]))
+    u = ranks[n1:].sum() - n2 * (n2 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - np.sum(ties ** 3 - ties) / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio(
+        baseline, current, resamples: int = 2000, confidence: float = 0.95, seed: int = 0
+) -> tuple:
+    """
+    Bootstrap confidence interval of the current/baseline latency ratio.
+
+    If both inputs have the same length they are treated as paired (the same
+    queries), and the statistic is the geometric mean of the per-query ratios.
+    Otherwise the statistic is the ratio of the medians of independent resamples.
+
+    Args:
+        baseline (array_like): The baseline latencies.
+        current (array_like): The current latencies.
+        resamples (int, optional): The number of bootstrap resamples. Defaults to 2000.
+        confidence (float, optional): The confidence level of the interval. Defaults to 0.95.
+        seed (int, optional): Seed of the resampling. Defaults to 0.
+
+    Returns:
+        tuple: The ratio estimate and the lower and upper bounds of its interval.
+    """
+    rng = np.random.default_rng(seed)
+    baseline = np.asarray(baseline, dtype=np.float64).ravel()
+    current = np.asarray(current, dtype=np.float64).ravel()
+    tail = (1 - confidence) / 2 * 100
+    if len(baseline) == len(current):
+        log_ratios = np.log(current) - np.log(baseline)
+        samples = rng.choice(log_ratios, size=(resamples, len(log_ratios))).mean(axis=1)
+        low, high = np.exp(np.percentile(samples, [tail, 100 - tail]))
+        return float(np.exp(log_ratios.mean())), float(low), float(high)
+    base = np.median(rng.choice(baseline, size=(resamples, len(baseline))), axis=1)
+    curr = np.median(rng.choice(current, size=(resamples, len(current))), axis=1)
+    low, high = np.percentile(curr / base, [tail, 100 - tail])
+    return float(np.median(current) / np.median(baseline)), float(low), float(high)
+
+
+def compare_reports(
+        baseline: dict, current: dict, threshold: float = 0.1, method: str = METHOD_BOOTSTRAP, alpha: float = 0.05,
+        seed: int = 0,
+) -> list:
+    """
+    Compares the latencies of a report against a baseline.
+
+    Args:
+        baseline (dict): The baseline report.
+        current (dict): The report to check.
+        threshold (float, optional): The relative growth of the median latency above which a
+            significant slowdown is a regression (and below whose negative a significant
+            speed-up is an improvement). Defaults to 0.1.
+        method (str, optional): "bootstrap" or "mann_whitney". Defaults to "bootstrap".
+        alpha (float, optional): The significance level. Defaults to 0.05.
+        seed (int, optional): Seed of the bootstrap resampling. Defaults to 0.
+
+    Returns:
+        list: One dict per algorithm in both reports with the baseline and current median
+            latency, the relative change, the statistic and the status.
+
+    Raises:
+        ValueError: If the method is unknown or the reports did not time the same workload.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unsupported method: {method}. Choose one of {', '.join(METHODS)}.")
+    graphs = [(report["graph"]["nodes"], report["graph"]["edges"]) for report in (baseline, current)]
+    settings = [tuple(report["settings"][key] for key in _WORKLOAD_SETTINGS) for report in (baseline, current)]
+    if graphs[0] != graphs[1] or settings[0] != settings[1]:
+        raise ValueError("The reports were not measured on the same graph and workload.")
+
+    rows = []
+    for name, result in baseline["algorithms"].items():
+        if name not in current["algorithms"]:
+            continue
+        before = np.asarray(result["samples_ms"])
+        after = np.asarray(current["algorithms"][name]["samples_ms"])
+        before_median, after_median = float(np.median(before)), float(np.median(after))
+        change = after_median / before_median - 1
+        row = {"algorithm": name, "baseline_ms": before_median, "current_ms": after_median, "change": change}
+
+        if method == METHOD_BOOTSTRAP:
+            ratio, low, high = bootstrap_ratio(
+                np.median(before, axis=0), np.median(after, axis=0), confidence=1 - alpha, seed=seed
+            )
+            row.update(ratio=ratio, ratio_low=low, ratio_high=high)
+            slower, faster = low > 1, high < 1
+        else:
+            p_slower, p_faster = mann_whitney(before, after), mann_whitney(after, before)
+            row.update(p_value=min(p_slower, p_faster))
+            slower, faster = p_slower < alpha, p_faster < alpha
+
+        if slower and change > threshold:
+            row["status"] = STATUS_REGRESSION
+        elif faster and change < -threshold:
+            row["status"] = STATUS_IMPROVEMENT
+        else:
+            row["status"] = STATUS_UNCHANGED
+        rows.append(row)
+    return rows
+
+
+def check_regressions(graph, baseline: dict, **options) -> tuple:
+    """
+    Re-runs the suite with the algorithms and settings of a baseline and compares the results.
+
+    Args:
+        graph (networkx.MultiDiGraph): The graph the baseline was measured on.
+        baseline (dict): The baseline report.
+        **options: Keyword arguments for `compare_reports`, such as `threshold` and `method`.
+
+    Returns:
+        tuple: The new report and the comparison rows.
+    """
+    settings = baseline["settings"]
+    pinned = baseline["environment"].get("pinned_cpus")
+    report = run_suite(
+        graph,
+        list(baseline["algorithms"]),
+        settings["pairs"],
+        settings["seed"],
+        settings["warmup"],
+        settings["trials"],
+        settings["disable_gc"],
+        pinned,
+        baseline["graph"]["name"],
+    )
+    return report, compare_reports(baseline, report, **options)
+
+
+def regressions(rows: list) -> list:
+    """
+    Selects the rows of regressed algorithms.
+
+    Args:
+        rows (list): Rows returned by `compare_reports`.
+
+    Returns:
+        list: The rows whose status is "regression".
+    """
+    return [row for row in rows if row["status"] == STATUS_REGRESSION]
+
+
+if __name__ == "__main__":
+    """
+    Stores baselines, or checks the current code against them and exits with status 1 on regressions.
+    """
+    from benchmarks.suite import DEFAULT_ALGORITHMS
+    from utils import initialize_graph
+
+    parser = argparse.ArgumentParser(description="Check the pathfinding benchmarks against stored baselines.")
+    parser.add_argument("--place", action="append", help="Place name; may be repeated.")
+    parser.add_argument("--update-baseline", action="store_true", help="Run the suite and store it as the baseline.")
+    parser.add_argument("--baseline-dir", default=BASELINE_DIR, help="Directory of the stored baselines.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown counted as a regression.")
+    parser.add_argument("--method", choices=METHODS, default=METHOD_BOOTSTRAP, help="Statistical method.")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level.")
+    parser.add_argument("--pairs", type=int, default=200, help="Origin-destination pairs of a new baseline.")
+    parser.add_argument("--trials", type=int, default=5, help="Timed passes of a new baseline.")
+    parser.add_argument("--output-dir", default="results/benchmarks", help="Directory for the comparison JSON.")
+    arguments = parser.parse_args()
+
+    failed = False
+    for place in arguments.place or ["Gliwice, Poland"]:
+        graph = initialize_graph(place)
+        if arguments.update_baseline:
+            report = run_suite(graph, DEFAULT_ALGORITHMS, arguments.pairs, trials=arguments.trials, graph_name=place)
+            print(f"Saved baseline: {save_baseline(report, arguments.baseline_dir)}")
+            continue
+
+        baseline = load_baseline(place, arguments.baseline_dir)
+        print(f"Checking {place} against {baseline_path(place, arguments.baseline_dir)}...")
+        report, rows = check_regressions(
+            graph, baseline, threshold=arguments.threshold, method=arguments.method, alpha=arguments.alpha
+        )
+        output = baseline_path(place, arguments.output_dir).replace(".json", "_regression.json")
+        save_report({"baseline": baseline["created"], "current": report, "comparison": rows}, output)
+        for row in rows:
+            print(f"{row['algorithm']}: {row['baseline_ms']:.3f} ms -> {row['current_ms']:.3f} ms "
+                  f"({row['change']:+.1%}) {row['status']}")
+        failed = failed or bool(regressions(rows))
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,335 @@
+"""
+Benchmark Suite Module
+
+Reproducible latency benchmarks of the point-to-point algorithms.
+
+Every algorithm answers the same seeded workload of origin-destination pairs
+through its synchronous `run` path: first a number of warmup queries, then several
+timed trials over the whole workload. Garbage collection can be disabled during the
+trials and the process can be pinned to chosen CPUs to reduce noise. The report
+holds latency percentiles, throughput, settled-node counts and the raw per-query
+samples, together with the environment it was measured in.
+
+Run it as a module, for example:
+
+    python -m benchmarks.suite --place "Gliwice, Poland" --pairs 500 --trials 5 --cpu 2
+
+Functions:
+    make_workload: Draws a seeded list of origin-destination pairs.
+    benchmark_algorithm: Times one algorithm on a workload.
+    run_suite: Times several algorithms on the same workload and returns the report.
+    save_report: Writes a report as JSON.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import time
+from datetime import datetime, timezone
+import numpy as np
+from algorithms import (
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CachedDijkstraAlgorithm,
+    ContractionHierarchiesAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    CSRDijkstraAlgorithm,
+    DijkstraAlgorithm,
+)
+from core import GraphStyler
+
+#: Algorithms available to the suite, by report name.
+ALGORITHMS = {
+    "dijkstra": DijkstraAlgorithm,
+    "a_star": AStarAlgorithm,
+    "bfs": BFSAlgorithm,
+    "bidirectional_dijkstra": BidirectionalDijkstraAlgorithm,
+    "csr_dijkstra": CSRDijkstraAlgorithm,
+    "csr_a_star": CSRAStarAlgorithm,
+    "csr_bfs": CSRBFSAlgorithm,
+    "contraction_hierarchies": ContractionHierarchiesAlgorithm,
+    "cached_dijkstra": CachedDijkstraAlgorithm,
+}
+
+#: Algorithms run when none are selected.
+DEFAULT_ALGORITHMS = ("dijkstra", "a_star", "bfs", "bidirectional_dijkstra", "contraction_hierarchies")
+
+#: Report format version, increased when fields change meaning.
+REPORT_VERSION = 1
+
+
+def make_workload(graph, pairs: int = 200, seed: int = 0) -> list:
+    """
+    Draws a seeded list of origin-destination pairs.
+
+    Nodes are drawn from the sorted node list, so the same seed gives the same
+    workload for the same graph regardless of node insertion order.
+
+    Args:
+        graph (networkx.MultiDiGraph): The graph to draw nodes from.
+        pairs (int, optional): The number of pairs. Defaults to 200.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list: `(start, end)` node pairs.
+    """
+    rng = random.Random(seed)
+    nodes = sorted(graph.nodes)
+    return [(rng.choice(nodes), rng.choice(nodes)) for _ in range(pairs)]
+
+
+def _settled_nodes(algorithm, workload: list) -> list:
+    """
+    Counts the nodes settled by every query of a workload in an untimed pass.
+
+    The pass collects the operation counters of the algorithm (see
+    `GraphAlgorithm.collect_counters`), so the count comes from the same place for
+    every algorithm, whatever it keeps its search state in.
+
+    Args:
+        algorithm (GraphAlgorithm): The algorithm to count.
+        workload (list): `(start, end)` node pairs.
+
+    Returns:
+        list: The settled nodes of every query.
+    """
+    algorithm.collect_counters = True
+    try:
+        return [algorithm.run(origin, destination).counters.nodes_settled for origin, destination in workload]
+    finally:
+        algorithm.collect_counters = False
+
+
+def _summary(samples_ns: np.ndarray) -> dict:
+    """
+    Summarizes latency samples.
+
+    Args:
+        samples_ns (numpy.ndarray): Query latencies in nanoseconds.
+
+    Returns:
+        dict: Mean, min, median, p95, p99 and max latency in milliseconds.
+    """
+    milliseconds = samples_ns / 1e6
+    median, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        "mean": float(milliseconds.mean()),
+        "min": float(milliseconds.min()),
+        "median": float(median),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(milliseconds.max()),
+    }
+
+
+def benchmark_algorithm(algorithm, workload: list, warmup: int = 20, trials: int = 5, disable_gc: bool = True) -> dict:
+    """
+    Times one algorithm on a workload.
+
+    `prepare` is timed separately, then the first `warmup` pairs are run untimed and
+    every trial runs the whole workload, timing each query with `time.perf_counter_ns`.
+    Settled nodes are counted in a separate pass over the workload between the warmup
+    and the trials, with the operation counters enabled; like the warmup, this pass
+    fills caches such as the trees of `CachedDijkstraAlgorithm`.
+
+    Args:
+        algorithm (GraphAlgorithm): The algorithm to time.
+        workload (list): `(start, end)` node pairs.
+        warmup (int, optional): The number of untimed queries before the trials. Defaults to 20.
+        trials (int, optional): The number of timed passes over the workload. Defaults to 5.
+        disable_gc (bool, optional): Whether to collect garbage before each trial and keep the
+            collector disabled while it runs. Defaults to True.
+
+    Returns:
+        dict: The latency summary, throughput, settled-node statistics, per-trial times and
+            raw samples of the algorithm.
+
+    Raises:
+        ValueError: If the workload is empty or the trial count is smaller than 1.
+    """
+    if not workload:
+        raise ValueError("The workload must not be empty.")
+    if trials < 1:
+        raise ValueError("At least one trial is required.")
+
+    start = time.perf_counter_ns()
+    algorithm.prepare()
+    prepare_ns = time.perf_counter_ns() - start
+
+    for origin, destination in (workload * (warmup // len(workload) + 1))[:warmup]:
+        algorithm.run(origin, destination)
+    settled = _settled_nodes(algorithm, workload)
+
+    samples = np.empty((trials, len(workload)), dtype=np.int64)
+    unreachable = 0
+    gc_was_enabled = gc.isenabled()
+    try:
+        for trial in range(trials):
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            for query, (origin, destination) in enumerate(workload):
+                start = time.perf_counter_ns()
+                path = algorithm.run(origin, destination)
+                samples[trial, query] = time.perf_counter_ns() - start
+                if trial == 0:
+                    unreachable += not path
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    trial_seconds = samples.sum(axis=1) / 1e9
+    return {
+        "queries": len(workload),
+        "trials": trials,
+        "warmup": warmup,
+        "prepare_seconds": prepare_ns / 1e9,
+        "latency_ms": _summary(samples.ravel()),
+        "throughput_qps": float(samples.size / (samples.sum() / 1e9)),
+        "settled_nodes": {
+            "mean": float(np.mean(settled)),
+            "median": float(np.median(settled)),
+            "max": int(np.max(settled)),
+        },
+        "unreachable": unreachable,
+        "trial_seconds": trial_seconds.tolist(),
+        "samples_ms": (samples / 1e6).round(6).tolist(),
+    }
+
+
+def _environment(cpus) -> dict:
+    """
+    Describes the machine and interpreter the suite runs on.
+
+    Args:
+        cpus (Iterable[int] | None): The CPUs the process is pinned to, or None.
+
+    Returns:
+        dict: Python, platform, processor and CPU details.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "pinned_cpus": sorted(cpus) if cpus else None,
+        "numpy": np.__version__,
+    }
+
+
+def run_suite(
+        graph, algorithms=DEFAULT_ALGORITHMS, pairs: int = 200, seed: int = 0, warmup: int = 20, trials: int = 5,
+        disable_gc: bool = True, cpus=None, graph_name: str = None,
+) -> dict:
+    """
+    Times several algorithms on the same seeded workload.
+
+    Args:
+        graph (networkx.MultiDiGraph): The weighted graph.
+        algorithms (Iterable[str], optional): Names from `ALGORITHMS`. Defaults to `DEFAULT_ALGORITHMS`.
+        pairs (int, optional): The number of origin-destination pairs. Defaults to 200.
+        seed (int, optional): The workload seed. Defaults to 0.
+        warmup (int, optional): Untimed queries per algorithm. Defaults to 20.
+        trials (int, optional): Timed passes over the workload per algorithm. Defaults to 5.
+        disable_gc (bool, optional): Whether to disable garbage collection during trials. Defaults to True.
+        cpus (Iterable[int], optional): CPUs to pin the process to while the suite runs, where
+            the platform supports it. Defaults to None, which leaves the affinity unchanged.
+        graph_name (str, optional): The name of the graph in the report, such as its place.
+            Defaults to None.
+
+    Returns:
+        dict: The report with the settings, the environment and one entry per algorithm.
+
+    Raises:
+        ValueError: If an algorithm name is unknown.
+    """
+    unknown = [name for name in algorithms if name not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"Unknown algorithms: {', '.join(unknown)}.")
+
+    pinned = None
+    if cpus is not None and hasattr(os, "sched_setaffinity"):
+        pinned = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, set(cpus))
+    try:
+        workload = make_workload(graph, pairs, seed)
+        results = {}
+        for name in algorithms:
+            algorithm = ALGORITHMS[name](graph, None, GraphStyler())
+            results[name] = benchmark_algorithm(algorithm, workload, warmup, trials, disable_gc)
+    finally:
+        if pinned is not None:
+            os.sched_setaffinity(0, pinned)
+
+    return {
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "graph": {"name": graph_name, "nodes": graph.number_of_nodes(), "edges": graph.number_of_edges()},
+        "settings": {"pairs": pairs, "seed": seed, "warmup": warmup, "trials": trials, "disable_gc": disable_gc},
+        "environment": _environment(cpus if pinned is not None else None),
+        "algorithms": results,
+    }
+
+
+def save_report(report: dict, path: str):
+    """
+    Writes a report as JSON, creating its directory if needed.
+
+    Args:
+        report (dict): The report returned by `run_suite`.
+        path (str): The output file.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    """
+    Runs the suite on the given places and writes one report per place.
+    """
+    from utils import initialize_graph
+
+    parser = argparse.ArgumentParser(description="Benchmark the pathfinding algorithms on a seeded workload.")
+    parser.add_argument("--place", action="append", help="Place name; may be repeated.")
+    parser.add_argument("--algorithm", action="append", choices=sorted(ALGORITHMS), help="Algorithm; may be repeated.")
+    parser.add_argument("--pairs", type=int, default=200, help="Origin-destination pairs per graph.")
+    parser.add_argument("--seed", type=int, default=0, help="Workload seed.")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed queries per algorithm.")
+    parser.add_argument("--trials", type=int, default=5, help="Timed passes over the workload.")
+    parser.add_argument("--keep-gc", action="store_true", help="Leave garbage collection enabled during trials.")
+    parser.add_argument("--cpu", type=int, action="append", help="CPU to pin the process to; may be repeated.")
+    parser.add_argument("--output-dir", default="results/benchmarks", help="Directory for the JSON reports.")
+    arguments = parser.parse_args()
+
+    for place in arguments.place or ["Gliwice, Poland"]:
+        print(f"Benchmarking {place}...")
+        report = run_suite(
+            initialize_graph(place),
+            arguments.algorithm or DEFAULT_ALGORITHMS,
+            arguments.pairs,
+            arguments.seed,
+            arguments.warmup,
+            arguments.trials,
+            not arguments.keep_gc,
+            arguments.cpu,
+            place,
+        )
+        slug = place.split(",")[0].strip().lower().replace(" ", "_")
+        output = os.path.join(arguments.output_dir, f"suite_{slug}.json")
+        save_report(report, output)
+        for name, result in report["algorithms"].items():
+            latency = result["latency_ms"]
+            print(f"{name}: median={latency['median']:.3f} ms p95={latency['p95']:.3f} ms "
+                  f"p99={latency['p99']:.3f} ms throughput={result['throughput_qps']:.1f} q/s")
+        print(f"Saved benchmark report: {output}")
@@ -1,7 +1,17 @@
 from .graph_processor import GraphProcessor
 from .graph_styler import GraphStyler
 from .graph_visualizer import GraphVisualizer
-from .algorithm_context import GraphAlgorithm
+from .algorithm_context import GraphAlgorithm, CSRGraphAlgorithm
+from .csr_graph import CSRGraph
+from .search_state import SearchState
+from .path import Path
+from .counters import SearchCounters
+from .scheduling import TimeSlice
+from .heuristics import TravelTimeHeuristic
+from .landmarks import LandmarkHeuristic
+from .contraction_hierarchy import ContractionHierarchy
+from .tree_cache import ShortestPathTree, ShortestPathTreeCache
+from .spatial_index import SpatialIndex
 from .path_reconstructor import PathReconstructor
 from .feature_flags import FeatureFlagManager, FlagsmithProvider
 from .algorithm_comparator import AlgorithmComparator
@@ -10,6 +20,18 @@ __all__ = [
     "GraphStyler",
     "GraphVisualizer",
     "GraphAlgorithm",
+    "CSRGraphAlgorithm",
+    "CSRGraph",
+    "SearchState",
+    "Path",
+    "SearchCounters",
+    "TimeSlice",
+    "TravelTimeHeuristic",
+    "LandmarkHeuristic",
+    "ContractionHierarchy",
+    "ShortestPathTree",
+    "ShortestPathTreeCache",
+    "SpatialIndex",
     "PathReconstructor",
     "FeatureFlagManager",
     "FlagsmithProvider",
@@ -11,19 +11,38 @@ Classes:
 
 import asyncio
 import os
-import time
 import pandas as pd
 import matplotlib.pyplot as plt
 from utils import initialize_graph
-from core import GraphStyler, GraphProcessor
+from core import GraphStyler
+from core.decorators import collect_timings, timed, PHASE_RECONSTRUCT, PHASE_RESET, PHASE_SEARCH
+from core.profiling import Profiler, PROFILE_DIR
 import importlib
 
 # Metrics
 TIME_METRIC = "Time (s)"
+RESET_TIME_METRIC = "Reset Time (s)"
+RECONSTRUCT_TIME_METRIC = "Reconstruct Time (s)"
 COST_METRIC = "Total Cost"
 STEPS_METRIC = "Steps"
 PATH_LENGTH_METRIC = "Path Length"
 
+# Operation counter metrics, keyed by `SearchCounters` attribute
+SETTLED_METRIC = "Nodes Settled"
+RELAXED_METRIC = "Edges Relaxed"
+PUSHES_METRIC = "Heap Pushes"
+STALE_POPS_METRIC = "Stale Pops"
+FRONTIER_METRIC = "Max Frontier"
+MEMORY_METRIC = "Peak Memory (KiB)"
+COUNTER_METRICS = {
+    "nodes_settled": SETTLED_METRIC,
+    "edges_relaxed": RELAXED_METRIC,
+    "heap_pushes": PUSHES_METRIC,
+    "stale_pops": STALE_POPS_METRIC,
+    "max_frontier": FRONTIER_METRIC,
+    "peak_memory": MEMORY_METRIC,
+}
+
 
 class AlgorithmComparator:
     """
@@ -37,7 +56,7 @@ class AlgorithmComparator:
         results (list): A list to store the performance results of the algorithms.
     """
 
-    def __init__(self, graph, start_node, end_node):
+    def __init__(self, graph, start_node, end_node, contraction_hierarchies=False):
         """
         Initializes the AlgorithmComparator with the provided graph and nodes.
 
@@ -45,10 +64,15 @@ class AlgorithmComparator:
             graph (Graph): The graph instance on which the algorithms will run.
             start_node (Any): The starting node for the algorithms.
             end_node (Any): The target node for the algorithms.
+            contraction_hierarchies (bool): Whether to compare Contraction Hierarchies too. Its
+                preprocessing takes seconds on a city-sized graph, so it is opt-in. Defaults to False.
         """
         dijkstra_algorithm = getattr(importlib.import_module("algorithms.dijkstra"), "DijkstraAlgorithm")
         a_star_algorithm = getattr(importlib.import_module("algorithms.a_star"), "AStarAlgorithm")
         bfs_algorithm = getattr(importlib.import_module("algorithms.bfs"), "BFSAlgorithm")
+        bidirectional_dijkstra_algorithm = getattr(
+            importlib.import_module("algorithms.bidirectional_dijkstra"), "BidirectionalDijkstraAlgorithm"
+        )
 
         self.graph = graph
         self.start_node = start_node
@@ -57,68 +81,142 @@ class AlgorithmComparator:
             "Dijkstra": dijkstra_algorithm(graph, None, GraphStyler()),
             "A*": a_star_algorithm(graph, None, GraphStyler()),
             "BFS": bfs_algorithm(graph, None, GraphStyler()),
+            "Bidirectional Dijkstra": bidirectional_dijkstra_algorithm(graph, None, GraphStyler()),
         }
+        if contraction_hierarchies:
+            contraction_hierarchies_algorithm = getattr(
+                importlib.import_module("algorithms.contraction_hierarchies"), "ContractionHierarchiesAlgorithm"
+            )
+            self.algorithms["Contraction Hierarchies"] = contraction_hierarchies_algorithm(graph, None, GraphStyler())
         self.results = []
 
-    def run_comparison(self, plot=False):
+    def run_comparison(self, plot=False, counters=False, profile=False, profile_dir=PROFILE_DIR):
         """
         Runs all algorithms and records their performance metrics.
 
+        Without visualization the algorithms run through their synchronous `run` path,
+        so the measured time is the search rather than event loop and logging overhead.
+        Times come from the timing records of the reset, search and reconstruct phases;
+        the search time excludes the other two.
+
+        With `counters`, every algorithm runs the query a second time collecting its
+        operation counters, so the counting and memory tracing do not affect the times.
+        Likewise, `profile` runs the query once more under a `Profiler` and writes its
+        profiles per phase to `profile_dir`.
+
         Args:
             plot (bool): Whether to visualize the algorithms' execution on the graph. Defaults to False.
+            counters (bool): Whether to add the operation counter metrics. Defaults to False.
+            profile (bool): Whether to write cProfile and sampled profiles of every algorithm.
+                Defaults to False.
+            profile_dir (str): The directory for the profiles. Defaults to "results/profiles".
         """
+        profiler = Profiler(profile_dir) if profile else None
         for name, algorithm in self.algorithms.items():
             print(f"Running {name}...")
-            GraphProcessor.initialize_nodes(self.graph)
-            GraphProcessor.initialize_edges(self.graph, GraphStyler())
-
-            start_time = time.time()
             try:
-                asyncio.run(algorithm.execute(self.start_node, self.end_node, plot))
-                duration = time.time() - start_time
-                cost, steps, path_length = self._collect_metrics()
+                # Preprocessing is paid once per graph, not per query, so it is not timed.
+                algorithm.prepare()
+                with collect_timings() as records:
+                    if plot:
+                        asyncio.run(algorithm.execute(self.start_node, self.end_node, plot))
+                        path = None
+                    else:
+                        with timed(f"{type(algorithm).__qualname__}.run", PHASE_SEARCH):
+                            path = algorithm.run(self.start_node, self.end_node)
+                    cost, steps, path_length = self._collect_metrics(algorithm, path)
+                phases = self._phase_seconds(records)
+                duration = phases[PHASE_SEARCH]
                 if cost == 0 and path_length == 0:
                     print(f"{name} failed to find a valid path.")
                     continue
-                self.results.append({
+                result = {
                     "Algorithm": name,
                     TIME_METRIC: duration,
+                    RESET_TIME_METRIC: phases[PHASE_RESET],
+                    RECONSTRUCT_TIME_METRIC: phases[PHASE_RECONSTRUCT],
                     COST_METRIC: cost,
                     STEPS_METRIC: steps,
                     PATH_LENGTH_METRIC: path_length,
-                })
+                }
+                if counters:
+                    result.update(self._collect_counters(algorithm))
+                if profiler is not None:
+                    profiler.call(name, self._profiled_run, algorithm)
+                self.results.append(result)
                 print(
                     f"{name} completed in {duration:.4f}s with cost={cost}, steps={steps}, path_length={path_length}.")
             except Exception as e:
                 print(f"Error running {name}: {e}")
 
-    def _collect_metrics(self):
+    @staticmethod
+    def _phase_seconds(records: list) -> dict:
+        """
+        Sums timing records per phase, without the time of nested records.
+
+        Args:
+            records (list): The `TimingRecord` objects of one run.
+
+        Returns:
+            dict: Seconds spent in the reset, search and reconstruct phases.
+        """
+        phases = dict.fromkeys((PHASE_RESET, PHASE_SEARCH, PHASE_RECONSTRUCT), 0)
+        for record in records:
+            if record.phase in phases:
+                phases[record.phase] += record.self_nanoseconds
+        return {phase: nanoseconds / 1e9 for phase, nanoseconds in phases.items()}
+
+    def _collect_metrics(self, algorithm, path=None):
         """
         Collects metrics for an algorithm's execution, including cost, steps, and path length.
 
+        The cost is read from the cumulative costs of the reconstructed `Path`, which
+        follow the parallel edges the search actually used.
+
+        Args:
+            algorithm (GraphAlgorithm): The algorithm whose last search is measured.
+            path (Path, optional): The path returned by `run`, if the search was not
+                visualized. Defaults to None, which reconstructs the path.
+
         Returns:
             tuple: A tuple containing the total cost, number of steps, and path length.
         """
-        cost = 0
-        steps = 0
-        path_length = 0
-        current_node = self.end_node
+        if path is None:
+            path = algorithm.reconstruct(self.start_node, self.end_node)
+        if not path:
+            return 0, 0, 0
+        return path.cost, len(path), len(path)
+
+    def _profiled_run(self, algorithm):
+        """
+        Runs the query the way it is timed, as the call profiled by `run_comparison`.
+
+        Args:
+            algorithm (GraphAlgorithm): The algorithm to run.
 
-        while current_node is not None and self.graph.nodes[current_node].get("previous") is not None:
-            prev_node = self.graph.nodes[current_node]["previous"]
-            edge_data = self.graph.get_edge_data(prev_node, current_node, default={})
-            edge_weight = edge_data.get("weight", 0)
+        Returns:
+            Path: The path found.
+        """
+        with timed(f"{type(algorithm).__qualname__}.run", PHASE_SEARCH):
+            return algorithm.run(self.start_node, self.end_node)
 
-            if edge_weight == 0:
-                print(f"⚠️ Missing weight for edge ({prev_node}, {current_node}). Defaulting to 1.")
-                edge_weight = 1
+    def _collect_counters(self, algorithm) -> dict:
+        """
+        Runs the query again with operation counters and returns them as metrics.
 
-            cost += edge_weight
-            steps += 1
-            path_length += 1
-            current_node = prev_node
+        Args:
+            algorithm (GraphAlgorithm): The algorithm to count.
 
-        return cost, steps, path_length
+        Returns:
+            dict: The counter values keyed by metric name; the peak memory in KiB.
+        """
+        algorithm.collect_counters = True
+        try:
+            values = algorithm.run(self.start_node, self.end_node).counters.as_dict()
+        finally:
+            algorithm.collect_counters = False
+        values["peak_memory"] /= 1024
+        return {metric: values[field] for field, metric in COUNTER_METRICS.items()}
 
     def generate_visualizations(self, output_dir="results/comparisons"):
         """
@@ -135,9 +233,10 @@ class AlgorithmComparator:
         df = pd.DataFrame(self.results)
 
         metrics = [TIME_METRIC, COST_METRIC, STEPS_METRIC, PATH_LENGTH_METRIC]
+        metrics += [metric for metric in COUNTER_METRICS.values() if metric in df.columns]
         for metric in metrics:
             plt.figure(figsize=(10, 6))
-            plt.bar(df["Algorithm"], df[metric], color=["#4CAF50", "#FF9800", "#2196F3"])
+            plt.bar(df["Algorithm"], df[metric], color=["#4CAF50", "#FF9800", "#2196F3", "#9C27B0", "#F44336"])
             plt.title(f"Algorithm Comparison: {metric}")
             plt.ylabel(metric)
             plt.xlabel("Algorithms")
@@ -157,7 +256,7 @@ if __name__ == "__main__":
     end_node_instance = list(graph_instance.nodes)[-1]
 
     comparator = AlgorithmComparator(graph_instance, start_node_instance, end_node_instance)
-    comparator.run_comparison(plot=False)
+    comparator.run_comparison(plot=False, counters=True)
     comparator.generate_visualizations()
 
     if comparator.results:
@@ -167,6 +266,9 @@ if __name__ == "__main__":
             print(f"  - Time (s): {result[TIME_METRIC]:.4f}")
             print(f"  - Total Cost: {result[COST_METRIC]:.4f}")
             print(f"  - Steps: {result[STEPS_METRIC]}")
-            print(f"  - Path Length: {result[PATH_LENGTH_METRIC]}\n")
+            print(f"  - Path Length: {result[PATH_LENGTH_METRIC]}")
+            for metric in COUNTER_METRICS.values():
+                print(f"  - {metric}: {result[metric]:g}")
+            print()
     else:
         print("No valid results to summarize.")
@@ -1,4 +1,11 @@
+import math
 from abc import ABC, abstractmethod
+import numpy as np
+from core.counters import SearchCounters
+from core.decorators import measure_time, PHASE_RECONSTRUCT, PHASE_RESET
+from core.path import Path
+from core.scheduling import TimeSlice
+from core.search_state import SearchState
 
 
 class GraphAlgorithm(ABC):
@@ -8,10 +15,27 @@ class GraphAlgorithm(ABC):
     This class provides a framework for implementing graph-related algorithms. It ensures
     consistency and enforces a structure for derived classes to define core functionalities.
 
+    Search bookkeeping (distances, predecessors, settled nodes) lives in a `SearchState`
+    owned by the algorithm instance, so the shared graph is only read during a search
+    and several algorithm instances can search the same graph.
+
+    Searches yield to the event loop whenever their `time_slice` is used up, so
+    they can run next to other tasks and be cancelled. When its deadline passes, a
+    search stops early, sets `interrupted` and leaves its best-known result to
+    `partial_path`.
+
+    With `collect_counters` set, every search collects `SearchCounters` (settled nodes,
+    relaxed edges, queue operations, peak traced memory), available as `counters`
+    and on the `Path` returned by `run`. Searches bind counting queue operations only
+    in that case, so without it they run no counting code at all.
+
     Attributes:
         graph (Any): The data structure representing the graph (e.g., adjacency list, matrix).
         visualizer (Any): A visualization tool for graph processing and presentation.
         styler (Any): A styling object that configures the visual appearance of the graph.
+        time_slice (TimeSlice): The scheduling budget applied to every search.
+        interrupted (bool): Whether the last search stopped at its deadline.
+        collect_counters (bool): Whether searches collect operation counters.
     """
 
     def __init__(self, graph, visualizer, styler):
@@ -26,6 +50,12 @@ class GraphAlgorithm(ABC):
         self.graph = graph
         self.visualizer = visualizer
         self.styler = styler
+        self.time_slice = TimeSlice()
+        self.interrupted = False
+        self.collect_counters = False
+        self._counters = None
+        self._counting = False
+        self._state = None
 
     @abstractmethod
     def execute(self, start: int, end: int, plot: bool = False):
@@ -46,18 +76,344 @@ class GraphAlgorithm(ABC):
         """
         pass
 
-    def initialize_graph(self):
+    @property
+    def state(self) -> SearchState:
+        """SearchState: The search state keyed by graph node, rebuilt only when the node count changes."""
+        if self._state is None or self._state.size != self.graph.number_of_nodes():
+            self._state = SearchState(self.graph.nodes)
+        return self._state
+
+    def run(self, start: int, end: int) -> Path:
+        """
+        Runs the algorithm synchronously, without visualization, and returns its path.
+
+        This is the fast path for callers that only need the result, such as the
+        comparator, batch jobs and benchmarks: no event loop, no asynchronous generator
+        and no logging decorators. Subclasses override it with a plain loop over the
+        same relaxation as `execute`; the default drives the `execute` coroutine to
+        completion without an event loop, which works as long as the search only
+        awaits to end its time slices.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The path found, or an empty path if `end` is unreachable.
+        """
+        coroutine = self.execute(start, end, False)
+        try:
+            while True:
+                coroutine.send(None)
+        except StopIteration:
+            pass
+        return self.finish(start, end)
+
+    def prepare(self):
+        """
+        Performs one-off preprocessing of the graph ahead of the first search.
+
+        Algorithms that answer queries from precomputed data override this so that the
+        preprocessing can be run (and timed) separately from the queries. The default
+        implementation does nothing.
+        """
+
+    @measure_time(phase=PHASE_RESET)
+    def initialize_graph(self, plot: bool = True):
         """
-        Prepares the graph by initializing its nodes and edges.
+        Prepares a new search.
 
-        This method sets up the graph's vertices and edges to ensure it is in a valid
-        and consistent state before executing any algorithm. It relies on the
-        `GraphProcessor` class from the `core.graph_processor` module.
+        The search state is reset in constant time and the time slice, including the
+        deadline, starts over. If `collect_counters` is set, new counters start. Edge
+        styles are only reset when the search is visualized, since nothing else reads them.
+
+        Args:
+            plot (bool, optional): Whether the upcoming search is visualized. Defaults to True.
 
         Raises:
             ImportError: If the `GraphProcessor` module is not available or cannot be imported.
         """
-        from core.graph_processor import GraphProcessor
+        self.state.reset()
+        self.interrupted = False
+        self.time_slice.start()
+        if self._counting:
+            self._counters.stop()
+            self._counting = False
+        self._counters = None
+        if self.collect_counters:
+            self._counters = SearchCounters()
+            self._counting = True
+            self._counters.start()
+        if plot:
+            from core.graph_processor import GraphProcessor
+
+            GraphProcessor.initialize_edges(self.graph, self.styler)
+
+    @property
+    def counters(self):
+        """SearchCounters: The counters of the last search, or None if it did not collect them.
+
+        The derived counters and the peak memory are completed on first access after
+        the search, so read them once the search has finished.
+        """
+        if self._counting:
+            self._counting = False
+            self._counters.stop()
+            self._count_search(self._counters)
+        return self._counters
+
+    def _count_search(self, counters: SearchCounters):
+        """
+        Completes the counters of a finished search from its search state.
+
+        Settled nodes are read from the state and the relaxed edges are their out-edges.
+        Every queue entry that did not settle a node was stale. Subclasses whose searches
+        keep their state elsewhere override this.
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        state = self.state
+        settled = [node for node, generation in state.settled.items() if generation == state.generation]
+        counters.nodes_settled = len(settled)
+        counters.edges_relaxed = sum(degree for _, degree in self.graph.out_degree(settled))
+        counters.stale_pops = max(counters.heap_pops - counters.nodes_settled, 0)
+
+    def finish(self, start: int, end: int) -> Path:
+        """
+        Completes a synchronous search: reconstructs its path and attaches its counters.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The path found, with `counters` set if the search collected them.
+        """
+        counters = self.counters
+        path = self.reconstruct(start, end)
+        path.counters = counters
+        return path
+
+    async def yield_slice(self) -> bool:
+        """
+        Ends the current time slice of a search.
+
+        Called by search loops when `time_slice.tick()` returns True: yields to the
+        event loop, or marks the search as interrupted if its deadline has passed.
+
+        Returns:
+            bool: True if the search may continue, False if it has to stop.
+
+        Raises:
+            asyncio.CancelledError: If the task running the search was cancelled.
+        """
+        if self.time_slice.expired:
+            self.interrupted = True
+            return False
+        await self.time_slice.pause()
+        return True
+
+    def path(self, start: int, end: int) -> list:
+        """
+        Returns the path found by the last search.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if no path was found.
+        """
+        return self.state.path(start, end)
+
+    @measure_time(phase=PHASE_RECONSTRUCT)
+    def reconstruct(self, start: int, end: int) -> Path:
+        """
+        Returns the path found by the last search as a `Path`.
+
+        The path is read from the predecessors and edge keys recorded in the search
+        state, so it uses the parallel edges the search actually relaxed.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The nodes, edge keys and cumulative costs, or an empty path if no path was found.
+        """
+        nodes, keys = self.state.trace(start, end)
+        return Path.from_keys(self.graph, nodes, keys)
+
+    def partial_path(self, start: int, end: int) -> Path:
+        """
+        Returns the best-known result of the last search, even if it was interrupted.
+
+        For a complete search this is `reconstruct`. After a deadline, it is the
+        tentative path to `end` if the search reached it (its cost is an upper bound),
+        otherwise the path to the reached node closest to `end` in a straight line.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The best-known path, or an empty path if there is none.
+        """
+        path = self.reconstruct(start, end)
+        if path or not self.interrupted:
+            return path
+        return self._closest_path(start, end)
+
+    def _closest_path(self, start: int, end: int) -> Path:
+        """
+        Returns the path to the reached node closest to `end`.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The node to approach.
+
+        Returns:
+            Path: The path to the closest reached node, or an empty path if `end` has no coordinates.
+        """
+        state, nodes = self.state, self.graph.nodes
+        reached = [node for node, stamp in state.stamps.items() if stamp == state.generation]
+        target = nodes[end]
+        if not reached or "x" not in target or "y" not in target:
+            return Path.empty()
+        scale = math.cos(math.radians(target["y"]))
+
+        def distance(node) -> float:
+            data = nodes[node]
+            if "x" not in data or "y" not in data:
+                return math.inf
+            return math.hypot((data["x"] - target["x"]) * scale, data["y"] - target["y"])
+
+        return Path.from_keys(self.graph, *state.trace(start, min(reached, key=distance)))
+
+
+class CSRGraphAlgorithm(GraphAlgorithm):
+    """
+    Base class for graph algorithms that search a compact `CSRGraph` view of the graph.
+
+    The networkx graph is converted once (and cached per graph object), after which
+    searches work on dense node indices and plain lists instead of node and edge
+    attribute dictionaries. The search state is dense as well and indexed by the
+    same indices; `path` translates results back to original node identifiers.
+
+    The graph may also be a `CSRGraph` itself, such as one rebuilt from shared memory
+    by a query worker. Such an algorithm has no networkx graph to style and can only
+    be used through `run`.
+    """
+
+    def __init__(self, graph, visualizer, styler):
+        """
+        Constructs the CSRGraphAlgorithm class instance.
+
+        Args:
+            graph (Any): The graph data structure on which the algorithm operates.
+            visualizer (Any): A visualization tool for observing the graph processing.
+            styler (Any): A styling object to customize the appearance of the graph visualization.
+        """
+        super().__init__(graph, visualizer, styler)
+        self._state_csr = None
+
+    @property
+    def csr(self):
+        """CSRGraph: The compact representation of `graph`, built on first use, or `graph` itself."""
+        from core.csr_graph import CSRGraph
+
+        if isinstance(self.graph, CSRGraph):
+            return self.graph
+        return CSRGraph.for_graph(self.graph)
+
+    @property
+    def state(self) -> SearchState:
+        """SearchState: The dense search state, rebuilt only when the CSR representation changes."""
+        csr = self.csr
+        if self._state is None or self._state_csr is not csr:
+            self._state = SearchState(csr.node_count)
+            self._state_csr = csr
+        return self._state
 
-        GraphProcessor.initialize_nodes(self.graph)
-        GraphProcessor.initialize_edges(self.graph, self.styler)
+    def style_csr_edge(self, csr, edge: int, **style):
+        """
+        Styles the original graph edge corresponding to a CSR edge position.
+
+        Args:
+            csr (CSRGraph): The representation the edge position refers to.
+            edge (int): The position of the edge in `csr.targets`.
+            **style: Styling keyword arguments passed to `styler.style_edge`.
+        """
+        source = int(np.searchsorted(csr.offsets, edge, side="right") - 1)
+        self.styler.style_edge(
+            self.graph,
+            (csr.node_ids[source].item(), csr.node_ids[csr.targets[edge]].item(), int(csr.keys[edge])),
+            **style,
+        )
+
+    def path(self, start: int, end: int) -> list:
+        """
+        Returns the path found by the last search.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if no path was found.
+        """
+        csr = self.csr
+        indices = self.state.path(csr.index[start], csr.index[end])
+        return [csr.node_ids[index].item() for index in indices]
+
+    @measure_time(phase=PHASE_RECONSTRUCT)
+    def reconstruct(self, start: int, end: int) -> Path:
+        """
+        Returns the path found by the last search as a `Path`.
+
+        Costs and keys are gathered from the CSR arrays at the recorded edge positions.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The target node of the path.
+
+        Returns:
+            Path: The nodes, edge keys and cumulative costs, or an empty path if no path was found.
+        """
+        csr = self.csr
+        return Path.from_csr(csr, *self.state.trace(csr.index[start], csr.index[end]))
+
+    def _count_search(self, counters: SearchCounters):
+        """
+        Completes the counters of a finished search from its dense search state.
+
+        Args:
+            counters (SearchCounters): The counters of the search.
+        """
+        state, offsets = self.state, self.csr.offsets
+        settled = np.flatnonzero(np.asarray(state.settled) == state.generation)
+        counters.nodes_settled = len(settled)
+        counters.edges_relaxed = int((offsets[settled + 1] - offsets[settled]).sum())
+        counters.stale_pops = max(counters.heap_pops - counters.nodes_settled, 0)
+
+    def _closest_path(self, start: int, end: int) -> Path:
+        """
+        Returns the path to the reached node closest to `end`.
+
+        Args:
+            start (int): The starting node of the path.
+            end (int): The node to approach.
+
+        Returns:
+            Path: The path to the closest reached node, or an empty path if `end` has no coordinates.
+        """
+        csr, state = self.csr, self.state
+        target = csr.index[end]
+        reached = np.flatnonzero(np.asarray(state.stamps) == state.generation)
+        if not len(reached) or np.isnan(csr.x[target]) or np.isnan(csr.y[target]):
+            return Path.empty()
+        scale = math.cos(math.radians(csr.y[target]))
+        distances = np.hypot((csr.x[reached] - csr.x[target]) * scale, csr.y[reached] - csr.y[target])
+        closest = int(reached[np.argmin(np.nan_to_num(distances, nan=np.inf))])
+        return Path.from_csr(csr, *state.trace(csr.index[start], closest))
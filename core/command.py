@@ -8,9 +8,16 @@ class Command(ABC):
     This class serves as a blueprint for creating commands with a standard
     interface. It requires subclasses to implement the `execute` method.
 
+    `execute` may return its result directly or an awaitable of it (for example when
+    implemented as a coroutine function); `core.command_scheduler.CommandScheduler`
+    handles both. Commands of the same type with the same non-None `batch_key` may be
+    executed together through `execute_batch`.
+
     Methods:
         execute():
             Executes the command. Must be implemented by subclasses.
+        execute_batch(commands):
+            Executes several commands of this type that share a batch key.
     """
 
     @abstractmethod
@@ -18,6 +25,27 @@ class Command(ABC):
         """Execute the command."""
         pass
 
+    @property
+    def batch_key(self):
+        """Hashable: The key of the commands this command can be batched with, or None if it runs alone."""
+        return None
+
+    @classmethod
+    def execute_batch(cls, commands: list) -> list:
+        """
+        Executes several commands that share a batch key.
+
+        The default runs them one after another; subclasses override it to share work
+        between the commands.
+
+        Args:
+            commands (list): Commands of this type with the same `batch_key`.
+
+        Returns:
+            list: The result (or awaitable result) of every command, in order.
+        """
+        return [command.execute() for command in commands]
+
 
 class RunAlgorithmCommand(Command):
     """
@@ -36,6 +64,9 @@ class RunAlgorithmCommand(Command):
             The ending point of the algorithm's execution range.
         plot (bool):
             A boolean flag indicating whether to plot the results (default is False).
+
+    Without plotting the command uses the algorithm's synchronous `run` path, and
+    commands on the same graph from the same start node are batched.
     """
 
     def __init__(self, algorithm, start, end, plot=False):
@@ -61,7 +92,54 @@ class RunAlgorithmCommand(Command):
         """
         Executes the encapsulated algorithm with the specified parameters.
 
-        This method calls the `execute` method of the provided algorithm
-        instance with `start`, `end`, and `plot` as arguments.
+        Without plotting this calls the algorithm's `run` method and returns the path.
+        With plotting the visualized search needs an event loop, so a coroutine running
+        the algorithm's `execute` method is returned instead.
+
+        Returns:
+            Path | Coroutine: The path found, or a coroutine returning it when plotting.
+        """
+        if self.plot:
+            return self._execute_plotted()
+        return self.algorithm.run(self.start, self.end)
+
+    async def _execute_plotted(self):
+        """
+        Runs the visualized search.
+
+        Returns:
+            Path: The path found.
+        """
+        await self.algorithm.execute(self.start, self.end, self.plot)
+        return self.algorithm.reconstruct(self.start, self.end)
+
+    @property
+    def batch_key(self):
+        """tuple: The graph and start node of the query, or None for plotted commands, which run alone."""
+        if self.plot:
+            return None
+        return id(self.algorithm.graph), self.start
+
+    @classmethod
+    def execute_batch(cls, commands: list) -> list:
+        """
+        Executes queries sharing a graph and a start node.
+
+        Identical queries (same algorithm instance and end node) are answered once,
+        and consecutive queries reuse the warm state of their algorithm, such as the
+        shortest path tree of `CachedDijkstraAlgorithm`.
+
+        Args:
+            commands (list): Commands with the same `batch_key`.
+
+        Returns:
+            list: The path of every command, in order.
         """
-        self.algorithm.execute(self.start, self.end, self.plot)
+        paths = {}
+        results = []
+        for command in commands:
+            key = id(command.algorithm), command.end
+            if key not in paths:
+                paths[key] = command.execute()
+            results.append(paths[key])
+        return results
@@ -0,0 +1,285 @@
+"""
+Command Scheduler Module
+
+Executes large numbers of `Command` objects on an asyncio event loop.
+
+Commands are queued by priority and executed by a fixed number of worker tasks,
+which bounds how many run at once. A worker takes the most urgent command
+together with queued commands that share its `batch_key` and executes them in one
+`execute_batch` call, on the event loop or on an executor. Results are delivered
+through one future per command.
+
+Classes:
+    CommandScheduler: A priority queue of commands executed in batches with a concurrency limit.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+
+
+class _Entry:
+    """A queued command, its future and whether a worker has taken it."""
+
+    __slots__ = ("command", "future", "key", "taken")
+
+    def __init__(self, command, future, key):
+        self.command = command
+        self.future = future
+        self.key = key
+        self.taken = False
+
+
+class CommandScheduler:
+    """A priority queue of commands executed in batches with a concurrency limit.
+
+    Lower priority values run first and commands of equal priority run in the order
+    they were submitted. A batch runs at the priority of its most urgent command, so
+    commands sharing a batch key may run earlier than their own priority suggests.
+
+    Synchronous batches run on the event loop unless an `executor` is given. Batches
+    running on an executor at the same time must not share algorithm instances, whose
+    search state is not thread-safe; `RunAlgorithmCommand` batches only share one
+    when they were submitted with the same algorithm.
+
+    Use it as an asynchronous context manager, which starts the workers and waits for
+    every submitted command on exit:
+
+        async with CommandScheduler(concurrency=4) as scheduler:
+            futures = [scheduler.submit(command) for command in commands]
+        paths = [future.result() for future in futures]
+
+    Attributes:
+        concurrency (int): The number of batches executed at the same time.
+        max_batch (int): The maximum number of commands per batch.
+        executor (concurrent.futures.Executor): The executor for synchronous batches, or None.
+        batches (int): The number of batches executed.
+        executed (int): The number of commands executed.
+    """
+
+    def __init__(self, concurrency: int = 1, max_batch: int = 64, executor=None):
+        """Initializes the CommandScheduler.
+
+        Args:
+            concurrency (int, optional): The number of batches executed at the same time. Defaults to 1.
+            max_batch (int, optional): The maximum number of commands per batch. Defaults to 64.
+            executor (concurrent.futures.Executor, optional): The executor for synchronous
+                batches. Defaults to None, which runs them on the event loop.
+
+        Raises:
+            ValueError: If the concurrency or the batch size is smaller than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("The concurrency must be at least 1.")
+        if max_batch < 1:
+            raise ValueError("The batch size must be at least 1.")
+        self.concurrency = concurrency
+        self.max_batch = max_batch
+        self.executor = executor
+        self.batches = 0
+        self.executed = 0
+        self._heap = []
+        self._groups = {}
+        self._sequence = itertools.count()
+        self._pending = 0
+        self._active = 0
+        self._ready = None
+        self._idle = None
+        self._workers = []
+
+    def __len__(self) -> int:
+        """int: The number of queued commands not yet taken by a worker."""
+        return self._pending
+
+    async def __aenter__(self):
+        """Starts the workers."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Waits for the queued commands, unless the block raised, and stops the workers."""
+        if exc_info[0] is None:
+            await self.join()
+        await self.close()
+
+    def start(self):
+        """Starts the worker tasks on the running event loop."""
+        if self._workers:
+            return
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        if self._pending:
+            self._ready.set()
+            self._idle.clear()
+        self._workers = [asyncio.ensure_future(self._work()) for _ in range(self.concurrency)]
+
+    def submit(self, command, priority: float = 0) -> asyncio.Future:
+        """
+        Queues a command.
+
+        Args:
+            command (Command): The command to execute.
+            priority (float, optional): The priority; lower values run first. Defaults to 0.
+
+        Returns:
+            asyncio.Future: The future receiving the result of the command, or its exception.
+                Cancelling it before the command runs removes the command from the queue.
+        """
+        batch_key = command.batch_key
+        entry = _Entry(command, asyncio.get_event_loop().create_future(),
+                       None if batch_key is None else (type(command), batch_key))
+        heapq.heappush(self._heap, (priority, next(self._sequence), entry))
+        if entry.key is not None:
+            self._groups.setdefault(entry.key, []).append(entry)
+        self._pending += 1
+        if self._ready is not None:
+            self._ready.set()
+            self._idle.clear()
+        return entry.future
+
+    def submit_many(self, commands, priority: float = 0) -> list:
+        """
+        Queues several commands with the same priority.
+
+        Args:
+            commands (Iterable[Command]): The commands to execute.
+            priority (float, optional): The priority; lower values run first. Defaults to 0.
+
+        Returns:
+            list: The future of every command, in order.
+        """
+        return [self.submit(command, priority) for command in commands]
+
+    async def join(self):
+        """Waits until every queued command has been executed."""
+        if not self._workers:
+            self.start()
+        await self._idle.wait()
+
+    async def close(self):
+        """Stops the workers and cancels the futures of commands that have not completed."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while self._heap:
+            entry = heapq.heappop(self._heap)[2]
+            if not entry.taken:
+                entry.future.cancel()
+        self._groups.clear()
+        self._pending = 0
+
+    def _next_batch(self) -> list:
+        """
+        Takes the most urgent command and the queued commands sharing its batch key.
+
+        Returns:
+            list: The entries of the batch, or an empty list if nothing is queued.
+        """
+        while self._heap:
+            entry = heapq.heappop(self._heap)[2]
+            if entry.taken:
+                continue
+            batch = [entry]
+            if entry.key is not None:
+                group = self._groups.pop(entry.key)
+                for other in group:
+                    if len(batch) == self.max_batch:
+                        break
+                    if other is not entry:
+                        batch.append(other)
+                for taken in batch:
+                    taken.taken = True
+                rest = [other for other in group if not other.taken]
+                if rest:
+                    self._groups[entry.key] = rest
+            entry.taken = True
+            self._pending -= len(batch)
+            batch = [taken for taken in batch if not taken.future.cancelled()]
+            if batch:
+                return batch
+        return []
+
+    async def _work(self):
+        """Executes batches until the worker is cancelled."""
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                if not self._active:
+                    self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            self._active += 1
+            try:
+                await self._execute(batch)
+            finally:
+                self._active -= 1
+                for entry in batch:
+                    if not entry.future.done():
+                        entry.future.cancel()
+            self.batches += 1
+            self.executed += len(batch)
+            # Lets other tasks run between batches executed on the event loop.
+            await asyncio.sleep(0)
+
+    async def _execute(self, batch: list):
+        """
+        Executes a batch and resolves the futures of its commands.
+
+        If the batch as a whole fails, its commands are executed one at a time so that
+        the error only reaches the futures of the commands that raise it.
+
+        Args:
+            batch (list): The entries of the batch.
+        """
+        commands = [entry.command for entry in batch]
+        try:
+            results = await self._call(type(commands[0]).execute_batch, commands)
+        except Exception as error:
+            if len(batch) == 1:
+                results = [error]
+            else:
+                for entry in batch:
+                    await self._execute([entry])
+                return
+        await asyncio.gather(*(self._resolve(entry, result) for entry, result in zip(batch, results)))
+
+    async def _call(self, function, commands: list) -> list:
+        """
+        Calls `execute_batch` on the event loop or on the executor.
+
+        Args:
+            function (Callable[[list], list]): The `execute_batch` method of the command type.
+            commands (list): The commands of the batch.
+
+        Returns:
+            list: The results of the commands.
+        """
+        if self.executor is None:
+            return function(commands)
+        return await asyncio.get_event_loop().run_in_executor(self.executor, function, commands)
+
+    @staticmethod
+    async def _resolve(entry: _Entry, result):
+        """
+        Awaits an awaitable result and stores the outcome in the future of a command.
+
+        Args:
+            entry (_Entry): The entry of the command.
+            result (Any): The result returned for the command, an awaitable of it, or the
+                exception it raised.
+        """
+        try:
+            if isinstance(result, BaseException):
+                raise result
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as error:
+            if not entry.future.done():
+                entry.future.set_exception(error)
+            return
+        if not entry.future.done():
+            entry.future.set_result(result)
@@ -0,0 +1,351 @@
+"""
+Contraction Hierarchy Module
+
+Preprocessing and query engine for contraction hierarchies (CH) on a `CSRGraph`.
+
+Nodes are contracted one by one in order of importance. Contracting a node removes
+it from the remaining graph and, for every pair of neighbours whose shortest path
+ran through it, inserts a shortcut edge unless a witness search finds an
+alternative path that is at least as short. A query then runs two Dijkstra searches
+that only move "upwards" to more important nodes, which on road networks settles a
+few hundred nodes regardless of the distance between the end points. Shortcuts
+remember the node they bypass, so query results unpack to paths over the original
+edges.
+
+Classes:
+    ContractionHierarchy: The preprocessed hierarchy with its query and unpacking logic.
+"""
+
+import heapq
+import os
+import weakref
+import numpy as np
+from core.counters import heap_operations
+
+_HIERARCHY_CACHE = weakref.WeakKeyDictionary()
+
+
+class ContractionHierarchy:
+    """Contraction hierarchy of a fixed graph.
+
+    The hierarchy is stored as two CSR structures over the dense node indices of the
+    graph: `up_*` holds the edges `u -> v` with `rank[v] > rank[u]` and `down_*` holds
+    the edges `u -> v` with `rank[u] > rank[v]`, stored at `v` so that the backward
+    search can follow them from the target upwards. `*_middles` hold the contracted
+    node bypassed by a shortcut, or -1 for original edges.
+
+    Attributes:
+        node_ids (numpy.ndarray): Node identifiers of the graph the hierarchy belongs to.
+        rank (numpy.ndarray): Contraction order of every node; higher is more important.
+        shortcut_count (int): The number of shortcut edges added by the preprocessing.
+    """
+
+    def __init__(self, node_ids, rank, up, down):
+        """Initializes the ContractionHierarchy from prebuilt arrays.
+
+        Args:
+            node_ids (numpy.ndarray): Node identifiers of the graph the hierarchy belongs to.
+            rank (numpy.ndarray): Contraction order of every node.
+            up (tuple): `(offsets, targets, weights, middles)` arrays of the upward graph.
+            down (tuple): `(offsets, sources, weights, middles)` arrays of the downward
+                graph, grouped by the lower end point of each edge.
+        """
+        self.node_ids = node_ids
+        self.rank = np.asarray(rank, dtype=np.int64)
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = (np.asarray(a) for a in up)
+        self.down_offsets, self.down_sources, self.down_weights, self.down_middles = (np.asarray(a) for a in down)
+        self.shortcut_count = int(np.count_nonzero(self.up_middles >= 0) + np.count_nonzero(self.down_middles >= 0))
+
+        self._up = (self.up_offsets.tolist(), self.up_targets.tolist(), self.up_weights.tolist())
+        self._down = (self.down_offsets.tolist(), self.down_sources.tolist(), self.down_weights.tolist())
+        self._middles = {}
+        for offsets, others, middles, upward in (
+                (self.up_offsets, self.up_targets, self.up_middles, True),
+                (self.down_offsets, self.down_sources, self.down_middles, False),
+        ):
+            owners = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            for owner, other, middle in zip(owners.tolist(), others.tolist(), middles.tolist()):
+                if middle >= 0:
+                    self._middles[(owner, other) if upward else (other, owner)] = middle
+
+    @property
+    def node_count(self) -> int:
+        """int: The number of nodes in the hierarchy."""
+        return len(self.rank)
+
+    @classmethod
+    def build(cls, csr, witness_limit: int = 100):
+        """Contracts all nodes of a graph and builds the hierarchy.
+
+        Nodes are ordered lazily by a weighted edge difference (twice the shortcuts added
+        minus the edges removed) plus the number of already contracted neighbours, which
+        keeps the hierarchy sparse and spreads the contraction evenly over the graph.
+
+        Args:
+            csr (CSRGraph): The graph to preprocess.
+            witness_limit (int, optional): The maximum number of nodes a witness search
+                settles before giving up and adding the shortcut. Larger values add
+                fewer unnecessary shortcuts but take longer. Defaults to 100.
+
+        Returns:
+            ContractionHierarchy: The preprocessed hierarchy.
+        """
+        n = csr.node_count
+        offsets, targets, weights = csr.as_lists()
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in range(n):
+            for edge in range(offsets[u], offsets[u + 1]):
+                v = targets[edge]
+                if v != u:
+                    out_edges[u][v] = weights[edge]
+                    in_edges[v][u] = weights[edge]
+
+        contracted = bytearray(n)
+        deleted_neighbors = [0] * n
+        middles = {}
+        rank = [0] * n
+
+        def shortcuts_for(node):
+            incoming = [(u, w) for u, w in in_edges[node].items() if not contracted[u]]
+            outgoing = [(v, w) for v, w in out_edges[node].items() if not contracted[v]]
+            shortcuts = []
+            for u, in_weight in incoming:
+                candidates = [(v, in_weight + out_weight) for v, out_weight in outgoing if v != u]
+                if not candidates:
+                    continue
+                witnesses = _witness_search(
+                    out_edges, contracted, u, node, max(cost for _, cost in candidates), witness_limit
+                )
+                shortcuts.extend((u, v, cost) for v, cost in candidates if witnesses.get(v, float("inf")) > cost)
+            return shortcuts, len(incoming) + len(outgoing)
+
+        def priority(shortcuts, removed, node):
+            return 2 * len(shortcuts) - removed + deleted_neighbors[node]
+
+        queue = [(priority(*shortcuts_for(node), node), node) for node in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, node = heapq.heappop(queue)
+            # Lazy update: priorities of the remaining nodes change as their neighbours
+            # are contracted, so re-evaluate before committing to the cheapest node.
+            shortcuts, removed = shortcuts_for(node)
+            current = priority(shortcuts, removed, node)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, node))
+                continue
+
+            for u, v, cost in shortcuts:
+                if cost < out_edges[u].get(v, float("inf")):
+                    out_edges[u][v] = cost
+                    in_edges[v][u] = cost
+                    middles[(u, v)] = node
+            for neighbor in set(in_edges[node]) | set(out_edges[node]):
+                deleted_neighbors[neighbor] += 1
+            contracted[node] = 1
+            rank[node] = order
+            order += 1
+
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+        for u in range(n):
+            for v, weight in out_edges[u].items():
+                middle = middles.get((u, v), -1)
+                if rank[v] > rank[u]:
+                    up[u].append((v, weight, middle))
+                else:
+                    down[v].append((u, weight, middle))
+
+        return cls(csr.node_ids, rank, _pack(up), _pack(down))
+
+    @classmethod
+    def for_csr(cls, csr, witness_limit: int = 100):
+        """Returns the hierarchy of a graph representation, building it at most once.
+
+        Args:
+            csr (CSRGraph): The graph to preprocess.
+            witness_limit (int, optional): The witness search limit. Defaults to 100.
+
+        Returns:
+            ContractionHierarchy: The cached hierarchy.
+        """
+        cached = _HIERARCHY_CACHE.setdefault(csr, {})
+        if witness_limit not in cached:
+            cached[witness_limit] = cls.build(csr, witness_limit)
+        return cached[witness_limit]
+
+    def save(self, path: str):
+        """Stores the hierarchy in a compressed `.npz` file.
+
+        Args:
+            path (str): The destination file path.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(
+            path,
+            node_ids=self.node_ids,
+            rank=self.rank,
+            up_offsets=self.up_offsets,
+            up_targets=self.up_targets,
+            up_weights=self.up_weights,
+            up_middles=self.up_middles,
+            down_offsets=self.down_offsets,
+            down_sources=self.down_sources,
+            down_weights=self.down_weights,
+            down_middles=self.down_middles,
+        )
+
+    @classmethod
+    def load(cls, path: str, csr=None):
+        """Loads a hierarchy stored with `save`.
+
+        Args:
+            path (str): The `.npz` file path.
+            csr (CSRGraph, optional): The graph the hierarchy will be used with. When given,
+                the stored node numbering must match it. Defaults to None.
+
+        Returns:
+            ContractionHierarchy: The loaded hierarchy.
+
+        Raises:
+            ValueError: If the hierarchy was built for a different graph.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            hierarchy = cls(
+                data["node_ids"],
+                data["rank"],
+                (data["up_offsets"], data["up_targets"], data["up_weights"], data["up_middles"]),
+                (data["down_offsets"], data["down_sources"], data["down_weights"], data["down_middles"]),
+            )
+        if csr is not None and not np.array_equal(hierarchy.node_ids, csr.node_ids):
+            raise ValueError(f"Contraction hierarchy in {path} was built for a different graph.")
+        return hierarchy
+
+    def query(self, source: int, target: int, forward=None, backward=None, counters=None):
+        """Computes the shortest path between two nodes.
+
+        Both searches only relax edges towards more important nodes. The side with the
+        smaller queue minimum is expanded next, and a side stops once its minimum can
+        no longer improve the best meeting point found so far.
+
+        Args:
+            source (int): Dense index of the source node.
+            target (int): Dense index of the target node.
+            forward (SearchState, optional): Dense state for the upward search from the
+                source. A fresh state is used when omitted. Defaults to None.
+            backward (SearchState, optional): Dense state for the upward search from the
+                target. A fresh state is used when omitted. Defaults to None.
+            counters (SearchCounters, optional): Counters for the queue operations of both
+                searches. Defaults to None.
+
+        Returns:
+            tuple: `(distance, path)`, where `path` lists the dense indices of the shortest
+                path over original edges, or `(inf, [])` if the target is unreachable.
+        """
+        from core.search_state import SearchState
+
+        forward = forward or SearchState(self.node_count)
+        backward = backward or SearchState(self.node_count)
+        forward.update(source, 0)
+        backward.update(target, 0)
+
+        best, meeting = (0, source) if source == target else (float("inf"), None)
+        queues = ([(0, source)], [(0, target)])
+        heap_operations(counters, queues[0])
+        heappush, heappop = heap_operations(counters, queues[1])
+        sides = ((forward, backward, self._up), (backward, forward, self._down))
+        while True:
+            tops = [queue[0][0] if queue and queue[0][0] < best else float("inf") for queue in queues]
+            if tops[0] == tops[1] == float("inf"):
+                break
+            side = 0 if tops[0] <= tops[1] else 1
+            state, other, (offsets, neighbors, weights) = sides[side]
+            queue = queues[side]
+            current_distance, current_node = heappop(queue)
+            if state.is_settled(current_node):
+                continue
+            state.settle(current_node)
+
+            if other.is_reached(current_node):
+                candidate = current_distance + other.distance(current_node)
+                if candidate < best:
+                    best, meeting = candidate, current_node
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = neighbors[edge]
+                new_distance = current_distance + weights[edge]
+                if new_distance < state.distance(neighbor):
+                    state.update(neighbor, new_distance, current_node)
+                    heappush(queue, (new_distance, neighbor))
+
+        if meeting is None:
+            return float("inf"), []
+        head = forward.path(source, meeting)
+        tail = backward.path(target, meeting)
+        return best, self.unpack(head + tail[-2::-1])
+
+    def unpack(self, path: list) -> list:
+        """Replaces every shortcut on a path by the original edges it bypasses.
+
+        Args:
+            path (list): Dense node indices of a path in the hierarchy.
+
+        Returns:
+            list: Dense node indices of the same path over original edges.
+        """
+        if not path:
+            return []
+        middles = self._middles
+        unpacked = [path[0]]
+        for u, v in zip(path, path[1:]):
+            stack = [(u, v)]
+            while stack:
+                a, b = stack.pop()
+                middle = middles.get((a, b))
+                if middle is None:
+                    unpacked.append(b)
+                else:
+                    stack.append((middle, b))
+                    stack.append((a, middle))
+        return unpacked
+
+
+def _witness_search(out_edges, contracted, source, excluded, limit, settle_limit) -> dict:
+    """
+    Runs a bounded Dijkstra search in the remaining graph, avoiding one node.
+
+    Tentative distances are returned as well as final ones: each belongs to an actual
+    path, so any of them not longer than a shortcut is a valid witness.
+    """
+    distances = {source: 0}
+    settled = set()
+    queue = [(0, source)]
+    while queue and len(settled) < settle_limit:
+        distance, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        if distance > limit:
+            break
+        settled.add(node)
+        for neighbor, weight in out_edges[node].items():
+            if neighbor == excluded or contracted[neighbor]:
+                continue
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float("inf")):
+                distances[neighbor] = new_distance
+                heapq.heappush(queue, (new_distance, neighbor))
+    return distances
+
+
+def _pack(rows):
+    """Converts per-node lists of `(node, weight, middle)` tuples to CSR arrays."""
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(row) for row in rows])
+    flat = [edge for row in rows for edge in row]
+    nodes = np.array([edge[0] for edge in flat], dtype=np.int32)
+    weights = np.array([edge[1] for edge in flat], dtype=np.float64)
+    middles = np.array([edge[2] for edge in flat], dtype=np.int32)
+    return offsets, nodes, weights, middles
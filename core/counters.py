@@ -0,0 +1,197 @@
+"""
+Counters Module
+
+Optional operation counters of a single search.
+
+When two algorithms take the same time, the counters show why: how many nodes
+they settled, how many edges they scanned, how often they touched their queue and
+how much memory they allocated. Counting is opt-in per algorithm instance (see
+`GraphAlgorithm.collect_counters`). Searches bind their queue operations once per
+search, either to the plain `heapq` functions and `deque` or to the counting
+versions below, so a search that does not collect counters runs exactly the same
+code as before. Counts that can be derived from the search state afterwards, such
+as the settled nodes, are not counted in the loop at all.
+
+The peak memory is measured with `tracemalloc`, which slows allocations down
+considerably; times measured while counters are collected are not representative.
+
+Classes:
+    SearchCounters: The operation counters and memory high-water mark of one search.
+    CountingDeque: A `deque` counting appends, pops and its largest length.
+
+Functions:
+    heap_operations: Returns the heap push and pop functions for a search.
+    make_deque: Returns the BFS queue for a search.
+"""
+
+import heapq
+import tracemalloc
+from collections import deque
+
+
+class SearchCounters:
+    """The operation counters and memory high-water mark of one search.
+
+    Attributes:
+        nodes_settled (int): Nodes whose final distance was fixed (expanded nodes for BFS).
+        edges_relaxed (int): Edges scanned from the settled nodes.
+        heap_pushes (int): Entries added to the priority queue or BFS queue.
+        heap_pops (int): Entries removed from the priority queue or BFS queue.
+        stale_pops (int): Removed entries of nodes that had already been settled.
+        max_frontier (int): Largest number of entries held by the queue at once.
+        peak_memory (int): Peak memory traced by `tracemalloc` during the search, in bytes
+            above the traced memory at its start, or 0 if memory was not traced.
+    """
+
+    __slots__ = (
+        "nodes_settled", "edges_relaxed", "heap_pushes", "heap_pops", "stale_pops", "max_frontier", "peak_memory",
+        "trace_memory", "_memory_base", "_started_tracing",
+    )
+
+    #: Counter names, in the order of `as_dict`.
+    FIELDS = (
+        "nodes_settled", "edges_relaxed", "heap_pushes", "heap_pops", "stale_pops", "max_frontier", "peak_memory",
+    )
+
+    def __init__(self, trace_memory: bool = True):
+        """Initializes the counters at zero.
+
+        Args:
+            trace_memory (bool, optional): Whether `start` and `stop` measure the peak
+                memory with `tracemalloc`. Defaults to True.
+        """
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+        self.trace_memory = trace_memory
+        self._memory_base = 0
+        self._started_tracing = False
+
+    def start(self):
+        """Starts measuring the peak memory, starting `tracemalloc` if it is not running."""
+        if not self.trace_memory:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        self._memory_base = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        """Records the peak memory and stops `tracemalloc` if `start` started it."""
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return
+        self.peak_memory = max(tracemalloc.get_traced_memory()[1] - self._memory_base, 0)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def heappush(self, heap: list, item):
+        """Counting version of `heapq.heappush`.
+
+        Args:
+            heap (list): The heap.
+            item (Any): The entry to push.
+        """
+        heapq.heappush(heap, item)
+        self.heap_pushes += 1
+        if len(heap) > self.max_frontier:
+            self.max_frontier = len(heap)
+
+    def heappop(self, heap: list):
+        """Counting version of `heapq.heappop`.
+
+        Args:
+            heap (list): The heap.
+
+        Returns:
+            Any: The smallest entry.
+        """
+        self.heap_pops += 1
+        return heapq.heappop(heap)
+
+    def as_dict(self) -> dict:
+        """Returns the counters as a dictionary.
+
+        Returns:
+            dict: The counter values keyed by attribute name.
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        """Returns the counter values."""
+        values = ", ".join(f"{field}={value}" for field, value in self.as_dict().items())
+        return f"SearchCounters({values})"
+
+
+class CountingDeque(deque):
+    """A `deque` counting appends, pops from the left and its largest length in a `SearchCounters`."""
+
+    def __init__(self, iterable, counters: SearchCounters):
+        """Initializes the CountingDeque; the initial items count as pushes.
+
+        Args:
+            iterable (Iterable): The initial items.
+            counters (SearchCounters): The counters to update.
+        """
+        super().__init__(iterable)
+        self.counters = counters
+        counters.heap_pushes += len(self)
+        counters.max_frontier = max(counters.max_frontier, len(self))
+
+    def append(self, item):
+        """Appends an item to the right end.
+
+        Args:
+            item (Any): The item to append.
+        """
+        super().append(item)
+        self.counters.heap_pushes += 1
+        if len(self) > self.counters.max_frontier:
+            self.counters.max_frontier = len(self)
+
+    def popleft(self):
+        """Removes and returns the item at the left end.
+
+        Returns:
+            Any: The item.
+        """
+        self.counters.heap_pops += 1
+        return super().popleft()
+
+
+def heap_operations(counters: SearchCounters = None, heap: list = None) -> tuple:
+    """
+    Returns the heap push and pop functions for a search.
+
+    Args:
+        counters (SearchCounters, optional): The counters of the search, or None if it
+            does not collect them. Defaults to None.
+        heap (list, optional): The initial heap of the search; its entries count as pushes.
+            Defaults to None.
+
+    Returns:
+        tuple: `heapq.heappush` and `heapq.heappop`, or the counting versions of `counters`.
+    """
+    if counters is None:
+        return heapq.heappush, heapq.heappop
+    if heap:
+        counters.heap_pushes += len(heap)
+        counters.max_frontier = max(counters.max_frontier, len(heap))
+    return counters.heappush, counters.heappop
+
+
+def make_deque(iterable, counters: SearchCounters = None) -> deque:
+    """
+    Returns the BFS queue for a search.
+
+    Args:
+        iterable (Iterable): The initial items.
+        counters (SearchCounters, optional): The counters of the search, or None if it
+            does not collect them. Defaults to None.
+
+    Returns:
+        deque: A plain `deque`, or a `CountingDeque` updating `counters`.
+    """
+    if counters is None:
+        return deque(iterable)
+    return CountingDeque(iterable, counters)
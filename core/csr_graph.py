@@ -0,0 +1,281 @@
+import weakref
+import numpy as np
+
+_CSR_CACHE = weakref.WeakKeyDictionary()
+
+# Key of the token `CSRGraph.for_graph` keeps in the cache networkx clears on every graph change.
+_CACHE_TOKEN = "csr_graph"
+
+
+class CSRGraph:
+    """Compact, array-backed compressed sparse row (CSR) view of a weighted graph.
+
+    Nodes are renumbered to dense indices `0..n-1`. The out-edges of node `i` are
+    stored in `targets[offsets[i]:offsets[i + 1]]` with matching `weights` and the
+    `keys` of the original MultiDiGraph edges. Parallel edges are collapsed to the
+    lightest one, which is the only one a shortest path can use.
+
+    Attributes:
+        node_ids (numpy.ndarray): Original node identifier of every dense index.
+        index (dict): Mapping from original node identifier to dense index.
+        offsets (numpy.ndarray): Row offsets into `targets`, of length `n + 1`.
+        targets (numpy.ndarray): Dense index of the target node of every edge.
+        weights (numpy.ndarray): Weight of every edge.
+        keys (numpy.ndarray): MultiDiGraph key of every edge (0 for simple graphs).
+        lengths (numpy.ndarray): The `length` attribute of every edge, NaN where unavailable.
+        x (numpy.ndarray): Node x coordinates (longitude), NaN where unavailable.
+        y (numpy.ndarray): Node y coordinates (latitude), NaN where unavailable.
+    """
+
+    def __init__(self, node_ids, offsets, targets, weights, keys, lengths=None, x=None, y=None):
+        """Initializes the CSRGraph from prebuilt arrays.
+
+        Args:
+            node_ids (numpy.ndarray): Original node identifier of every dense index.
+            offsets (numpy.ndarray): Row offsets into `targets`, of length `n + 1`.
+            targets (numpy.ndarray): Dense index of the target node of every edge.
+            weights (numpy.ndarray): Weight of every edge.
+            keys (numpy.ndarray): MultiDiGraph key of every edge.
+            lengths (numpy.ndarray, optional): Length of every edge. Defaults to NaN.
+            x (numpy.ndarray, optional): Node x coordinates. Defaults to NaN.
+            y (numpy.ndarray, optional): Node y coordinates. Defaults to NaN.
+        """
+        self.node_ids = node_ids
+        self.index = {node: i for i, node in enumerate(node_ids.tolist())}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.keys = keys
+        self.lengths = lengths if lengths is not None else np.full(len(targets), np.nan)
+        self.x = x if x is not None else np.full(len(node_ids), np.nan)
+        self.y = y if y is not None else np.full(len(node_ids), np.nan)
+        self._lists = None
+        self._coordinates = None
+        self._reverse = None
+
+    @classmethod
+    def from_graph(cls, graph, weight: str = "weight"):
+        """Builds a CSRGraph from a networkx graph.
+
+        Args:
+            graph (networkx.Graph): The graph to convert. MultiDiGraphs and simple
+                (di)graphs are supported; undirected edges are stored in both directions.
+            weight (str, optional): The edge attribute holding the weight. Edges without
+                it get weight 1. Defaults to "weight".
+
+        Returns:
+            CSRGraph: The compact representation of the graph.
+        """
+        node_list = list(graph.nodes)
+        index = {node: i for i, node in enumerate(node_list)}
+        n = len(node_list)
+
+        if graph.is_multigraph():
+            edges = graph.edges(keys=True, data=True)
+        else:
+            edges = ((u, v, 0, data) for u, v, data in graph.edges(data=True))
+
+        sources, targets, keys, weights, lengths = [], [], [], [], []
+        for u, v, key, data in edges:
+            key = key if isinstance(key, int) else 0
+            w = data.get(weight, 1)
+            length = data.get("length", np.nan)
+            sources.append(index[u])
+            targets.append(index[v])
+            keys.append(key)
+            weights.append(w)
+            lengths.append(length)
+            if not graph.is_directed():
+                sources.append(index[v])
+                targets.append(index[u])
+                keys.append(key)
+                weights.append(w)
+                lengths.append(length)
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keys = np.asarray(keys, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        lengths = np.asarray(lengths, dtype=np.float64)
+
+        # Sort by (source, target, weight) and keep the lightest of each parallel group.
+        order = np.lexsort((weights, targets, sources))
+        sources, targets, keys, weights, lengths = (
+            sources[order], targets[order], keys[order], weights[order], lengths[order]
+        )
+        if len(sources):
+            keep = np.ones(len(sources), dtype=bool)
+            keep[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+            sources, targets, keys, weights, lengths = (
+                sources[keep], targets[keep], keys[keep], weights[keep], lengths[keep]
+            )
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+
+        try:
+            node_ids = np.asarray(node_list, dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            node_ids = np.asarray(node_list, dtype=object)
+
+        x = np.fromiter((graph.nodes[node].get("x", np.nan) for node in node_list), dtype=np.float64, count=n)
+        y = np.fromiter((graph.nodes[node].get("y", np.nan) for node in node_list), dtype=np.float64, count=n)
+
+        return cls(
+            node_ids,
+            offsets,
+            targets.astype(np.int32),
+            weights,
+            keys.astype(np.int32),
+            lengths,
+            x,
+            y,
+        )
+
+    @classmethod
+    def for_graph(cls, graph, weight: str = "weight"):
+        """Returns the CSRGraph of a networkx graph, building it at most once.
+
+        The representation is cached per graph object and rebuilt automatically
+        when nodes or edges have been added or removed since it was built. networkx
+        clears `graph.__networkx_cache__` on every such change (and in
+        `set_edge_attributes`), so the cache keeps a token there and checking it is
+        constant time. Graphs without that cache are compared by their node and edge
+        counts instead. Weights assigned directly through an edge's attribute
+        dictionary are not detected; call `invalidate` after changing them that way.
+
+        Args:
+            graph (networkx.Graph): The graph to convert.
+            weight (str, optional): The edge attribute holding the weight. Defaults to "weight".
+
+        Returns:
+            CSRGraph: The cached compact representation of the graph.
+        """
+        signature = _signature(graph, weight)
+        cached = _CSR_CACHE.get(graph)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        csr = cls.from_graph(graph, weight)
+        _CSR_CACHE[graph] = (signature, csr)
+        return csr
+
+    @staticmethod
+    def invalidate(graph):
+        """Drops the cached representation of a graph after it has been modified.
+
+        Args:
+            graph (networkx.Graph): The modified graph.
+        """
+        _CSR_CACHE.pop(graph, None)
+
+    @property
+    def node_count(self) -> int:
+        """int: The number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """int: The number of stored (deduplicated) edges."""
+        return len(self.targets)
+
+    @property
+    def nbytes(self) -> int:
+        """int: The memory used by the edge and node arrays, in bytes."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.node_ids, self.offsets, self.targets, self.weights, self.keys, self.lengths, self.x, self.y
+            )
+        )
+
+    def neighbors(self, i: int):
+        """Returns the out-neighbours of a node and the weights of the connecting edges.
+
+        Args:
+            i (int): Dense index of the node.
+
+        Returns:
+            tuple: Arrays `(targets, weights)` of the out-edges of the node.
+        """
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return self.targets[start:stop], self.weights[start:stop]
+
+    def edge_index(self, u: int, v: int) -> int:
+        """Returns the position of the edge between two nodes in `targets`.
+
+        Of several parallel edges, the one with the lowest weight is returned, which is
+        the one any shortest path uses.
+
+        Args:
+            u (int): Dense index of the source node.
+            v (int): Dense index of the target node.
+
+        Returns:
+            int: The edge position, or -1 if there is no edge from `u` to `v`.
+        """
+        start, stop = int(self.offsets[u]), int(self.offsets[u + 1])
+        matches = np.flatnonzero(self.targets[start:stop] == v)
+        if not len(matches):
+            return -1
+        return start + int(matches[np.argmin(self.weights[start + matches])])
+
+    def as_lists(self):
+        """Returns the edge arrays as plain Python lists, for scalar search loops.
+
+        Indexing a NumPy array from Python boxes every element, which is slower than
+        indexing a list; pure-Python searches therefore iterate over these lists,
+        while vectorized code uses the arrays directly. The lists are built once.
+
+        Returns:
+            tuple: Lists `(offsets, targets, weights)`.
+        """
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.targets.tolist(), self.weights.tolist())
+        return self._lists
+
+    def coordinate_lists(self):
+        """Returns the node coordinates as plain Python lists, built once.
+
+        Returns:
+            tuple: Lists `(x, y)` indexed by dense node index.
+        """
+        if self._coordinates is None:
+            self._coordinates = (self.x.tolist(), self.y.tolist())
+        return self._coordinates
+
+    def reverse(self):
+        """Returns the transposed graph, in which every edge points the other way.
+
+        The reverse graph shares node numbering with this one and is built once.
+
+        Returns:
+            CSRGraph: The transposed graph.
+        """
+        if self._reverse is None:
+            sources = np.repeat(np.arange(self.node_count, dtype=np.int64), np.diff(self.offsets))
+            order = np.lexsort((sources, self.targets))
+            offsets = np.zeros(self.node_count + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.targets, minlength=self.node_count), out=offsets[1:])
+            reverse = CSRGraph.__new__(CSRGraph)
+            reverse.node_ids = self.node_ids
+            reverse.index = self.index
+            reverse.offsets = offsets
+            reverse.targets = sources[order].astype(np.int32)
+            reverse.weights = self.weights[order]
+            reverse.keys = self.keys[order]
+            reverse.lengths = self.lengths[order]
+            reverse.x = self.x
+            reverse.y = self.y
+            reverse._lists = None
+            reverse._coordinates = self._coordinates
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+
+def _signature(graph, weight: str) -> tuple:
+    """Returns the value identifying the current structure of a graph for `CSRGraph.for_graph`."""
+    networkx_cache = getattr(graph, "__networkx_cache__", None)
+    if networkx_cache is None:
+        return weight, graph.number_of_nodes(), graph.number_of_edges()
+    return weight, networkx_cache.setdefault(_CACHE_TOKEN, object())
@@ -1,10 +1,235 @@
-import time
+"""
+Decorators Module
+
+Decorators and helpers instrumenting function calls.
+
+`log_execution` and `measure_time` detect coroutine functions and asynchronous
+generator functions and wrap them with a wrapper of the same kind, so the logged
+completion and the measured interval cover the awaited work rather than the
+creation of the coroutine. Intervals are measured with `time.perf_counter_ns` and
+emitted as `TimingRecord` objects to a pluggable sink (see `set_timing_sink`); the
+default sink logs them at DEBUG level.
+
+Timed calls nest: every record knows how much of its time was spent in timed calls
+made from it, so the reset, search and reconstruct phases of a query can be told
+apart even though the search performs the reset. A phase hook (see `set_phase_hook`)
+is told whenever timed calls change the phase the code is running in, which lets a
+profiler attribute its samples to phases.
+
+Classes:
+    TimingRecord: The measured interval of one timed call.
+
+Functions:
+    log_execution: Logs the start and completion of a call.
+    measure_time: Emits a timing record for every call.
+    timed: Context manager emitting a timing record for a block.
+    set_timing_sink: Replaces the function receiving timing records.
+    get_timing_sink: Returns the function receiving timing records.
+    collect_timings: Context manager collecting timing records in a list.
+    set_phase_hook: Replaces the function told about phase changes.
+    log_timing: The default sink, logging a record at DEBUG level.
+"""
+
+import contextvars
+import inspect
 import logging
+import time
+from contextlib import contextmanager
 from functools import wraps
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+#: Phases of a query, as passed to `measure_time` and `timed`.
+PHASE_RESET = "reset"
+PHASE_SEARCH = "search"
+PHASE_RECONSTRUCT = "reconstruct"
+
+_active = contextvars.ContextVar("active_timing", default=None)
+
+
+class TimingRecord:
+    """The measured interval of one timed call.
+
+    Attributes:
+        name (str): The qualified name of the function or block.
+        phase (str | None): The phase the interval belongs to, such as "search", or None.
+        parent (TimingRecord | None): The timed call this one was made from, or None.
+        start_ns (int): The `time.perf_counter_ns` value at the start of the interval.
+        nanoseconds (int): The length of the interval, including nested timed calls.
+        nested_ns (int): The time spent in timed calls made directly from this one.
+    """
+
+    __slots__ = ("name", "phase", "parent", "start_ns", "nanoseconds", "nested_ns")
+
+    def __init__(self, name: str, phase: str = None, parent=None):
+        """Initializes the TimingRecord and starts its interval.
+
+        Args:
+            name (str): The qualified name of the function or block.
+            phase (str, optional): The phase of the interval. Defaults to None.
+            parent (TimingRecord, optional): The enclosing timed call. Defaults to None.
+        """
+        self.name = name
+        self.phase = phase
+        self.parent = parent
+        self.nanoseconds = 0
+        self.nested_ns = 0
+        self.start_ns = time.perf_counter_ns()
+
+    @property
+    def seconds(self) -> float:
+        """float: The length of the interval in seconds."""
+        return self.nanoseconds / 1e9
+
+    @property
+    def self_nanoseconds(self) -> int:
+        """int: The length of the interval without nested timed calls."""
+        return self.nanoseconds - self.nested_ns
+
+    def as_dict(self) -> dict:
+        """
+        Returns the record as a flat dictionary, for example for JSON output.
+
+        Returns:
+            dict: The name, phase, parent name, start, length and self time in nanoseconds.
+        """
+        return {
+            "name": self.name,
+            "phase": self.phase,
+            "parent": self.parent.name if self.parent is not None else None,
+            "start_ns": self.start_ns,
+            "nanoseconds": self.nanoseconds,
+            "self_nanoseconds": self.self_nanoseconds,
+        }
+
+
+def log_timing(record: TimingRecord):
+    """
+    Logs a timing record at DEBUG level; the default timing sink.
+
+    Args:
+        record (TimingRecord): The finished record.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Execution time {record.name}: {record.seconds:.6f} s", extra={"timing": record.as_dict()})
+
+
+_sink = log_timing
+_phase_hook = None
+
+
+def set_timing_sink(sink):
+    """
+    Replaces the function receiving timing records.
+
+    Args:
+        sink (Callable[[TimingRecord], None]): The new sink, or None for `log_timing`.
+
+    Returns:
+        Callable[[TimingRecord], None]: The previous sink.
+    """
+    global _sink
+    previous, _sink = _sink, sink if sink is not None else log_timing
+    return previous
+
+
+def get_timing_sink():
+    """
+    Returns the function receiving timing records.
+
+    Returns:
+        Callable[[TimingRecord], None]: The current sink.
+    """
+    return _sink
+
+
+@contextmanager
+def collect_timings():
+    """
+    Collects the timing records emitted inside the block instead of sending them to the sink.
+
+    Yields:
+        list: The list the records are appended to, in the order the intervals end.
+    """
+    records = []
+    previous = set_timing_sink(records.append)
+    try:
+        yield records
+    finally:
+        set_timing_sink(previous)
+
+
+def set_phase_hook(hook):
+    """
+    Replaces the function told about phase changes.
+
+    The hook is called with the phase of the innermost timed call that has one (or
+    None) whenever a timed call starts or ends. Without a hook, nothing is called.
+
+    Args:
+        hook (Callable[[str | None], None] | None): The new hook, or None to remove it.
+
+    Returns:
+        Callable[[str | None], None] | None: The previous hook.
+    """
+    global _phase_hook
+    previous, _phase_hook = _phase_hook, hook
+    return previous
+
+
+def _phase_of(record: TimingRecord):
+    """
+    Returns the phase of a record, inherited from the closest enclosing record that has one.
+
+    Args:
+        record (TimingRecord | None): The record.
+
+    Returns:
+        str | None: The phase, or None if no enclosing record has one.
+    """
+    while record is not None and record.phase is None:
+        record = record.parent
+    return record.phase if record is not None else None
+
+
+def _finish(record: TimingRecord):
+    """
+    Ends the interval of a record, charges it to its parent and emits it.
+
+    Args:
+        record (TimingRecord): The record to finish.
+    """
+    record.nanoseconds = time.perf_counter_ns() - record.start_ns
+    if record.parent is not None:
+        record.parent.nested_ns += record.nanoseconds
+    _sink(record)
+
+
+@contextmanager
+def timed(name: str, phase: str = None):
+    """
+    Emits a timing record for the block; timed calls inside it are nested in the record.
+
+    Args:
+        name (str): The name of the block.
+        phase (str, optional): The phase of the block. Defaults to None.
+
+    Yields:
+        TimingRecord: The record of the block, complete once the block has ended.
+    """
+    record = TimingRecord(name, phase, _active.get())
+    token = _active.set(record)
+    if _phase_hook is not None:
+        _phase_hook(_phase_of(record))
+    try:
+        yield record
+    finally:
+        _active.reset(token)
+        _finish(record)
+        if _phase_hook is not None:
+            _phase_hook(_phase_of(record.parent))
+
 
 def log_execution(func):
     """
@@ -12,7 +237,8 @@ def log_execution(func):
 
     This decorator logs the beginning and end of a function's execution,
     providing insight into function call timing and completion for debugging
-    and monitoring purposes.
+    and monitoring purposes. Coroutines are logged as completed once awaited,
+    asynchronous generators once exhausted.
 
     Args:
         func (Callable): The function to be decorated.
@@ -20,38 +246,71 @@ def log_execution(func):
     Returns:
         Callable: A wrapper function that logs execution details.
     """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        logger.info(f"Execution has begun: {func.__name__}")
-        result = func(*args, **kwargs)
-        logger.info(f"Execution has been completed: {func.__name__}")
-        return result
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            logger.info(f"Execution has begun: {func.__name__}")
+            result = await func(*args, **kwargs)
+            logger.info(f"Execution has been completed: {func.__name__}")
+            return result
+    elif inspect.isasyncgenfunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            logger.info(f"Execution has begun: {func.__name__}")
+            async for item in func(*args, **kwargs):
+                yield item
+            logger.info(f"Execution has been completed: {func.__name__}")
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            logger.info(f"Execution has begun: {func.__name__}")
+            result = func(*args, **kwargs)
+            logger.info(f"Execution has been completed: {func.__name__}")
+            return result
 
     return wrapper
 
 
-def measure_time(func):
+def measure_time(func=None, *, phase: str = None):
     """
-    Measure and log the execution time of a function.
+    Measure the execution time of a function and emit it as a `TimingRecord`.
 
-    This decorator calculates and logs the time taken for a function's
-    execution, making it a helpful tool for performance measurement and
-    optimization.
+    Can be applied bare (`@measure_time`) or with a phase (`@measure_time(phase="search")`).
+    A coroutine is timed until it returns, an asynchronous generator from its first
+    step until it is exhausted or closed; values sent into an asynchronous generator
+    are not forwarded.
 
     Args:
-        func (Callable): The function to be decorated.
+        func (Callable, optional): The function to be decorated.
+        phase (str, optional): The phase recorded for every call. Defaults to None.
 
     Returns:
-        Callable: A wrapper function that logs execution time.
+        Callable: A wrapper function that emits a timing record per call, or a decorator
+            if `func` is not given.
     """
+    if func is None:
+        return lambda function: measure_time(function, phase=phase)
+    name = func.__qualname__
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        logger.info(f"Execution time {func.__name__}: {end_time - start_time:.4f} s")
-        return result
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with timed(name, phase):
+                return await func(*args, **kwargs)
+    elif inspect.isasyncgenfunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # The consumer runs between the steps, so the record is not made the active parent.
+            record = TimingRecord(name, phase, _active.get())
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            finally:
+                _finish(record)
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(name, phase):
+                return func(*args, **kwargs)
 
     return wrapper
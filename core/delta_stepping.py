@@ -0,0 +1,255 @@
+"""
+Delta-Stepping Module
+
+Single-source shortest paths with the delta-stepping algorithm of Meyer and Sanders,
+over the arrays of a `CSRGraph`.
+
+Tentative distances are grouped into buckets of width `delta`. The lowest non-empty
+bucket is emptied by repeatedly relaxing the light edges (weight <= delta) of its
+nodes, which can only add nodes to the same or later buckets; once it is stable its
+nodes are final and their heavy edges are relaxed once. Every phase relaxes a whole
+set of nodes at a time, so it is expressed as vectorized array operations instead of
+one heap operation per edge, and large phases are split across a process pool whose
+workers read the graph and the distance array from shared memory.
+
+Classes:
+    DeltaSteppingEngine: A reusable engine owning the shared memory and the process pool.
+
+Functions:
+    delta_stepping: Runs one search without keeping an engine around.
+    default_delta: Returns the default bucket width of a graph.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from core.shared_arrays import SharedArrays, attach_shared_arrays
+
+# Graph and distance arrays attached by each pool worker, keyed by array name.
+_WORKER_ARRAYS = {}
+
+
+class DeltaSteppingEngine:
+    """Delta-stepping shortest path engine for one graph.
+
+    With `workers=0` everything runs in the calling process. With workers, the graph
+    arrays and the distance array are placed in shared memory once, a process pool is
+    started, and every relaxation phase with at least `parallel_threshold` edges is
+    split into one chunk per worker. Workers only read shared memory and return the
+    improving relaxations; the calling process applies them, so no locking is needed.
+    Use the engine as a context manager, or call `close`, to release the pool and the
+    shared memory.
+
+    Attributes:
+        csr (CSRGraph): The graph being searched.
+        delta (float): The bucket width.
+        workers (int): The number of worker processes, 0 for in-process execution.
+        parallel_threshold (int): The minimum number of edges of a phase worth distributing.
+        phases (int): Number of relaxation phases run by the last search.
+        parallel_phases (int): Number of those phases distributed over the workers.
+    """
+
+    def __init__(self, csr, delta: float = None, workers: int = 0, parallel_threshold: int = 50_000):
+        """Initializes the DeltaSteppingEngine.
+
+        Args:
+            csr (CSRGraph): The graph to search.
+            delta (float, optional): The bucket width. Smaller values do less redundant
+                work but run more phases. Defaults to `default_delta(csr)`.
+            workers (int, optional): The number of worker processes. Defaults to 0.
+            parallel_threshold (int, optional): The minimum number of edges of a phase
+                worth distributing. Defaults to 50000.
+
+        Raises:
+            ValueError: If `delta` is not positive or `workers` is negative.
+        """
+        delta = default_delta(csr) if delta is None else float(delta)
+        if delta <= 0:
+            raise ValueError("delta must be positive.")
+        if workers < 0:
+            raise ValueError("workers must not be negative.")
+        self.csr = csr
+        self.delta = delta
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.phases = 0
+        self.parallel_phases = 0
+        self._shared = None
+        self._pool = None
+
+        n = csr.node_count
+        if workers:
+            self._shared = SharedArrays({
+                "offsets": csr.offsets,
+                "targets": csr.targets,
+                "weights": csr.weights,
+                "distances": np.full(n, np.inf),
+            })
+            self.offsets, self.targets = self._shared["offsets"], self._shared["targets"]
+            self.weights, self.distances = self._shared["weights"], self._shared["distances"]
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach_worker, initargs=(self._shared.specs,)
+            )
+        else:
+            self.offsets, self.targets, self.weights = csr.offsets, csr.targets, csr.weights
+            self.distances = np.full(n, np.inf)
+        self.predecessors = np.full(n, -1, dtype=np.int64)
+
+    def __enter__(self):
+        """Returns the engine itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Releases the pool and the shared memory."""
+        self.close()
+
+    def close(self):
+        """Shuts the process pool down and releases the shared memory segments."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def run(self, source: int):
+        """Computes shortest path distances from one source node to all nodes.
+
+        Args:
+            source (int): Dense index of the source node.
+
+        Returns:
+            tuple: `(distances, predecessors)` as new NumPy arrays indexed by dense node
+                index; unreachable nodes have an infinite distance and predecessor -1.
+        """
+        delta = self.delta
+        distances, predecessors = self.distances, self.predecessors
+        distances[:] = np.inf
+        predecessors[:] = -1
+        distances[source] = 0.0
+        self.phases = self.parallel_phases = 0
+
+        pending = np.array([source], dtype=np.int64)
+        while pending.size:
+            pending = np.unique(pending)
+            pending_distances = distances[pending]
+            upper = (np.floor(pending_distances.min() / delta) + 1) * delta
+            in_bucket = pending_distances < upper
+            frontier, pending = pending[in_bucket], pending[~in_bucket]
+
+            # Light edges may pull nodes into the current bucket, so repeat until it is stable.
+            bucket = []
+            while frontier.size:
+                bucket.append(frontier)
+                improved = self._phase(frontier, light=True)
+                stays = distances[improved] < upper
+                frontier = improved[stays]
+                pending = np.concatenate((pending, improved[~stays]))
+
+            # Heavy edges always lead past the current bucket and are relaxed once.
+            improved = self._phase(np.unique(np.concatenate(bucket)), light=False)
+            pending = np.concatenate((pending, improved))
+
+        return distances.copy(), predecessors.copy()
+
+    def _phase(self, frontier: np.ndarray, light: bool) -> np.ndarray:
+        """Relaxes the light or heavy edges of a set of nodes and applies the improvements.
+
+        Args:
+            frontier (numpy.ndarray): Dense indices of the nodes to relax.
+            light (bool): Whether to relax the light (True) or the heavy (False) edges.
+
+        Returns:
+            numpy.ndarray: The nodes whose distance decreased.
+        """
+        self.phases += 1
+        edge_count = int((self.offsets[frontier + 1] - self.offsets[frontier]).sum())
+        if self._pool is not None and edge_count >= self.parallel_threshold and len(frontier) >= self.workers:
+            self.parallel_phases += 1
+            chunks = np.array_split(frontier, self.workers)
+            results = list(self._pool.map(_relax_shared, chunks, [light] * len(chunks), [self.delta] * len(chunks)))
+            nodes = np.concatenate([result[0] for result in results])
+            candidates = np.concatenate([result[1] for result in results])
+            parents = np.concatenate([result[2] for result in results])
+        else:
+            nodes, candidates, parents = _relax(
+                self.offsets, self.targets, self.weights, self.distances, frontier, light, self.delta
+            )
+        if not nodes.size:
+            return nodes
+
+        # Keep the smallest candidate per node, then apply those that still improve.
+        order = np.lexsort((candidates, nodes))
+        nodes, first = np.unique(nodes[order], return_index=True)
+        candidates, parents = candidates[order][first], parents[order][first]
+        better = candidates < self.distances[nodes]
+        nodes = nodes[better]
+        self.distances[nodes] = candidates[better]
+        self.predecessors[nodes] = parents[better]
+        return nodes
+
+
+def default_delta(csr) -> float:
+    """Returns the default bucket width for a graph: eight times its mean edge weight.
+
+    Each phase has a fixed cost in array operations, so buckets spanning several
+    edges, which need fewer phases, are faster than the narrow buckets favoured by
+    the sequential analysis.
+
+    Args:
+        csr (CSRGraph): The graph to search.
+
+    Returns:
+        float: The bucket width, 1.0 for graphs without edges.
+    """
+    if not csr.edge_count:
+        return 1.0
+    return float(np.mean(csr.weights)) * 8 or 1.0
+
+
+def delta_stepping(csr, source: int, delta: float = None, workers: int = 0):
+    """Computes shortest path distances from one source node with delta-stepping.
+
+    Args:
+        csr (CSRGraph): The graph to search.
+        source (int): Dense index of the source node.
+        delta (float, optional): The bucket width. Defaults to `default_delta(csr)`.
+        workers (int, optional): The number of worker processes. Defaults to 0.
+
+    Returns:
+        tuple: `(distances, predecessors)` as NumPy arrays indexed by dense node index.
+    """
+    with DeltaSteppingEngine(csr, delta, workers) as engine:
+        return engine.run(source)
+
+
+def _relax(offsets, targets, weights, distances, frontier, light: bool, delta: float):
+    """Returns the relaxations of the light or heavy out-edges of `frontier` that improve a distance."""
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+    run_starts = np.cumsum(counts) - counts
+    edges = np.repeat(starts - run_starts, counts) + np.arange(total)
+    edge_weights = weights[edges]
+    selected = edge_weights <= delta if light else edge_weights > delta
+
+    parents = np.repeat(frontier, counts)[selected]
+    nodes = targets[edges[selected]].astype(np.int64)
+    candidates = distances[parents] + edge_weights[selected]
+    improving = candidates < distances[nodes]
+    return nodes[improving], candidates[improving], parents[improving]
+
+
+def _attach_worker(specs: dict):
+    """Pool initializer attaching the shared graph and distance arrays in a worker."""
+    _WORKER_ARRAYS.update(attach_shared_arrays(specs))
+
+
+def _relax_shared(frontier, light: bool, delta: float):
+    """Pool task relaxing a chunk of the frontier against the shared arrays."""
+    arrays = _WORKER_ARRAYS
+    return _relax(
+        arrays["offsets"], arrays["targets"], arrays["weights"], arrays["distances"], frontier, light, delta
+    )
@@ -0,0 +1,186 @@
+import math
+import weakref
+import numpy as np
+
+#: Mean Earth radius in metres, as used by osmnx for edge lengths.
+EARTH_RADIUS_M = 6_371_009
+
+#: Heuristic modes accepted by the A* algorithms.
+HEURISTIC_TRAVEL_TIME = "travel_time"
+HEURISTIC_EUCLIDEAN = "euclidean"
+HEURISTIC_ALT = "alt"
+HEURISTIC_NONE = "none"
+HEURISTIC_MODES = (HEURISTIC_TRAVEL_TIME, HEURISTIC_ALT, HEURISTIC_EUCLIDEAN, HEURISTIC_NONE)
+
+# Edge lengths are great-circle sums, so they are never shorter than the straight
+# distance; the margin only absorbs floating point and rounding differences.
+_SAFETY_FACTOR = 0.999
+
+_HEURISTIC_CACHE = weakref.WeakKeyDictionary()
+
+
+class TravelTimeHeuristic:
+    """Admissible and consistent A* heuristic for travel-time weighted road graphs.
+
+    Edge weights produced by `initialize_graph` are `length / maxspeed`. No path can
+    be shorter than the great-circle distance between its end points, and no edge is
+    faster than the fastest edge of the graph, so the great-circle distance divided
+    by the maximum `length / weight` ratio never overestimates the remaining cost.
+    Because the great-circle distance satisfies the triangle inequality, the bound is
+    also consistent and A* settles every node at most once.
+
+    Coordinates are converted to radians once per graph and kept in plain lists
+    indexed by the dense node index of the `CSRGraph`.
+
+    Attributes:
+        max_speed (float): The largest `length / weight` ratio of any edge, or 0 if unknown.
+        usable (bool): Whether coordinates and edge lengths allow a non-zero bound.
+    """
+
+    def __init__(self, csr):
+        """Initializes the TravelTimeHeuristic.
+
+        Args:
+            csr (CSRGraph): The graph representation providing coordinates, lengths and weights.
+        """
+        lon = np.radians(csr.x)
+        lat = np.radians(csr.y)
+        self.lon = lon.tolist()
+        self.lat = lat.tolist()
+        self.cos_lat = np.cos(lat).tolist()
+
+        valid = np.isfinite(csr.lengths) & (csr.weights > 0)
+        speeds = csr.lengths[valid] / csr.weights[valid]
+        self.max_speed = float(speeds.max()) if len(speeds) else 0.0
+        self.usable = self.max_speed > 0 and bool(np.all(np.isfinite(lon)) and np.all(np.isfinite(lat)))
+        self._scale = 2 * EARTH_RADIUS_M * _SAFETY_FACTOR / self.max_speed if self.usable else 0.0
+
+    @classmethod
+    def for_csr(cls, csr):
+        """Returns the heuristic of a graph representation, building it at most once.
+
+        Args:
+            csr (CSRGraph): The graph representation.
+
+        Returns:
+            TravelTimeHeuristic: The cached heuristic.
+        """
+        heuristic = _HEURISTIC_CACHE.get(csr)
+        if heuristic is None:
+            heuristic = cls(csr)
+            _HEURISTIC_CACHE[csr] = heuristic
+        return heuristic
+
+    def estimate(self, node1: int, node2: int) -> float:
+        """Returns a lower bound on the travel cost between two nodes.
+
+        Args:
+            node1 (int): Dense index of the first node.
+            node2 (int): Dense index of the second node.
+
+        Returns:
+            float: The great-circle distance in metres divided by the maximum speed.
+        """
+        if not self.usable:
+            return 0.0
+        lat, lon, cos_lat = self.lat, self.lon, self.cos_lat
+        half_dlat = math.sin((lat[node2] - lat[node1]) * 0.5)
+        half_dlon = math.sin((lon[node2] - lon[node1]) * 0.5)
+        a = half_dlat * half_dlat + cos_lat[node1] * cos_lat[node2] * half_dlon * half_dlon
+        return self._scale * math.asin(math.sqrt(min(1.0, a)))
+
+    def bind(self, target: int):
+        """Returns a function bounding the travel cost from any node to a fixed target.
+
+        Args:
+            target (int): Dense index of the target node.
+
+        Returns:
+            Callable[[int], float]: A function returning the lower bound for a dense node index.
+        """
+        if not self.usable:
+            return lambda node: 0.0
+        lat, lon, cos_lat, scale = self.lat, self.lon, self.cos_lat, self._scale
+        target_lat, target_lon, target_cos_lat = lat[target], lon[target], cos_lat[target]
+        sin, sqrt, asin = math.sin, math.sqrt, math.asin
+
+        def estimate(node: int) -> float:
+            half_dlat = sin((target_lat - lat[node]) * 0.5)
+            half_dlon = sin((target_lon - lon[node]) * 0.5)
+            a = half_dlat * half_dlat + cos_lat[node] * target_cos_lat * half_dlon * half_dlon
+            return scale * asin(sqrt(a if a < 1.0 else 1.0))
+
+        return estimate
+
+    def estimates_to(self, target: int) -> np.ndarray:
+        """Returns the lower bounds from every node to one target, vectorized.
+
+        Args:
+            target (int): Dense index of the target node.
+
+        Returns:
+            numpy.ndarray: The lower bound for every dense node index.
+        """
+        lat = np.asarray(self.lat)
+        lon = np.asarray(self.lon)
+        if not self.usable:
+            return np.zeros(len(lat))
+        a = (
+            np.sin((lat[target] - lat) * 0.5) ** 2
+            + np.cos(lat) * self.cos_lat[target] * np.sin((lon[target] - lon) * 0.5) ** 2
+        )
+        return self._scale * np.arcsin(np.sqrt(np.minimum(1.0, a)))
+
+
+def bind_heuristic(heuristic: str, csr, target: int, source: int = None, landmarks=None):
+    """Builds the per-query heuristic function for a heuristic mode.
+
+    Args:
+        heuristic (str): The heuristic mode, one of `HEURISTIC_MODES`.
+        csr (CSRGraph): The graph representation being searched.
+        target (int): Dense index of the target node.
+        source (int, optional): Dense index of the source node, used to choose the active
+            landmarks in "alt" mode. Defaults to None.
+        landmarks (LandmarkHeuristic, optional): Precomputed landmark tables for "alt" mode.
+            Defaults to tables built (once) with the default settings.
+
+    Returns:
+        Callable[[int], float]: A function returning the estimate for a dense node index.
+    """
+    if heuristic == HEURISTIC_NONE:
+        return lambda node: 0.0
+    if heuristic == HEURISTIC_EUCLIDEAN:
+        xs, ys = csr.coordinate_lists()
+        target_x, target_y = xs[target], ys[target]
+        return lambda node: math.hypot(xs[node] - target_x, ys[node] - target_y)
+
+    geometric = TravelTimeHeuristic.for_csr(csr)
+    if heuristic == HEURISTIC_TRAVEL_TIME:
+        return geometric.bind(target)
+
+    from core.landmarks import LandmarkHeuristic
+
+    landmarks = landmarks or LandmarkHeuristic.for_csr(csr)
+    landmark_bound = landmarks.bind(target, source)
+    if not geometric.usable:
+        return landmark_bound
+    geometric_bound = geometric.bind(target)
+    # The maximum of two consistent lower bounds is itself a consistent lower bound.
+    return lambda node: max(landmark_bound(node), geometric_bound(node))
+
+
+def validate_heuristic(heuristic: str) -> str:
+    """Checks that a heuristic mode is supported.
+
+    Args:
+        heuristic (str): The requested heuristic mode.
+
+    Returns:
+        str: The heuristic mode, unchanged.
+
+    Raises:
+        ValueError: If the mode is not one of `HEURISTIC_MODES`.
+    """
+    if heuristic not in HEURISTIC_MODES:
+        raise ValueError(f"Unknown heuristic '{heuristic}'. Expected one of: {', '.join(HEURISTIC_MODES)}")
+    return heuristic
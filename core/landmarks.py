@@ -0,0 +1,279 @@
+import os
+import random
+import weakref
+import numpy as np
+from core.shortest_paths import single_source_dijkstra
+
+#: Landmark selection strategies accepted by `LandmarkHeuristic.build`.
+STRATEGY_FARTHEST = "farthest"
+STRATEGY_AVOID = "avoid"
+LANDMARK_STRATEGIES = (STRATEGY_FARTHEST, STRATEGY_AVOID)
+
+_LANDMARK_CACHE = weakref.WeakKeyDictionary()
+
+
+class LandmarkHeuristic:
+    """ALT (A*, landmarks, triangle inequality) lower bounds for a fixed graph.
+
+    For every landmark `L` the distances `d(L, v)` (forward) and `d(v, L)` (backward)
+    to all nodes are precomputed. By the triangle inequality,
+    `d(v, t) >= d(L, t) - d(L, v)` and `d(v, t) >= d(v, L) - d(t, L)`, and the
+    largest of these bounds over the landmarks is an admissible and consistent
+    A* heuristic that, unlike geometric bounds, follows the actual road network.
+
+    Tables are indexed by the dense node index of the `CSRGraph` they were built
+    for and can be saved to and loaded from a `.npz` file, so the preprocessing is
+    paid once per graph.
+
+    Attributes:
+        node_ids (numpy.ndarray): Node identifiers of the graph the tables belong to.
+        landmarks (numpy.ndarray): Dense indices of the landmark nodes.
+        forward (numpy.ndarray): `k x n` table of distances from each landmark.
+        backward (numpy.ndarray): `k x n` table of distances to each landmark.
+    """
+
+    def __init__(self, node_ids, landmarks, forward, backward):
+        """Initializes the LandmarkHeuristic from precomputed tables.
+
+        Args:
+            node_ids (numpy.ndarray): Node identifiers of the graph the tables belong to.
+            landmarks (numpy.ndarray): Dense indices of the landmark nodes.
+            forward (numpy.ndarray): `k x n` table of distances from each landmark.
+            backward (numpy.ndarray): `k x n` table of distances to each landmark.
+        """
+        self.node_ids = node_ids
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.forward = np.asarray(forward, dtype=np.float64)
+        self.backward = np.asarray(backward, dtype=np.float64)
+        self._rows = None
+
+    @classmethod
+    def build(cls, csr, k: int = 8, strategy: str = STRATEGY_AVOID, seed: int = 0):
+        """Selects landmarks and computes their distance tables.
+
+        Args:
+            csr (CSRGraph): The graph to preprocess.
+            k (int, optional): The number of landmarks. Defaults to 8.
+            strategy (str, optional): "farthest" repeatedly picks the node farthest from the
+                landmarks chosen so far; "avoid" picks leaves of shortest path trees whose
+                distances are poorly covered by the current landmarks. Defaults to "avoid".
+            seed (int, optional): Seed for the random root nodes. Defaults to 0.
+
+        Returns:
+            LandmarkHeuristic: The preprocessed heuristic.
+
+        Raises:
+            ValueError: If the strategy is unknown or `k` is not positive.
+        """
+        if strategy not in LANDMARK_STRATEGIES:
+            raise ValueError(
+                f"Unknown landmark strategy '{strategy}'. Expected one of: {', '.join(LANDMARK_STRATEGIES)}"
+            )
+        if k < 1:
+            raise ValueError("At least one landmark is required.")
+
+        rng = random.Random(seed)
+        reverse = csr.reverse()
+        k = min(k, csr.node_count)
+        landmarks, forward, backward = [], [], []
+
+        def add(landmark):
+            landmarks.append(landmark)
+            forward.append(single_source_dijkstra(csr, landmark)[0])
+            backward.append(single_source_dijkstra(reverse, landmark)[0])
+
+        if strategy == STRATEGY_FARTHEST:
+            root_distances = single_source_dijkstra(csr, rng.randrange(csr.node_count))[0]
+            add(_argmax_finite(root_distances))
+            while len(landmarks) < k:
+                coverage = np.min(np.asarray(forward) + np.asarray(backward), axis=0)
+                coverage[landmarks] = -np.inf
+                add(_argmax_finite(coverage))
+        else:
+            attempts = 0
+            while len(landmarks) < k:
+                landmark = _avoid_landmark(csr, rng, landmarks, forward, backward)
+                attempts += 1
+                if landmark in landmarks:
+                    if attempts < 4 * k:
+                        continue
+                    # Every tree found so far is covered; fall back to an arbitrary new node.
+                    landmark = next(node for node in range(csr.node_count) if node not in landmarks)
+                add(landmark)
+
+        return cls(csr.node_ids, landmarks, np.asarray(forward), np.asarray(backward))
+
+    @classmethod
+    def for_csr(cls, csr, k: int = 8, strategy: str = STRATEGY_AVOID, seed: int = 0):
+        """Returns the landmark heuristic of a graph representation, building it at most once.
+
+        Args:
+            csr (CSRGraph): The graph to preprocess.
+            k (int, optional): The number of landmarks. Defaults to 8.
+            strategy (str, optional): The landmark selection strategy. Defaults to "avoid".
+            seed (int, optional): Seed for the random root nodes. Defaults to 0.
+
+        Returns:
+            LandmarkHeuristic: The cached heuristic.
+        """
+        cached = _LANDMARK_CACHE.setdefault(csr, {})
+        key = (k, strategy, seed)
+        if key not in cached:
+            cached[key] = cls.build(csr, k, strategy, seed)
+        return cached[key]
+
+    def save(self, path: str):
+        """Stores the landmark tables in a compressed `.npz` file.
+
+        Args:
+            path (str): The destination file path.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez_compressed(
+            path, node_ids=self.node_ids, landmarks=self.landmarks, forward=self.forward, backward=self.backward
+        )
+
+    @classmethod
+    def load(cls, path: str, csr=None):
+        """Loads landmark tables stored with `save`.
+
+        Args:
+            path (str): The `.npz` file path.
+            csr (CSRGraph, optional): The graph the tables will be used with. When given,
+                the stored node numbering must match it. Defaults to None.
+
+        Returns:
+            LandmarkHeuristic: The loaded heuristic.
+
+        Raises:
+            ValueError: If the tables were built for a different graph.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            heuristic = cls(data["node_ids"], data["landmarks"], data["forward"], data["backward"])
+        if csr is not None and not np.array_equal(heuristic.node_ids, csr.node_ids):
+            raise ValueError(f"Landmark tables in {path} were built for a different graph.")
+        return heuristic
+
+    def _row_lists(self):
+        """Returns the distance tables as lists of plain Python lists, built once."""
+        if self._rows is None:
+            self._rows = (
+                [row.tolist() for row in self.forward],
+                [row.tolist() for row in self.backward],
+            )
+        return self._rows
+
+    def estimate(self, node1: int, node2: int) -> float:
+        """Returns the ALT lower bound over all landmarks.
+
+        Args:
+            node1 (int): Dense index of the first node.
+            node2 (int): Dense index of the second node.
+
+        Returns:
+            float: A lower bound on the distance from `node1` to `node2`.
+        """
+        return self.bind(node2)(node1)
+
+    def bind(self, target: int, source: int = None, active: int = 4):
+        """Returns a function bounding the distance from any node to a fixed target.
+
+        When the source of the query is known, only the `active` landmarks giving the
+        best bound for the source are consulted, which keeps every evaluation cheap.
+
+        Args:
+            target (int): Dense index of the target node.
+            source (int, optional): Dense index of the source node. Defaults to None.
+            active (int, optional): The number of landmarks used when `source` is given.
+                Defaults to 4.
+
+        Returns:
+            Callable[[int], float]: A function returning the lower bound for a dense node index.
+        """
+        forward_rows, backward_rows = self._row_lists()
+        chosen = range(len(forward_rows))
+        if source is not None and active < len(forward_rows):
+            with np.errstate(invalid="ignore"):
+                bounds = np.maximum(
+                    self.forward[:, target] - self.forward[:, source],
+                    self.backward[:, source] - self.backward[:, target],
+                )
+            chosen = np.argsort(-np.nan_to_num(bounds, nan=-np.inf), kind="stable")[:active].tolist()
+
+        rows = [
+            (forward_rows[i], forward_rows[i][target], backward_rows[i], backward_rows[i][target])
+            for i in chosen
+        ]
+
+        def estimate(node: int) -> float:
+            best = 0.0
+            for forward, forward_target, backward, backward_target in rows:
+                # Infinite distances give infinite bounds only when the target is truly
+                # unreachable; NaN (inf - inf) fails both comparisons and is ignored.
+                bound = forward_target - forward[node]
+                if bound > best:
+                    best = bound
+                bound = backward[node] - backward_target
+                if bound > best:
+                    best = bound
+            return best
+
+        return estimate
+
+
+def _argmax_finite(values: np.ndarray) -> int:
+    """Returns the index of the largest finite value, or 0 if there is none."""
+    finite = np.isfinite(values)
+    if not finite.any():
+        return 0
+    return int(np.argmax(np.where(finite, values, -np.inf)))
+
+
+def _avoid_landmark(csr, rng, landmarks, forward, backward) -> int:
+    """
+    Picks the next landmark with the "avoid" strategy of Goldberg and Werneck.
+
+    A shortest path tree is grown from a random root. Every node is weighted by how
+    much the current landmarks underestimate its distance from the root, and the
+    weights are summed over subtrees; subtrees that already contain a landmark are
+    ignored. Starting at the root, the heaviest child is followed down to a leaf,
+    which becomes the new landmark.
+    """
+    root = rng.randrange(csr.node_count)
+    distances, predecessors = single_source_dijkstra(csr, root)
+    reachable = np.isfinite(distances)
+
+    lower_bounds = np.zeros(csr.node_count)
+    if landmarks:
+        forward_table, backward_table = np.asarray(forward), np.asarray(backward)
+        with np.errstate(invalid="ignore"):
+            bounds = np.maximum(
+                forward_table - forward_table[:, [root]],
+                backward_table[:, [root]] - backward_table,
+            )
+        lower_bounds = np.nan_to_num(np.max(bounds, axis=0), nan=0.0, posinf=0.0, neginf=0.0)
+
+    sizes = np.where(reachable, distances - np.minimum(lower_bounds, distances), 0.0).tolist()
+    covered = [False] * csr.node_count
+    for landmark in landmarks:
+        covered[landmark] = True
+    parents = predecessors.tolist()
+
+    children = {}
+    order = np.flatnonzero(reachable)[np.argsort(-distances[reachable], kind="stable")].tolist()
+    for node in order:
+        parent = parents[node]
+        if parent < 0:
+            continue
+        children.setdefault(parent, []).append(node)
+        sizes[parent] += sizes[node]
+        covered[parent] = covered[parent] or covered[node]
+
+    node = root
+    while True:
+        candidates = [child for child in children.get(node, []) if not covered[child]]
+        if not candidates:
+            return node
+        node = max(candidates, key=lambda child: sizes[child])
@@ -0,0 +1,132 @@
+"""
+Path Module
+
+A compact result type for the path found by a search.
+
+Classes:
+    Path: The nodes, edge keys and cumulative costs of a path.
+"""
+
+import numpy as np
+
+
+class Path:
+    """A path through a MultiDiGraph, stored as arrays.
+
+    Besides the nodes, a path records which of the parallel edges between
+    consecutive nodes it uses, and the cost accumulated up to every node, so cost
+    and length metrics never have to look edges up again.
+
+    Attributes:
+        nodes (numpy.ndarray): Node identifiers from the start to the end node.
+        keys (numpy.ndarray): Key of the edge between `nodes[i]` and `nodes[i + 1]`.
+        costs (numpy.ndarray): Cost from the start node to `nodes[i]`; `costs[0]` is 0.
+        counters (SearchCounters | None): The operation counters of the search that found
+            the path, if it collected them (see `GraphAlgorithm.collect_counters`).
+    """
+
+    __slots__ = ("nodes", "keys", "costs", "counters")
+
+    def __init__(self, nodes, keys, costs):
+        """Initializes the Path.
+
+        Args:
+            nodes (Sequence): Node identifiers from the start to the end node.
+            keys (Sequence[int]): The key of every edge, one fewer than `nodes`.
+            costs (Sequence[float]): The cumulative cost at every node.
+        """
+        self.nodes = np.asarray(nodes)
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self.costs = np.asarray(costs, dtype=np.float64)
+        self.counters = None
+
+    @classmethod
+    def empty(cls):
+        """Returns the path of a search that found no path.
+
+        Returns:
+            Path: A path without nodes.
+        """
+        return cls(np.empty(0, dtype=np.int64), (), ())
+
+    @classmethod
+    def from_keys(cls, graph, nodes: list, keys: list = None, weight: str = "weight"):
+        """Builds a path from node identifiers and the keys of the edges used.
+
+        Args:
+            graph (networkx.MultiDiGraph): The graph the path runs through.
+            nodes (list): Node identifiers from the start to the end node.
+            keys (list, optional): The key of every edge. Unknown keys (None, or all of
+                them when omitted) resolve to the cheapest parallel edge. Defaults to None.
+            weight (str, optional): The edge attribute holding the weight. Defaults to "weight".
+
+        Returns:
+            Path: The path, or an empty path if `nodes` is empty.
+
+        Raises:
+            KeyError: If two consecutive nodes are not connected by the given edge.
+        """
+        if not nodes:
+            return cls.empty()
+        keys = list(keys) if keys is not None else [None] * (len(nodes) - 1)
+        adjacency = graph.succ if graph.is_directed() else graph.adj
+        costs = [0.0]
+        for i, (u, v) in enumerate(zip(nodes, nodes[1:])):
+            parallel = adjacency[u][v]
+            if keys[i] is None:
+                keys[i] = min(parallel, key=lambda key: parallel[key].get(weight, float("inf")))
+            costs.append(costs[-1] + parallel[keys[i]][weight])
+        return cls(nodes, keys, costs)
+
+    @classmethod
+    def from_csr(cls, csr, nodes: list, edges: list = None):
+        """Builds a path from dense node indices and the CSR positions of the edges used.
+
+        Args:
+            csr (CSRGraph): The graph representation the indices refer to.
+            nodes (list): Dense node indices from the start to the end node.
+            edges (list, optional): The position in `csr.targets` of every edge. Unknown
+                positions (None, or all of them when omitted) resolve to the cheapest
+                parallel edge. Defaults to None.
+
+        Returns:
+            Path: The path with original node identifiers, or an empty path if `nodes` is empty.
+        """
+        if not nodes:
+            return cls.empty()
+        if edges is None or None in edges:
+            edges = [
+                csr.edge_index(u, v) if edge is None else edge
+                for u, v, edge in zip(nodes, nodes[1:], edges or [None] * (len(nodes) - 1))
+            ]
+        edges = np.asarray(edges, dtype=np.int64)
+        costs = np.zeros(len(nodes))
+        np.cumsum(csr.weights[edges], out=costs[1:])
+        return cls(csr.node_ids[np.asarray(nodes, dtype=np.int64)], csr.keys[edges], costs)
+
+    def __len__(self) -> int:
+        """Returns the number of edges of the path."""
+        return max(len(self.nodes) - 1, 0)
+
+    def __bool__(self) -> bool:
+        """Checks whether a path was found; a path from a node to itself counts."""
+        return len(self.nodes) > 0
+
+    def __repr__(self) -> str:
+        """Returns a short description of the path."""
+        return f"Path(nodes={len(self.nodes)}, cost={self.cost})"
+
+    @property
+    def cost(self) -> float:
+        """float: The total cost of the path, infinity if no path was found."""
+        return float(self.costs[-1]) if len(self.costs) else float("inf")
+
+    @property
+    def edges(self) -> list:
+        """list: The `(u, v, key)` tuples of the edges of the path, in order."""
+        nodes = self.nodes.tolist()
+        return list(zip(nodes, nodes[1:], self.keys.tolist()))
+
+    def tolist(self) -> list:
+        """Returns the node identifiers as a list, as returned by `GraphAlgorithm.path`."""
+        return self.nodes.tolist()
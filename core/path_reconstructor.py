@@ -1,4 +1,5 @@
 from core import GraphProcessor, GraphVisualizer, GraphStyler
+from core.path import Path
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,20 +25,24 @@ class PathReconstructor:
         self.visualizer = visualizer
         self.styler = styler
 
-    async def reconstruct_path(self, start: int, end: int, plot: bool = False):
+    async def reconstruct_path(self, start: int, end: int, plot: bool = False, path=None):
         """Reconstructs the path from the end node to the start node and optionally plots it.
 
         Args:
             start (int): The starting node of the path.
             end (int): The ending node of the path.
             plot (bool, optional): Whether to capture and plot frames for visualization. Defaults to False.
+            path (Path | list, optional): The path from `start` to `end`, preferably as returned
+                by `GraphAlgorithm.reconstruct`, which carries the edge keys the search used; for
+                a plain node list the cheapest parallel edges are styled. When omitted, the path
+                is followed through the `previous` attribute of the graph nodes. Defaults to None.
 
         Raises:
             Exception: Logs and handles exceptions during path reconstruction, styling, or visualization.
         """
         try:
             GraphProcessor.initialize_edges(self.graph, self.styler)
-            async for edge in self._path_generator(start, end):
+            async for edge in self._path_generator(start, end, path):
                 try:
                     self.styler.style_edge(
                         self.graph, edge, color="#ADD8E6", alpha=0.9, linewidth=2
@@ -52,7 +57,7 @@ class PathReconstructor:
         except Exception as e:
             logger.error(f"Error reconstructing path: {e}")
 
-    async def _path_generator(self, start: int, end: int):
+    async def _path_generator(self, start: int, end: int, path=None):
         """Generates edges for the path reconstruction asynchronously.
 
         This method yields edges in the path from the end node to the start node.
@@ -60,6 +65,7 @@ class PathReconstructor:
         Args:
             start (int): The starting node of the path.
             end (int): The ending node of the path.
+            path (Path | list, optional): The path from `start` to `end`. Defaults to None.
 
         Yields:
             tuple: A tuple containing the source node, target node, and key of an edge.
@@ -67,14 +73,23 @@ class PathReconstructor:
         Raises:
             Exception: Logs an error if the path reconstruction fails due to missing edges.
         """
-        current_node = end
-        while current_node != start:
-            previous_node = self.graph.nodes[current_node].get("previous")
-            if previous_node is None:
-                logger.error("Path reconstruction failed: No path found.")
-                return
-            yield previous_node, current_node, 0  # (source, target, key)
-            current_node = previous_node
+        if path is None:
+            path = [end]
+            while path[-1] != start:
+                previous_node = self.graph.nodes[path[-1]].get("previous")
+                if previous_node is None:
+                    path = []
+                    break
+                path.append(previous_node)
+            path.reverse()
+
+        if not isinstance(path, Path):
+            path = Path.from_keys(self.graph, path)
+        if not path:
+            logger.error("Path reconstruction failed: No path found.")
+            return
+        for edge in reversed(path.edges):
+            yield edge  # (source, target, key)
 
     async def _add_final_frames(self):
         """Adds extra frames to the visualizer for smoother animations.
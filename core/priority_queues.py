@@ -0,0 +1,511 @@
+"""
+Priority Queues Module
+
+Interchangeable priority queues for the label-setting searches (Dijkstra, A*).
+
+Every queue holds at most one live entry per node: `push` inserts a node or lowers
+its priority (decrease-key) and ignores pushes that would not lower it. How a
+decrease is implemented differs, and the counters on every queue make the
+difference visible:
+
+- "heapq": the standard library heap with lazy deletion. A decrease pushes a second
+  entry and the outdated one is discarded when it reaches the top (a stale pop).
+- "indexed": a binary heap with a position index, so a decrease moves the existing
+  entry up in place and the heap never holds more entries than nodes.
+- "pairing": a pairing heap; a decrease cuts the subtree and melds it with the root
+  in constant time.
+- "radix": a radix heap over priorities scaled to integers, for monotone searches
+  whose popped priorities never decrease. Entries move between logarithmically sized
+  buckets instead of being sifted; decreases are lazy like "heapq".
+
+Classes:
+    PriorityQueue: Base class holding the shared counters.
+    HeapQueue: `heapq` with lazy deletion.
+    IndexedBinaryHeap: Binary heap with decrease-key.
+    PairingHeap: Pairing heap with decrease-key.
+    RadixHeap: Monotone radix heap over integer-scaled priorities.
+
+Functions:
+    make_priority_queue: Creates a queue by name.
+    validate_priority_queue: Checks that a queue name is supported.
+"""
+
+import heapq
+import math
+from abc import ABC, abstractmethod
+
+#: Priority queue kinds accepted by `make_priority_queue`.
+QUEUE_HEAPQ = "heapq"
+QUEUE_INDEXED = "indexed"
+QUEUE_PAIRING = "pairing"
+QUEUE_RADIX = "radix"
+PRIORITY_QUEUES = (QUEUE_HEAPQ, QUEUE_INDEXED, QUEUE_PAIRING, QUEUE_RADIX)
+
+
+class PriorityQueue(ABC):
+    """Base class of the priority queues, holding the operation counters.
+
+    Attributes:
+        pushes (int): Number of pushes that inserted a node or lowered its priority.
+        decrease_keys (int): Number of those pushes that lowered the priority of a queued node.
+        pops (int): Number of nodes returned by `pop`.
+        stale_pops (int): Number of outdated entries discarded while popping.
+        peak_size (int): Largest number of entries, live or stale, held at once.
+    """
+
+    def __init__(self):
+        """Initializes the counters."""
+        self.pushes = 0
+        self.decrease_keys = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.peak_size = 0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of queued nodes."""
+        pass
+
+    def __bool__(self) -> bool:
+        """Returns whether any node is queued."""
+        return len(self) > 0
+
+    @abstractmethod
+    def push(self, node, priority: float):
+        """Queues a node, or lowers its priority if it is already queued with a higher one.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            priority (float): The priority; smaller is popped first.
+        """
+        pass
+
+    @abstractmethod
+    def pop(self):
+        """Removes and returns the node with the smallest priority.
+
+        Returns:
+            tuple: `(priority, node)`.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        pass
+
+    def stats(self) -> dict:
+        """Returns the operation counters.
+
+        Returns:
+            dict: The counter values keyed by attribute name.
+        """
+        return {
+            "pushes": self.pushes,
+            "decrease_keys": self.decrease_keys,
+            "pops": self.pops,
+            "stale_pops": self.stale_pops,
+            "peak_size": self.peak_size,
+        }
+
+
+class HeapQueue(PriorityQueue):
+    """`heapq` based queue with lazy deletion of outdated entries."""
+
+    def __init__(self):
+        """Initializes an empty HeapQueue."""
+        super().__init__()
+        self._heap = []
+        self._best = {}
+
+    def __len__(self) -> int:
+        """Returns the number of queued nodes."""
+        return len(self._best)
+
+    def push(self, node, priority: float):
+        """Queues a node, or adds a better entry for it if it is already queued.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            priority (float): The priority; smaller is popped first.
+        """
+        best = self._best.get(node)
+        if best is not None:
+            if priority >= best:
+                return
+            self.decrease_keys += 1
+        self._best[node] = priority
+        heapq.heappush(self._heap, (priority, node))
+        self.pushes += 1
+        if len(self._heap) > self.peak_size:
+            self.peak_size = len(self._heap)
+
+    def pop(self):
+        """Removes and returns the node with the smallest priority, skipping outdated entries.
+
+        Returns:
+            tuple: `(priority, node)`.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        heap, best = self._heap, self._best
+        while heap:
+            priority, node = heapq.heappop(heap)
+            if best.get(node) == priority:
+                del best[node]
+                self.pops += 1
+                return priority, node
+            self.stale_pops += 1
+        raise IndexError("pop from an empty priority queue")
+
+
+class IndexedBinaryHeap(PriorityQueue):
+    """Binary min-heap with a node-to-position index supporting decrease-key."""
+
+    def __init__(self):
+        """Initializes an empty IndexedBinaryHeap."""
+        super().__init__()
+        self._nodes = []
+        self._priorities = []
+        self._positions = {}
+
+    def __len__(self) -> int:
+        """Returns the number of queued nodes."""
+        return len(self._nodes)
+
+    def push(self, node, priority: float):
+        """Queues a node, or moves it up the heap if its priority decreases.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            priority (float): The priority; smaller is popped first.
+        """
+        position = self._positions.get(node)
+        if position is None:
+            position = len(self._nodes)
+            self._nodes.append(node)
+            self._priorities.append(priority)
+            if len(self._nodes) > self.peak_size:
+                self.peak_size = len(self._nodes)
+        elif priority < self._priorities[position]:
+            self._priorities[position] = priority
+            self.decrease_keys += 1
+        else:
+            return
+        self.pushes += 1
+        self._sift_up(position, node, priority)
+
+    def pop(self):
+        """Removes and returns the node with the smallest priority.
+
+        Returns:
+            tuple: `(priority, node)`.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        nodes, priorities = self._nodes, self._priorities
+        if not nodes:
+            raise IndexError("pop from an empty priority queue")
+        node, priority = nodes[0], priorities[0]
+        del self._positions[node]
+        last_node, last_priority = nodes.pop(), priorities.pop()
+        if nodes:
+            self._sift_down(0, last_node, last_priority)
+        self.pops += 1
+        return priority, node
+
+    def _sift_up(self, position: int, node, priority: float):
+        """Moves an entry towards the root until its parent is not larger."""
+        nodes, priorities, positions = self._nodes, self._priorities, self._positions
+        while position:
+            parent = (position - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            nodes[position] = nodes[parent]
+            priorities[position] = priorities[parent]
+            positions[nodes[position]] = position
+            position = parent
+        nodes[position] = node
+        priorities[position] = priority
+        positions[node] = position
+
+    def _sift_down(self, position: int, node, priority: float):
+        """Moves an entry towards the leaves until no child is smaller."""
+        nodes, priorities, positions = self._nodes, self._priorities, self._positions
+        size = len(nodes)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priorities[child] >= priority:
+                break
+            nodes[position] = nodes[child]
+            priorities[position] = priorities[child]
+            positions[nodes[position]] = position
+            position = child
+        nodes[position] = node
+        priorities[position] = priority
+        positions[node] = position
+
+
+# Fields of a pairing heap entry, stored as a list for cheap attribute access.
+_PRIORITY, _NODE, _CHILD, _SIBLING, _PREVIOUS = range(5)
+
+
+class PairingHeap(PriorityQueue):
+    """Pairing heap with constant-time insert and decrease-key.
+
+    Each entry is a list `[priority, node, first child, next sibling, previous]`,
+    where `previous` is the parent for a first child and the left sibling otherwise.
+    """
+
+    def __init__(self):
+        """Initializes an empty PairingHeap."""
+        super().__init__()
+        self._root = None
+        self._entries = {}
+
+    def __len__(self) -> int:
+        """Returns the number of queued nodes."""
+        return len(self._entries)
+
+    def push(self, node, priority: float):
+        """Queues a node, or cuts it from its parent and re-melds it if its priority decreases.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            priority (float): The priority; smaller is popped first.
+        """
+        entry = self._entries.get(node)
+        if entry is None:
+            entry = [priority, node, None, None, None]
+            self._entries[node] = entry
+            self._root = _meld(self._root, entry)
+            if len(self._entries) > self.peak_size:
+                self.peak_size = len(self._entries)
+        elif priority < entry[_PRIORITY]:
+            entry[_PRIORITY] = priority
+            self.decrease_keys += 1
+            if entry is not self._root:
+                previous, sibling = entry[_PREVIOUS], entry[_SIBLING]
+                if previous[_CHILD] is entry:
+                    previous[_CHILD] = sibling
+                else:
+                    previous[_SIBLING] = sibling
+                if sibling is not None:
+                    sibling[_PREVIOUS] = previous
+                entry[_SIBLING] = entry[_PREVIOUS] = None
+                self._root = _meld(self._root, entry)
+        else:
+            return
+        self.pushes += 1
+
+    def pop(self):
+        """Removes and returns the node with the smallest priority.
+
+        The children of the root are melded in pairs from left to right, and the pairs
+        are then melded from right to left into the new root.
+
+        Returns:
+            tuple: `(priority, node)`.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        root = self._root
+        if root is None:
+            raise IndexError("pop from an empty priority queue")
+        del self._entries[root[_NODE]]
+
+        pairs = []
+        child = root[_CHILD]
+        while child is not None:
+            second = child[_SIBLING]
+            following = second[_SIBLING] if second is not None else None
+            child[_SIBLING] = child[_PREVIOUS] = None
+            if second is not None:
+                second[_SIBLING] = second[_PREVIOUS] = None
+            pairs.append(_meld(child, second))
+            child = following
+
+        new_root = None
+        for pair in reversed(pairs):
+            new_root = _meld(pair, new_root)
+        self._root = new_root
+        self.pops += 1
+        return root[_PRIORITY], root[_NODE]
+
+
+def _meld(first, second):
+    """Links two pairing heap roots, making the larger one the first child of the smaller."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if second[_PRIORITY] < first[_PRIORITY]:
+        first, second = second, first
+    child = first[_CHILD]
+    second[_SIBLING] = child
+    if child is not None:
+        child[_PREVIOUS] = second
+    second[_PREVIOUS] = first
+    first[_CHILD] = second
+    return first
+
+
+class RadixHeap(PriorityQueue):
+    """Monotone radix heap over priorities scaled to integers.
+
+    Priorities are mapped to the integer key `int(priority * scale)`. An entry with
+    key `k` lives in bucket `(k ^ last).bit_length()`, where `last` is the key of the
+    most recently popped node, so bucket 0 holds the entries whose key equals `last`
+    and each further bucket covers twice the key range of the one before. Popping
+    refills bucket 0 from the first non-empty bucket, and because every entry moves
+    to a strictly lower bucket each time, the total work is logarithmic in the key
+    range per entry. Entries sharing a key are ordered by their exact priority, so the
+    pop order is exact and the scale only affects bucket sizes.
+
+    This requires monotone priorities, as produced by Dijkstra and by A* with a
+    consistent heuristic: a push below the last popped key raises `ValueError`.
+    Pushes with an infinite priority, such as an ALT bound of a node that cannot
+    reach the target, have no integer key and are dropped, since the node can never
+    lead to the target.
+
+    Attributes:
+        scale (float): The factor mapping priorities to integer keys.
+    """
+
+    def __init__(self, scale: float = 1000.0):
+        """Initializes an empty RadixHeap.
+
+        Args:
+            scale (float, optional): The factor mapping priorities to integer keys. A
+                larger scale gives smaller buckets. Defaults to 1000.0.
+        """
+        super().__init__()
+        self.scale = scale
+        self._buckets = [[]]
+        self._last = 0
+        self._best = {}
+        self._entries = 0
+
+    def __len__(self) -> int:
+        """Returns the number of queued nodes."""
+        return len(self._best)
+
+    def push(self, node, priority: float):
+        """Queues a node, or adds a better entry for it if it is already queued.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            priority (float): The priority; smaller is popped first.
+
+        Raises:
+            ValueError: If the priority is below the priority of the last popped node.
+        """
+        best = self._best.get(node)
+        if best is not None and priority >= best or priority == math.inf:
+            return
+        key = int(priority * self.scale)
+        if key < self._last:
+            raise ValueError(
+                f"Radix heap priorities must be monotone: {priority} is below the last popped priority."
+            )
+        if best is not None:
+            self.decrease_keys += 1
+        self._best[node] = priority
+        self._insert((key, priority, node))
+        self.pushes += 1
+        self._entries += 1
+        if self._entries > self.peak_size:
+            self.peak_size = self._entries
+
+    def pop(self):
+        """Removes and returns the node with the smallest priority, skipping outdated entries.
+
+        Returns:
+            tuple: `(priority, node)`.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        buckets, best = self._buckets, self._best
+        while True:
+            bucket = buckets[0]
+            if not bucket:
+                bucket = self._refill()
+            index = min(range(len(bucket)), key=lambda i: bucket[i][1])
+            bucket[index], bucket[-1] = bucket[-1], bucket[index]
+            _, priority, node = bucket.pop()
+            self._entries -= 1
+            if best.get(node) == priority:
+                del best[node]
+                self.pops += 1
+                return priority, node
+            self.stale_pops += 1
+
+    def _insert(self, entry: tuple):
+        """Places an entry in the bucket matching its key."""
+        index = (entry[0] ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append(entry)
+
+    def _refill(self) -> list:
+        """Moves the entries of the first non-empty bucket down and returns bucket 0."""
+        buckets = self._buckets
+        for index in range(1, len(buckets)):
+            if buckets[index]:
+                break
+        else:
+            raise IndexError("pop from an empty priority queue")
+        entries = buckets[index]
+        buckets[index] = []
+        self._last = min(entry[0] for entry in entries)
+        for entry in entries:
+            self._insert(entry)
+        return buckets[0]
+
+
+_QUEUE_CLASSES = {
+    QUEUE_HEAPQ: HeapQueue,
+    QUEUE_INDEXED: IndexedBinaryHeap,
+    QUEUE_PAIRING: PairingHeap,
+    QUEUE_RADIX: RadixHeap,
+}
+
+
+def make_priority_queue(kind: str = QUEUE_HEAPQ, **options) -> PriorityQueue:
+    """Creates an empty priority queue.
+
+    Args:
+        kind (str, optional): The queue kind, one of `PRIORITY_QUEUES`. Defaults to "heapq".
+        **options: Keyword arguments for the queue class, such as `scale` for "radix".
+
+    Returns:
+        PriorityQueue: The new queue.
+
+    Raises:
+        ValueError: If the kind is not supported.
+    """
+    return _QUEUE_CLASSES[validate_priority_queue(kind)](**options)
+
+
+def validate_priority_queue(kind: str) -> str:
+    """Checks that a priority queue kind is supported.
+
+    Args:
+        kind (str): The requested queue kind.
+
+    Returns:
+        str: The queue kind, unchanged.
+
+    Raises:
+        ValueError: If the kind is not one of `PRIORITY_QUEUES`.
+    """
+    if kind not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue '{kind}'. Expected one of: {', '.join(PRIORITY_QUEUES)}")
+    return kind
@@ -0,0 +1,257 @@
+"""
+Profiling Module
+
+Profiles calls per query phase and writes flamegraph-ready output.
+
+A `Profiler` runs a function (or awaits a coroutine function) under `cProfile`, a
+statistical sampler, or both. The phases come from the timing records of
+`core.decorators`: whenever a timed call with a phase starts or ends, the profiler
+switches to the `cProfile.Profile` of that phase and tags later samples with it.
+Code that runs outside any phase is attributed to "other".
+
+For every profiled name and phase it writes:
+
+- `<name>_<phase>.pstats`: `cProfile` statistics, readable with `pstats` or tools such
+  as snakeviz.
+- `<name>_<phase>.collapsed`: sampled stacks in the collapsed format of
+  `flamegraph.pl`, speedscope and inferno (`frame;frame;frame count` per line).
+
+plus `<name>.collapsed` with the phase as the root frame of every stack.
+
+The sampler is a thread that reads the stack of the profiled thread every
+`interval` seconds. While it runs, the interpreter's switch interval is lowered to
+the sampling interval, so the sampler gets the GIL in time during CPU-bound work.
+
+Classes:
+    Profiler: Profiles calls and writes their profiles per phase.
+"""
+
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+from core.decorators import set_phase_hook
+
+#: Default directory of the written profiles.
+PROFILE_DIR = "results/profiles"
+
+#: Profiling modes accepted by `Profiler`.
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+#: Phase of the code that runs outside every timed phase.
+PHASE_OTHER = "other"
+
+
+class Profiler:
+    """Profiles calls and writes their profiles per phase.
+
+    Only one call can be profiled at a time, since phase changes are reported
+    through a single hook.
+
+    Attributes:
+        output_dir (str): The directory the profiles are written to.
+        modes (tuple): The enabled modes, a subset of `MODES`.
+        interval (float): The sampling interval in seconds.
+        files (list): Paths of all files written so far.
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR, modes=MODES, interval: float = 0.001):
+        """Initializes the Profiler.
+
+        Args:
+            output_dir (str, optional): The directory for the profiles. Defaults to `PROFILE_DIR`.
+            modes (Iterable[str], optional): The modes to enable. Defaults to both.
+            interval (float, optional): The sampling interval in seconds. Defaults to 0.001.
+
+        Raises:
+            ValueError: If a mode is unknown or the interval is not positive.
+        """
+        modes = tuple(modes)
+        unknown = [mode for mode in modes if mode not in MODES]
+        if unknown or not modes:
+            raise ValueError(f"Unsupported profiling modes: {', '.join(unknown) or 'none'}.")
+        if interval <= 0:
+            raise ValueError("The sampling interval must be positive.")
+        self.output_dir = output_dir
+        self.modes = modes
+        self.interval = interval
+        self.files = []
+        self._phase = PHASE_OTHER
+        self._profiles = {}
+        self._samples = Counter()
+        self._root = None
+        self._thread_id = None
+        self._stop = None
+        self._sampler = None
+        self._switch_interval = None
+        self._previous_hook = None
+
+    def call(self, name: str, function, *args, **kwargs):
+        """
+        Calls a function under the profiler and writes its profiles.
+
+        Args:
+            name (str): The name of the profiles, such as the algorithm name.
+            function (Callable): The function to call.
+            *args: Positional arguments for `function`.
+            **kwargs: Keyword arguments for `function`.
+
+        Returns:
+            Any: The return value of `function`.
+        """
+        self._start(sys._getframe())
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._stop_profiling(name)
+
+    async def call_async(self, name: str, function, *args, **kwargs):
+        """
+        Awaits a coroutine function under the profiler and writes its profiles.
+
+        Tasks that run on the event loop while the coroutine is suspended are included
+        in the `cProfile` statistics, but not in the samples.
+
+        Args:
+            name (str): The name of the profiles.
+            function (Callable): The coroutine function to await.
+            *args: Positional arguments for `function`.
+            **kwargs: Keyword arguments for `function`.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        self._start(sys._getframe())
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            self._stop_profiling(name)
+
+    def _start(self, root):
+        """
+        Starts profiling in the current thread.
+
+        Args:
+            root (frame): The frame of the profiling call; samples only keep the frames below it.
+
+        Raises:
+            RuntimeError: If another call is being profiled.
+        """
+        if self._root is not None:
+            raise RuntimeError("A call is already being profiled.")
+        self._root = root
+        self._thread_id = threading.get_ident()
+        self._phase = PHASE_OTHER
+        self._profiles = {}
+        self._samples = Counter()
+        self._previous_hook = set_phase_hook(self._switch)
+        if MODE_SAMPLING in self.modes:
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, self.interval))
+            self._stop = threading.Event()
+            self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+            self._sampler.start()
+        self._switch(None)
+
+    def _stop_profiling(self, name: str):
+        """
+        Stops profiling and writes the profiles.
+
+        Args:
+            name (str): The name of the profiles.
+        """
+        if self._stop is not None:
+            self._stop.set()
+        current = self._profiles.get(self._phase)
+        if current is not None:
+            current.disable()
+        set_phase_hook(self._previous_hook)
+        if self._stop is not None:
+            self._sampler.join()
+            sys.setswitchinterval(self._switch_interval)
+            self._stop = None
+        self._root = None
+        self._write(name)
+
+    def _switch(self, phase):
+        """
+        Attributes the following work to a phase; the phase hook of the profiler.
+
+        Args:
+            phase (str | None): The phase, or None for code outside every phase.
+        """
+        phase = phase or PHASE_OTHER
+        if MODE_CPROFILE in self.modes:
+            current = self._profiles.get(self._phase)
+            if current is not None:
+                current.disable()
+            profile = self._profiles.get(phase)
+            if profile is None:
+                profile = self._profiles[phase] = cProfile.Profile()
+            profile.enable()
+        self._phase = phase
+
+    def _sample(self):
+        """Collects the stack of the profiled thread every `interval` seconds until stopped."""
+        root, thread_id = self._root, self._thread_id
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None and frame is not root:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            # Outside the profiled call, e.g. while an event loop runs other tasks.
+            if frame is root and stack:
+                self._samples[(self._phase, ";".join(reversed(stack)))] += 1
+
+    def _write(self, name: str):
+        """
+        Writes the statistics and collapsed stacks of the last profiled call.
+
+        Args:
+            name (str): The name of the profiles.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        slug = "".join(character if character.isalnum() else "_" for character in name.replace("*", "_star"))
+        slug = slug.strip("_").lower()
+        for phase, profile in self._profiles.items():
+            profile.create_stats()
+            if profile.stats:
+                self._add_file(f"{slug}_{phase}.pstats", profile.dump_stats)
+
+        samples = sorted(self._samples.items())
+        phases = sorted({phase for phase, _ in self._samples})
+        for phase in phases:
+            lines = [f"{stack} {count}" for (sampled, stack), count in samples if sampled == phase]
+            self._add_file(f"{slug}_{phase}.collapsed", lambda path: self._write_lines(path, lines))
+        if phases:
+            lines = [f"{phase};{stack} {count}" for (phase, stack), count in samples]
+            self._add_file(f"{slug}.collapsed", lambda path: self._write_lines(path, lines))
+
+    def _add_file(self, filename: str, write):
+        """
+        Writes one output file and records its path.
+
+        Args:
+            filename (str): The file name in `output_dir`.
+            write (Callable[[str], None]): Writes the file at the given path.
+        """
+        path = os.path.join(self.output_dir, filename)
+        write(path)
+        self.files.append(path)
+
+    @staticmethod
+    def _write_lines(path: str, lines: list):
+        """
+        Writes lines to a text file.
+
+        Args:
+            path (str): The output file.
+            lines (list): The lines, without line breaks.
+        """
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
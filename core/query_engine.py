@@ -0,0 +1,332 @@
+"""
+Query Engine Module
+
+Answers batches of point-to-point routing queries on a pool of worker processes.
+
+The compact `CSRGraph` arrays of the graph (and optionally the arrays of a
+`ContractionHierarchy`) are copied once into shared memory. Every worker attaches
+them when it starts, so starting the pool and dispatching queries never pickles the
+graph; only the queries and the found node paths cross process boundaries. Queries
+are sent in batches to amortize the inter-process round trip, and results are
+yielded as soon as their batch completes.
+
+The engine adds no searches of its own: every process answers queries with the
+`run` method of the CSR search classes (`CSRDijkstraAlgorithm`, `CSRAStarAlgorithm`
+and the level-synchronous `CSRBFSAlgorithm`) bound to its copy of the graph or with
+`ContractionHierarchy.query`, and distance matrix rows with `single_source_dijkstra`.
+
+Classes:
+    QueryResult: The answer to one query.
+    QueryEngine: The worker pool and the shared graph.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from core.contraction_hierarchy import ContractionHierarchy
+from core.csr_graph import CSRGraph
+from core.path import Path
+from core.shared_arrays import SharedArrays, attach_shared_arrays
+from core.shortest_paths import single_source_dijkstra
+
+QUERY_DIJKSTRA = "dijkstra"
+QUERY_A_STAR = "a_star"
+QUERY_BFS = "bfs"
+QUERY_CONTRACTION_HIERARCHIES = "contraction_hierarchies"
+QUERY_ALGORITHMS = (QUERY_DIJKSTRA, QUERY_A_STAR, QUERY_BFS, QUERY_CONTRACTION_HIERARCHIES)
+
+_CSR_ARRAYS = ("node_ids", "offsets", "targets", "weights", "keys", "lengths", "x", "y")
+_HIERARCHY_ARRAYS = (
+    "rank", "up_offsets", "up_targets", "up_weights", "up_middles",
+    "down_offsets", "down_sources", "down_weights", "down_middles",
+)
+
+# Graph and hierarchy rebuilt by each pool worker from the shared arrays.
+_WORKER_CONTEXT = {}
+
+
+class QueryResult:
+    """
+    The answer to one routing query.
+
+    Attributes:
+        index (int): Position of the query in the batch passed to `QueryEngine.run`.
+        algorithm (str): The algorithm that answered the query.
+        start (Any): The start node identifier.
+        end (Any): The end node identifier.
+        path (Path): The found path, empty if the end node is unreachable.
+        seconds (float): The time the worker spent answering the query.
+    """
+
+    def __init__(self, index: int, algorithm: str, start, end, path: Path, seconds: float):
+        """
+        Initializes the QueryResult.
+
+        Args:
+            index (int): Position of the query in its batch.
+            algorithm (str): The algorithm that answered the query.
+            start (Any): The start node identifier.
+            end (Any): The end node identifier.
+            path (Path): The found path.
+            seconds (float): The search time.
+        """
+        self.index = index
+        self.algorithm = algorithm
+        self.start = start
+        self.end = end
+        self.path = path
+        self.seconds = seconds
+
+    @property
+    def cost(self) -> float:
+        """float: The cost of the found path, infinity if there is none."""
+        return self.path.cost
+
+
+class QueryEngine:
+    """Process pool answering `(algorithm, start, end)` queries against one graph.
+
+    With `workers=0` the queries run in the calling process, which is useful for
+    debugging and for graphs too small to be worth the inter-process traffic. Use
+    the engine as a context manager, or call `close`, to stop the pool and release
+    the shared memory.
+
+    Attributes:
+        graph (networkx.MultiDiGraph): The graph being queried.
+        csr (CSRGraph): Its compact representation, shared with the workers.
+        hierarchy (ContractionHierarchy): The hierarchy for "contraction_hierarchies"
+            queries, or None if those are not supported.
+        workers (int): The number of worker processes, 0 for in-process execution.
+        batch_size (int): The number of queries sent to a worker at a time.
+    """
+
+    def __init__(self, graph, workers: int = None, batch_size: int = 64, hierarchy: ContractionHierarchy = None):
+        """Shares the graph and starts the worker pool.
+
+        Args:
+            graph (networkx.MultiDiGraph): The weighted graph to query.
+            workers (int, optional): The number of worker processes. Defaults to the
+                number of CPUs.
+            batch_size (int, optional): The number of queries per dispatched batch.
+                Defaults to 64.
+            hierarchy (ContractionHierarchy, optional): A hierarchy of the graph, which
+                enables "contraction_hierarchies" queries. Defaults to None.
+
+        Raises:
+            ValueError: If `workers` is negative, `batch_size` is not positive, or node
+                identifiers are not numeric while workers are requested.
+        """
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers < 0:
+            raise ValueError("workers must not be negative.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        self.graph = graph
+        self.csr = CSRGraph.for_graph(graph)
+        self.hierarchy = hierarchy
+        self.workers = workers
+        self.batch_size = batch_size
+        self._context = {"csr": self.csr, "hierarchy": hierarchy}
+        self._shared = None
+        self._pool = None
+
+        if workers:
+            if self.csr.node_ids.dtype == object:
+                raise ValueError("Node identifiers must be numeric to share the graph with workers.")
+            self._shared = SharedArrays({
+                **{name: getattr(self.csr, name) for name in _CSR_ARRAYS},
+                **({f"ch_{name}": getattr(hierarchy, name) for name in _HIERARCHY_ARRAYS} if hierarchy else {}),
+            })
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach_worker, initargs=(self._shared.specs,)
+            )
+            # Start the workers now rather than on the first query, so they neither delay it
+            # nor inherit sockets or files the caller opens in the meantime.
+            for future in [self._pool.submit(os.getpid) for _ in range(workers)]:
+                future.result()
+
+    def __enter__(self):
+        """Returns the engine itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stops the pool and releases the shared memory."""
+        self.close()
+
+    def close(self):
+        """Shuts the process pool down and releases the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def run(self, queries):
+        """Answers a batch of queries, yielding each result as soon as it is available.
+
+        Results of different dispatched batches arrive in completion order, not in the
+        order of `queries`; use `QueryResult.index` to match them up.
+
+        Args:
+            queries (Iterable[tuple]): `(algorithm, start, end)` tuples, with `algorithm`
+                one of `QUERY_ALGORITHMS`.
+
+        Yields:
+            QueryResult: The answer to one query.
+
+        Raises:
+            ValueError: If an algorithm is unknown, or "contraction_hierarchies" is
+                requested without a hierarchy.
+            KeyError: If a node is not in the graph.
+        """
+        queries = list(queries)
+        tasks = [(position, algorithm, *self.validate(algorithm, start, end))
+                 for position, (algorithm, start, end) in enumerate(queries)]
+
+        for answers in self._dispatch(_run_batch, _run_shared_batch, tasks):
+            for position, path, seconds in answers:
+                algorithm, start, end = queries[position]
+                yield QueryResult(position, algorithm, start, end, path, seconds)
+
+    def query(self, algorithm: str, start, end) -> QueryResult:
+        """Answers a single query.
+
+        Args:
+            algorithm (str): One of `QUERY_ALGORITHMS`.
+            start (Any): The start node identifier.
+            end (Any): The end node identifier.
+
+        Returns:
+            QueryResult: The answer.
+        """
+        return next(self.run([(algorithm, start, end)]))
+
+    def validate(self, algorithm: str, start, end) -> tuple:
+        """Checks a query and translates its nodes to dense indices.
+
+        Args:
+            algorithm (str): One of `QUERY_ALGORITHMS`.
+            start (Any): The start node identifier.
+            end (Any): The end node identifier.
+
+        Returns:
+            tuple: The dense indices of the start and end nodes.
+
+        Raises:
+            ValueError: If the algorithm is unknown, or "contraction_hierarchies" is
+                requested without a hierarchy.
+            KeyError: If a node is not in the graph.
+        """
+        if algorithm not in QUERY_ALGORITHMS:
+            raise ValueError(f"Unknown query algorithm '{algorithm}'. Expected one of {QUERY_ALGORITHMS}.")
+        if algorithm == QUERY_CONTRACTION_HIERARCHIES and self.hierarchy is None:
+            raise ValueError("Contraction hierarchy queries require an engine built with a hierarchy.")
+        return self.csr.index[start], self.csr.index[end]
+
+    def distance_matrix(self, sources, targets) -> np.ndarray:
+        """Computes shortest path costs from every source to every target node.
+
+        Each source is one Dijkstra search that stops once all targets are settled;
+        the searches are distributed over the workers like queries.
+
+        Args:
+            sources (Sequence): Source node identifiers.
+            targets (Sequence): Target node identifiers.
+
+        Returns:
+            numpy.ndarray: A `len(sources) x len(targets)` array of costs, infinity for
+                unreachable pairs.
+
+        Raises:
+            KeyError: If a node is not in the graph.
+        """
+        index = self.csr.index
+        target_indices = [index[target] for target in targets]
+        tasks = [(row, index[source], target_indices) for row, source in enumerate(sources)]
+        matrix = np.full((len(tasks), len(target_indices)), np.inf)
+        for rows in self._dispatch(_run_rows, _run_shared_rows, tasks):
+            for row, distances in rows:
+                matrix[row] = distances
+        return matrix
+
+    def _dispatch(self, run, run_shared, tasks: list):
+        """Runs tasks in batches, in process or on the pool, yielding each batch's answers as it completes."""
+        batches = [tasks[i:i + self.batch_size] for i in range(len(tasks))[::self.batch_size]]
+        if self._pool is None:
+            for batch in batches:
+                yield run(self._context, batch)
+            return
+        futures = [self._pool.submit(run_shared, batch) for batch in batches]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _attach_worker(specs: dict):
+    """Pool initializer rebuilding the graph and hierarchy from the shared arrays."""
+    arrays = attach_shared_arrays(specs)
+    _WORKER_CONTEXT["csr"] = CSRGraph(*(arrays[name] for name in _CSR_ARRAYS))
+    _WORKER_CONTEXT["hierarchy"] = None
+    if "ch_rank" in arrays:
+        ch = {name: arrays[f"ch_{name}"] for name in _HIERARCHY_ARRAYS}
+        _WORKER_CONTEXT["hierarchy"] = ContractionHierarchy(
+            arrays["node_ids"],
+            ch["rank"],
+            (ch["up_offsets"], ch["up_targets"], ch["up_weights"], ch["up_middles"]),
+            (ch["down_offsets"], ch["down_sources"], ch["down_weights"], ch["down_middles"]),
+        )
+
+
+def _run_shared_batch(batch: list) -> list:
+    """Pool task answering a batch of queries against the shared graph."""
+    return _run_batch(_WORKER_CONTEXT, batch)
+
+
+def _run_shared_rows(batch: list) -> list:
+    """Pool task computing distance matrix rows against the shared graph."""
+    return _run_rows(_WORKER_CONTEXT, batch)
+
+
+def _run_rows(context: dict, batch: list) -> list:
+    """Computes `(row, source, targets)` distance matrix rows on dense node indices."""
+    rows = []
+    for row, source, targets in batch:
+        distances = single_source_dijkstra(context["csr"], source, targets=targets)[0]
+        rows.append((row, distances[targets]))
+    return rows
+
+
+def _run_batch(context: dict, batch: list) -> list:
+    """Answers `(position, algorithm, source, target)` queries on dense node indices.
+
+    Returns:
+        list: `(position, path, seconds)` per query.
+    """
+    searches = context.get("searches")
+    if searches is None:
+        searches = context["searches"] = _bind_searches(context)
+    node_ids = context["csr"].node_ids
+    answers = []
+    for position, algorithm, source, target in batch:
+        start = time.perf_counter()
+        path = searches[algorithm](node_ids[source].item(), node_ids[target].item())
+        answers.append((position, path, time.perf_counter() - start))
+    return answers
+
+
+def _bind_searches(context: dict) -> dict:
+    """Binds the `run` method of each CSR search class to the graph of a context, keyed by query algorithm."""
+    from algorithms import CSRAStarAlgorithm, CSRBFSAlgorithm, CSRDijkstraAlgorithm
+
+    csr, hierarchy = context["csr"], context["hierarchy"]
+    searches = {
+        QUERY_DIJKSTRA: CSRDijkstraAlgorithm(csr, None, None).run,
+        QUERY_A_STAR: CSRAStarAlgorithm(csr, None, None).run,
+        QUERY_BFS: CSRBFSAlgorithm(csr, None, None, level_synchronous=True).run,
+    }
+    if hierarchy is not None:
+        searches[QUERY_CONTRACTION_HIERARCHIES] = lambda start, end: Path.from_csr(
+            csr, hierarchy.query(csr.index[start], csr.index[end])[1]
+        )
+    return searches
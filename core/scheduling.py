@@ -0,0 +1,145 @@
+"""
+Scheduling Module
+
+Cooperative time-slicing for searches that run on an asyncio event loop.
+
+The searches are asynchronous generators, but without visualization they never
+await, so a long search would hold the event loop until it finishes. A `TimeSlice`
+counts the steps of a search and tells it when to hand control back to the loop
+(after a number of steps or an amount of time) and when its deadline has passed.
+Yielding goes through `asyncio.sleep(0)`, which is also where a cancelled task
+receives its `CancelledError`.
+
+Classes:
+    TimeSlice: Step and time budget deciding when a search yields to the event loop or stops.
+
+Functions:
+    run_with_deadline: Runs one search with a deadline and returns its best-known path.
+"""
+
+import asyncio
+import math
+import time
+
+
+class TimeSlice:
+    """Step and time budget of a cooperative search.
+
+    A search calls `tick` once per step. The call is a counter increment most of
+    the time: the clock is only read every `CHECK_INTERVAL` steps, so a slice may
+    overrun `seconds` by that many steps. `tick` returns True when the search has
+    to pause (the slice is used up) or stop (`expired`, the deadline has passed).
+
+    Attributes:
+        seconds (float | None): The time after which a search yields to the event loop, or None.
+        steps (int | None): The number of steps after which a search yields, or None.
+        timeout (float | None): The time a search may take before it stops, or None for no deadline.
+        deadline (float): The `time.perf_counter` value at which the current search stops.
+        expired (bool): Whether the current search has passed its deadline.
+        step_count (int): The number of steps of the current search.
+        pauses (int): The number of times the current search yielded to the event loop.
+    """
+
+    #: Number of steps between two clock reads.
+    CHECK_INTERVAL = 32
+
+    def __init__(self, seconds: float = 0.005, steps: int = None, timeout: float = None):
+        """Initializes the TimeSlice.
+
+        Args:
+            seconds (float, optional): The time slice in seconds, or None to only count steps.
+                Defaults to 0.005.
+            steps (int, optional): The step budget of a slice, or None to only measure time.
+                Defaults to None.
+            timeout (float, optional): The deadline of every search in seconds from its start,
+                or None for no deadline. Defaults to None.
+
+        Raises:
+            ValueError: If a budget or the timeout is not positive.
+        """
+        if seconds is not None and seconds <= 0:
+            raise ValueError("The time slice must be positive.")
+        if steps is not None and steps < 1:
+            raise ValueError("The step budget must be at least 1.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout must be positive.")
+        self.seconds = seconds
+        self.steps = steps
+        self.timeout = timeout
+        self.start()
+
+    def start(self):
+        """Starts the budget of a new search, including its deadline."""
+        now = time.perf_counter()
+        self.deadline = now + self.timeout if self.timeout is not None else math.inf
+        self.expired = False
+        self.step_count = 0
+        self.pauses = 0
+        self._begin_slice(now)
+
+    def _begin_slice(self, now: float):
+        """Starts a new slice at the current step.
+
+        Args:
+            now (float): The current `time.perf_counter` value.
+        """
+        self._slice_end = now + self.seconds if self.seconds is not None else math.inf
+        self._step_end = self.step_count + self.steps if self.steps is not None else math.inf
+        timed = self.seconds is not None or self.timeout is not None
+        self._next_check = min(self.step_count + self.CHECK_INTERVAL if timed else math.inf, self._step_end)
+
+    def tick(self) -> bool:
+        """Counts one search step.
+
+        Returns:
+            bool: True if the search has to pause or, when `expired` is set, stop.
+        """
+        self.step_count += 1
+        if self.step_count < self._next_check:
+            return False
+        now = time.perf_counter()
+        if now >= self.deadline:
+            self.expired = True
+            return True
+        if self.step_count >= self._step_end or now >= self._slice_end:
+            return True
+        self._next_check = min(self.step_count + self.CHECK_INTERVAL, self._step_end)
+        return False
+
+    async def pause(self):
+        """Yields to the event loop and starts the next slice.
+
+        Raises:
+            asyncio.CancelledError: If the task running the search was cancelled.
+        """
+        await asyncio.sleep(0)
+        self.pauses += 1
+        self._begin_slice(time.perf_counter())
+
+
+async def run_with_deadline(algorithm, start: int, end: int, timeout: float, plot: bool = False):
+    """
+    Runs one search with a deadline and returns its best-known path.
+
+    The deadline only applies to this search; the algorithm's own timeout is
+    restored afterwards.
+
+    Args:
+        algorithm (GraphAlgorithm): The algorithm to run.
+        start (int): The starting node.
+        end (int): The target node.
+        timeout (float): The time the search may take, in seconds.
+        plot (bool, optional): Whether to visualize the search. Defaults to False.
+
+    Returns:
+        Path: The path of a complete search, or the best-known path (see
+            `GraphAlgorithm.partial_path`) when the deadline interrupted it.
+    """
+    time_slice = algorithm.time_slice
+    previous = time_slice.timeout
+    time_slice.timeout = timeout
+    try:
+        await algorithm.execute(start, end, plot)
+    finally:
+        time_slice.timeout = previous
+    return algorithm.partial_path(start, end)
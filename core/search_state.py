@@ -0,0 +1,156 @@
+class SearchState:
+    """Per-query search bookkeeping kept outside of the graph.
+
+    Stores, for every node, the best known distance, the predecessor on the best
+    known path, the edge it was reached through and whether the node has been
+    settled. Entries are stamped with
+    the generation that wrote them, and `reset` simply starts a new generation:
+    entries with an older stamp read as "unreached", so resetting costs O(1)
+    instead of rewriting every node, and the graph itself is never modified.
+
+    The state is either dense (list-backed, for dense node indices such as those of
+    a `CSRGraph`) or keyed (dict-backed, for the original node identifiers of a
+    networkx graph). Both expose the same `stamps`, `distances`, `predecessors`,
+    `edges` and `settled` containers, which hot search loops may index directly.
+
+    Attributes:
+        generation (int): The current generation; entries stamped with it are valid.
+        stamps (list | dict): Generation in which each node's distance was last written.
+        distances (list | dict): Best known distance of each node (valid if stamped).
+        predecessors (list | dict): Predecessor of each node on its best known path (valid if stamped).
+        edges (list | dict): Edge from the predecessor through which each node was reached
+            (valid if stamped): the edge key for keyed states, the `CSRGraph` edge position
+            for dense ones, or None if the search did not record it.
+        settled (list | dict): Generation in which each node was settled.
+    """
+
+    def __init__(self, nodes):
+        """Initializes the SearchState.
+
+        Args:
+            nodes (int | Iterable): Either the number of dense node indices, or an
+                iterable of node identifiers.
+        """
+        if isinstance(nodes, int):
+            self.stamps = [0] * nodes
+            self.distances = [float("inf")] * nodes
+            self.predecessors = [None] * nodes
+            self.edges = [None] * nodes
+            self.settled = [0] * nodes
+        else:
+            keys = list(nodes)
+            self.stamps = dict.fromkeys(keys, 0)
+            self.distances = dict.fromkeys(keys, float("inf"))
+            self.predecessors = dict.fromkeys(keys)
+            self.edges = dict.fromkeys(keys)
+            self.settled = dict.fromkeys(keys, 0)
+        self.generation = 1
+
+    @property
+    def size(self) -> int:
+        """int: The number of nodes the state can hold."""
+        return len(self.stamps)
+
+    def reset(self):
+        """Invalidates all entries in constant time by starting a new generation."""
+        self.generation += 1
+
+    def is_reached(self, node) -> bool:
+        """Checks whether a distance has been recorded for a node in this generation.
+
+        Args:
+            node (Any): The node identifier or dense index.
+
+        Returns:
+            bool: True if the node has been reached by the current search.
+        """
+        return self.stamps[node] == self.generation
+
+    def distance(self, node) -> float:
+        """Returns the best known distance of a node.
+
+        Args:
+            node (Any): The node identifier or dense index.
+
+        Returns:
+            float: The distance, or infinity if the node has not been reached.
+        """
+        return self.distances[node] if self.stamps[node] == self.generation else float("inf")
+
+    def previous(self, node):
+        """Returns the predecessor of a node on its best known path.
+
+        Args:
+            node (Any): The node identifier or dense index.
+
+        Returns:
+            Any: The predecessor, or None if the node has none in this generation.
+        """
+        return self.predecessors[node] if self.stamps[node] == self.generation else None
+
+    def update(self, node, distance: float, previous=None, edge=None):
+        """Records a new best distance and predecessor for a node.
+
+        Args:
+            node (Any): The node identifier or dense index.
+            distance (float): The new best known distance.
+            previous (Any, optional): The predecessor on the new best path. Defaults to None.
+            edge (Any, optional): The edge key or position from `previous` to `node`. Defaults to None.
+        """
+        self.stamps[node] = self.generation
+        self.distances[node] = distance
+        self.predecessors[node] = previous
+        self.edges[node] = edge
+
+    def is_settled(self, node) -> bool:
+        """Checks whether a node has been settled in this generation.
+
+        Args:
+            node (Any): The node identifier or dense index.
+
+        Returns:
+            bool: True if the node has been settled.
+        """
+        return self.settled[node] == self.generation
+
+    def settle(self, node):
+        """Marks a node as settled in this generation.
+
+        Args:
+            node (Any): The node identifier or dense index.
+        """
+        self.settled[node] = self.generation
+
+    def path(self, start, end) -> list:
+        """Follows predecessors from `end` back to `start`.
+
+        Args:
+            start (Any): The first node of the path.
+            end (Any): The last node of the path.
+
+        Returns:
+            list: The nodes from `start` to `end`, or an empty list if `end` was not reached from `start`.
+        """
+        return self.trace(start, end)[0]
+
+    def trace(self, start, end) -> tuple:
+        """Follows predecessors from `end` back to `start`, collecting the recorded edges.
+
+        Args:
+            start (Any): The first node of the path.
+            end (Any): The last node of the path.
+
+        Returns:
+            tuple: `(nodes, edges)`, the nodes from `start` to `end` and the recorded edge
+                into each of `nodes[1:]`; two empty lists if `end` was not reached from `start`.
+        """
+        nodes, edges = [end], []
+        while nodes[-1] != start:
+            previous = self.previous(nodes[-1])
+            if previous is None:
+                return [], []
+            edges.append(self.edges[nodes[-1]])
+            nodes.append(previous)
+        nodes.reverse()
+        edges.reverse()
+        return nodes, edges
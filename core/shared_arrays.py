@@ -0,0 +1,96 @@
+"""
+Shared Arrays Module
+
+Places NumPy arrays in named shared memory segments, so that pool worker processes
+can read them without copying or pickling.
+
+Classes:
+    SharedArrays: Owns a set of arrays copied into shared memory.
+
+Functions:
+    attach_shared_arrays: Attaches the arrays described by `SharedArrays.specs` in another process.
+"""
+
+from multiprocessing import shared_memory
+import numpy as np
+
+# Segments attached by this process; they must stay open while their arrays are in use.
+_ATTACHED_SEGMENTS = []
+
+
+class SharedArrays:
+    """A set of named NumPy arrays living in shared memory.
+
+    The creating process owns the segments and releases them in `close`; other
+    processes attach them with `attach_shared_arrays(shared.specs)`, typically in a
+    pool initializer. Use the object as a context manager, or call `close`.
+
+    Attributes:
+        arrays (dict): The shared array views, keyed by name.
+    """
+
+    def __init__(self, arrays: dict):
+        """Copies arrays into new shared memory segments.
+
+        Args:
+            arrays (dict): The arrays to share, keyed by name.
+        """
+        self.arrays = {}
+        self._segments = []
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+            shared[...] = array
+            self._segments.append(segment)
+            self.arrays[name] = shared
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Returns the shared array with the given name."""
+        return self.arrays[name]
+
+    def __enter__(self):
+        """Returns the shared arrays themselves."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Releases the shared memory."""
+        self.close()
+
+    @property
+    def specs(self) -> dict:
+        """dict: `(segment name, shape, dtype)` of every array, keyed by name; picklable."""
+        return {
+            name: (segment.name, array.shape, array.dtype.str)
+            for (name, array), segment in zip(self.arrays.items(), self._segments)
+        }
+
+    def close(self):
+        """Releases the shared memory segments; the arrays must not be used afterwards."""
+        self.arrays = {}
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+
+def attach_shared_arrays(specs: dict) -> dict:
+    """Attaches shared arrays created by another process.
+
+    Attached processes share the resource tracker of the owning process, which
+    unlinks the segments in `SharedArrays.close`.
+
+    Args:
+        specs (dict): The `SharedArrays.specs` of the owner.
+
+    Returns:
+        dict: Read-only views of the shared arrays, keyed by name.
+    """
+    arrays = {}
+    for name, (segment_name, shape, dtype) in specs.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        _ATTACHED_SEGMENTS.append(segment)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+        array.flags.writeable = False
+        arrays[name] = array
+    return arrays
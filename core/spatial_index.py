@@ -0,0 +1,287 @@
+"""
+Spatial Index Module
+
+Snaps coordinates to the nearest graph node or edge with a uniform grid index.
+
+Node coordinates are projected once to local metres (an equirectangular projection
+around the mean latitude, accurate to well under a metre at city and voivodeship
+scale) and bucketed into square grid cells; every edge segment is registered in all
+cells its bounding box touches. A query looks at the cells in growing square rings
+around its own cell and stops as soon as nothing outside the visited block can be
+closer than the best candidate found. Queries are processed as arrays, so snapping
+thousands of points costs a handful of NumPy operations per ring rather than a
+Python loop per point.
+
+Classes:
+    SpatialIndex: Grid index over the nodes and edge segments of a graph.
+"""
+
+import math
+import numpy as np
+from core.csr_graph import CSRGraph
+from core.heuristics import EARTH_RADIUS_M
+
+#: Key under which the index is kept in `graph.graph`, so graph snapshots persist it.
+SPATIAL_INDEX_KEY = "spatial_index"
+
+_METRES_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
+
+class SpatialIndex:
+    """Uniform grid index for nearest-node and nearest-edge lookups.
+
+    Edges are indexed as straight segments between their end nodes, so snapping to a
+    curved street uses its chord. Nodes without coordinates are not indexed.
+
+    Attributes:
+        node_ids (numpy.ndarray): Node identifier of every dense node index.
+        cell_size (float): The side of a grid cell in metres.
+        edges (numpy.ndarray): `(u, v, key)` rows of the indexed edges, with node identifiers.
+    """
+
+    def __init__(self, node_ids, x, y, edge_sources, edge_targets, edge_keys, cell_size: float = None):
+        """Builds the index.
+
+        Args:
+            node_ids (numpy.ndarray): Node identifier of every dense node index.
+            x (numpy.ndarray): Node longitudes, NaN where unknown.
+            y (numpy.ndarray): Node latitudes, NaN where unknown.
+            edge_sources (numpy.ndarray): Dense index of the source node of every edge.
+            edge_targets (numpy.ndarray): Dense index of the target node of every edge.
+            edge_keys (numpy.ndarray): MultiDiGraph key of every edge.
+            cell_size (float, optional): The grid cell side in metres. Defaults to a size
+                giving a few nodes per occupied cell.
+        """
+        self.node_ids = np.asarray(node_ids)
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        located = np.isfinite(x) & np.isfinite(y)
+        self._lat0 = float(np.mean(y[located])) if located.any() else 0.0
+        self._cos_lat0 = math.cos(math.radians(self._lat0))
+        self._px, self._py = self._project(x, y)
+
+        nodes = np.flatnonzero(located)
+        if nodes.size:
+            self._min_x, self._min_y = float(self._px[nodes].min()), float(self._py[nodes].min())
+            width = float(self._px[nodes].max()) - self._min_x
+            height = float(self._py[nodes].max()) - self._min_y
+        else:
+            self._min_x = self._min_y = width = height = 0.0
+        if cell_size is None:
+            cell_size = 2 * math.sqrt(width * height / nodes.size) if nodes.size and width * height > 0 else 0.0
+            cell_size = cell_size or max(width, height, 1.0)
+        self.cell_size = float(cell_size)
+        self._columns = int(width // self.cell_size) + 1
+        self._rows = int(height // self.cell_size) + 1
+
+        cx, cy = self._cells(self._px[nodes], self._py[nodes])
+        self._node_offsets, self._node_items = self._bucket(cy * self._columns + cx, nodes)
+
+        segments = located[edge_sources] & located[edge_targets]
+        self._sources = np.asarray(edge_sources)[segments].astype(np.int64)
+        self._targets = np.asarray(edge_targets)[segments].astype(np.int64)
+        self.edges = np.column_stack((
+            self.node_ids[self._sources], self.node_ids[self._targets], np.asarray(edge_keys)[segments]
+        )) if self._sources.size else np.empty((0, 3), dtype=np.int64)
+        self._segment_offsets, self._segment_items = self._bucket_segments()
+
+    @classmethod
+    def from_graph(cls, graph, cell_size: float = None):
+        """Builds the index of a graph from its node `x`/`y` attributes.
+
+        Args:
+            graph (networkx.MultiDiGraph): The graph to index.
+            cell_size (float, optional): The grid cell side in metres. Defaults to automatic.
+
+        Returns:
+            SpatialIndex: The new index.
+        """
+        csr = CSRGraph.for_graph(graph)
+        sources = np.repeat(np.arange(csr.node_count), np.diff(csr.offsets))
+        return cls(csr.node_ids, csr.x, csr.y, sources, csr.targets, csr.keys, cell_size)
+
+    @classmethod
+    def for_graph(cls, graph):
+        """Returns the index stored in a graph, building and storing it if needed.
+
+        The index lives in `graph.graph["spatial_index"]`, so it is pickled together
+        with the graph into snapshots and loaded back with it. An index whose node set
+        no longer matches the graph is rebuilt.
+
+        Args:
+            graph (networkx.MultiDiGraph): The graph to index.
+
+        Returns:
+            SpatialIndex: The stored or new index.
+        """
+        index = graph.graph.get(SPATIAL_INDEX_KEY)
+        if not isinstance(index, cls) or len(index.node_ids) != len(graph):
+            index = cls.from_graph(graph)
+            graph.graph[SPATIAL_INDEX_KEY] = index
+        return index
+
+    def nearest_nodes(self, x, y, return_distance: bool = False):
+        """Finds the node nearest to each point.
+
+        Args:
+            x (float | Sequence[float]): Longitude(s) of the points.
+            y (float | Sequence[float]): Latitude(s) of the points.
+            return_distance (bool, optional): Whether to also return the distances in metres.
+                Defaults to False.
+
+        Returns:
+            Any | numpy.ndarray | tuple: The node identifier(s), -1 where the index has no
+                nodes, and with `return_distance` also the distance(s) in metres.
+        """
+        scalar = np.ndim(x) == 0
+        qx, qy = self._project(np.atleast_1d(x).astype(np.float64), np.atleast_1d(y).astype(np.float64))
+        px, py = self._px, self._py
+
+        def distances(queries, nodes):
+            return np.hypot(px[nodes] - qx[queries], py[nodes] - qy[queries])
+
+        best, distance = self._search(qx, qy, self._node_offsets, self._node_items, distances)
+        nodes = np.where(best >= 0, self.node_ids[np.maximum(best, 0)], -1)
+        if scalar:
+            nodes, distance = nodes[0].item(), float(distance[0])
+        return (nodes, distance) if return_distance else nodes
+
+    def nearest_edges(self, x, y, return_distance: bool = False):
+        """Finds the edge segment nearest to each point.
+
+        Args:
+            x (float | Sequence[float]): Longitude(s) of the points.
+            y (float | Sequence[float]): Latitude(s) of the points.
+            return_distance (bool, optional): Whether to also return the distances in metres.
+                Defaults to False.
+
+        Returns:
+            tuple: `(edges, positions)`, where `edges` holds the `(u, v, key)` of the
+                nearest edge per point (a single tuple for scalar input, rows of -1 where
+                the index has no edges) and `positions` the fraction along the edge from
+                `u` to `v` of the snapped point. With `return_distance`, the distances in
+                metres follow as a third element.
+        """
+        scalar = np.ndim(x) == 0
+        qx, qy = self._project(np.atleast_1d(x).astype(np.float64), np.atleast_1d(y).astype(np.float64))
+
+        def distances(queries, segments):
+            return self._segment_projection(qx[queries], qy[queries], segments)[1]
+
+        best, distance = self._search(qx, qy, self._segment_offsets, self._segment_items, distances)
+        found = best >= 0
+        positions = np.full(len(best), np.nan)
+        positions[found] = self._segment_projection(qx[found], qy[found], best[found])[0]
+        edges = np.full((len(best), 3), -1, dtype=self.edges.dtype)
+        edges[found] = self.edges[best[found]]
+        if scalar:
+            edges, positions, distance = tuple(edges[0].tolist()), float(positions[0]), float(distance[0])
+        return (edges, positions, distance) if return_distance else (edges, positions)
+
+    def _project(self, x: np.ndarray, y: np.ndarray):
+        """Projects longitudes and latitudes to local metres."""
+        return x * (_METRES_PER_DEGREE * self._cos_lat0), y * _METRES_PER_DEGREE
+
+    def _cells(self, px: np.ndarray, py: np.ndarray):
+        """Returns the (unclipped) grid column and row of projected points."""
+        cx = np.floor((px - self._min_x) / self.cell_size).astype(np.int64)
+        cy = np.floor((py - self._min_y) / self.cell_size).astype(np.int64)
+        return cx, cy
+
+    def _bucket(self, cells: np.ndarray, items: np.ndarray):
+        """Groups items by grid cell into CSR-style `(offsets, items)` arrays."""
+        order = np.argsort(cells, kind="stable")
+        counts = np.bincount(cells, minlength=self._columns * self._rows)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets, np.asarray(items, dtype=np.int64)[order]
+
+    def _bucket_segments(self):
+        """Registers every segment in all grid cells overlapped by its bounding box."""
+        ax, bx = self._px[self._sources], self._px[self._targets]
+        ay, by = self._py[self._sources], self._py[self._targets]
+        x0, y0 = self._cells(np.minimum(ax, bx), np.minimum(ay, by))
+        x1, y1 = self._cells(np.maximum(ax, bx), np.maximum(ay, by))
+        x1, y1 = np.minimum(x1, self._columns - 1), np.minimum(y1, self._rows - 1)
+        widths = x1 - x0 + 1
+        counts = widths * (y1 - y0 + 1)
+
+        segments = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = x0[segments] + local % widths[segments]
+        cy = y0[segments] + local // widths[segments]
+        return self._bucket(cy * self._columns + cx, segments)
+
+    def _segment_projection(self, qx: np.ndarray, qy: np.ndarray, segments: np.ndarray):
+        """Returns the position along and the distance to segments of projected points."""
+        ax, ay = self._px[self._sources[segments]], self._py[self._sources[segments]]
+        dx, dy = self._px[self._targets[segments]] - ax, self._py[self._targets[segments]] - ay
+        squared = dx * dx + dy * dy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(squared > 0, ((qx - ax) * dx + (qy - ay) * dy) / squared, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        return t, np.hypot(ax + t * dx - qx, ay + t * dy - qy)
+
+    def _search(self, qx: np.ndarray, qy: np.ndarray, offsets: np.ndarray, items: np.ndarray, distances):
+        """
+        Runs the ring search for all queries at once.
+
+        Rings are centred on each query's cell, clipped into the grid. After ring `k`
+        every item outside the visited block lies beyond one of its sides that does
+        not coincide with the grid edge, so a query is resolved once its best distance
+        is within the distance to the nearest such side, or once no such side remains.
+        """
+        count = len(qx)
+        best = np.full(count, -1, dtype=np.int64)
+        best_distance = np.full(count, np.inf)
+        if not len(items):
+            return best, best_distance
+
+        columns, rows, cell = self._columns, self._rows, self.cell_size
+        cx, cy = self._cells(qx, qy)
+        cx, cy = np.clip(cx, 0, columns - 1), np.clip(cy, 0, rows - 1)
+        pending = np.arange(count)
+        ring = 0
+        while pending.size:
+            for dx, dy in _ring_offsets(ring):
+                column, row = cx[pending] + dx, cy[pending] + dy
+                inside = (column >= 0) & (column < columns) & (row >= 0) & (row < rows)
+                queries = pending[inside]
+                cells = row[inside] * columns + column[inside]
+                starts = offsets[cells]
+                counts = offsets[cells + 1] - starts
+                total = int(counts.sum())
+                if not total:
+                    continue
+                positions = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+                candidates = items[positions]
+                queries = np.repeat(queries, counts)
+                candidate_distances = distances(queries, candidates)
+
+                order = np.lexsort((candidate_distances, queries))
+                queries, first = np.unique(queries[order], return_index=True)
+                nearest = candidate_distances[order][first]
+                better = nearest < best_distance[queries]
+                best_distance[queries[better]] = nearest[better]
+                best[queries[better]] = candidates[order][first][better]
+
+            # Distance from each query to the block sides that still have cells beyond them.
+            x, y = qx[pending] - self._min_x, qy[pending] - self._min_y
+            left, right = cx[pending] - ring, cx[pending] + ring + 1
+            bottom, top = cy[pending] - ring, cy[pending] + ring + 1
+            bound = np.full(pending.size, np.inf)
+            bound = np.where(left > 0, np.minimum(bound, x - left * cell), bound)
+            bound = np.where(right < columns, np.minimum(bound, right * cell - x), bound)
+            bound = np.where(bottom > 0, np.minimum(bound, y - bottom * cell), bound)
+            bound = np.where(top < rows, np.minimum(bound, top * cell - y), bound)
+            pending = pending[best_distance[pending] > np.maximum(bound, 0.0)]
+            ring += 1
+        return best, best_distance
+
+
+def _ring_offsets(ring: int):
+    """Returns the cell offsets at Chebyshev distance `ring` from a cell."""
+    if ring == 0:
+        return [(0, 0)]
+    offsets = [(dx, dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+    offsets += [(dx, dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+    return offsets
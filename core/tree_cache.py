@@ -0,0 +1,289 @@
+"""
+Shortest Path Tree Cache Module
+
+Keeps resumable single-source Dijkstra searches keyed by source node, so repeated
+queries from the same start node are answered from the tree that is already settled.
+
+Classes:
+    ShortestPathTree: A resumable Dijkstra search from one source node.
+    ShortestPathTreeCache: An LRU cache of shortest path trees with a memory bound.
+"""
+
+import sys
+from array import array
+from collections import OrderedDict
+from core.counters import heap_operations
+from core.csr_graph import CSRGraph
+
+
+class ShortestPathTree:
+    """A single-source Dijkstra search that can be paused and resumed.
+
+    The search only runs until the requested target is settled. Asking for a target
+    beyond the settled radius resumes it from the stored queue, and once a target is
+    settled its distance is a lookup and its path costs O(path length). Distances and
+    predecessors are kept in typed `array`s (8 bytes per node) to keep the memory
+    footprint predictable.
+
+    Attributes:
+        source (int): Dense index of the source node.
+        radius (float): Distance of the most recently settled node; every node closer
+            than this is settled.
+        settled_count (int): Number of settled nodes.
+    """
+
+    def __init__(self, csr, source: int):
+        """Initializes the ShortestPathTree without settling anything.
+
+        Args:
+            csr (CSRGraph): The graph to search.
+            source (int): Dense index of the source node.
+        """
+        n = csr.node_count
+        self.csr = csr
+        self.source = source
+        self.distances = array("d", [float("inf")]) * n
+        self.predecessors = array("q", [-1]) * n
+        self.settled = bytearray(n)
+        self.distances[source] = 0.0
+        self.radius = 0.0
+        self.settled_count = 0
+        self._queue = [(0.0, source)]
+
+    @property
+    def complete(self) -> bool:
+        """bool: Whether every node reachable from the source is settled."""
+        return not self._queue
+
+    @property
+    def nbytes(self) -> int:
+        """int: Approximate memory held by the tree, including the paused queue."""
+        queue_bytes = sys.getsizeof(self._queue) + len(self._queue) * (sys.getsizeof((0.0, 0)) + 24)
+        return (
+            self.distances.itemsize * len(self.distances)
+            + self.predecessors.itemsize * len(self.predecessors)
+            + len(self.settled)
+            + queue_bytes
+        )
+
+    def settle_until(self, target: int, counters=None) -> bool:
+        """Resumes the search until a target node is settled or the search is exhausted.
+
+        Args:
+            target (int): Dense index of the target node.
+            counters (SearchCounters, optional): Counters for the nodes settled, edges
+                relaxed and queue operations of this resumption. Defaults to None.
+
+        Returns:
+            bool: True if the search had to be resumed, False if the target was already settled.
+        """
+        settled = self.settled
+        if settled[target] or not self._queue:
+            return False
+        offsets, targets, weights = self.csr.as_lists()
+        distances, predecessors, queue = self.distances, self.predecessors, self._queue
+        # The entries of a resumed queue were pushed by earlier queries.
+        heappush, heappop = heap_operations(counters, None if self.settled_count else queue)
+        count = self.settled_count
+        relaxed = 0
+        while queue:
+            current_distance, current_node = heappop(queue)
+            if settled[current_node]:
+                continue
+            settled[current_node] = 1
+            count += 1
+            self.radius = current_distance
+            relaxed += offsets[current_node + 1] - offsets[current_node]
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                new_distance = current_distance + weights[edge]
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_node
+                    heappush(queue, (new_distance, neighbor))
+
+            if current_node == target:
+                break
+        if counters is not None:
+            counters.nodes_settled += count - self.settled_count
+            counters.edges_relaxed += relaxed
+        self.settled_count = count
+        return True
+
+    def distance(self, target: int) -> float:
+        """Returns the shortest path cost from the source to a target, searching as far as needed.
+
+        Args:
+            target (int): Dense index of the target node.
+
+        Returns:
+            float: The cost, or infinity if the target is unreachable.
+        """
+        self.settle_until(target)
+        return self.distances[target] if self.settled[target] else float("inf")
+
+    def path(self, target: int) -> list:
+        """Returns the shortest path from the source to a target, searching as far as needed.
+
+        Args:
+            target (int): Dense index of the target node.
+
+        Returns:
+            list: Dense indices from the source to `target`, or an empty list if it is unreachable.
+        """
+        self.settle_until(target)
+        if not self.settled[target]:
+            return []
+        predecessors = self.predecessors
+        path = [target]
+        while path[-1] != self.source:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        return path
+
+
+class ShortestPathTreeCache:
+    """LRU cache of resumable shortest path trees, keyed by source node.
+
+    Trees are evicted least recently used first whenever the total memory of the
+    cached trees exceeds `max_bytes`, or their number exceeds `max_trees`. The tree
+    serving the current query is never evicted. The cache follows the CSR
+    representation of its graph and is cleared when that representation is rebuilt.
+
+    Attributes:
+        graph (networkx.MultiDiGraph): The graph the trees are computed on.
+        max_bytes (int): Memory budget for all cached trees.
+        max_trees (int): Maximum number of cached trees, or None for no limit.
+        hits (int): Queries answered by a cached tree without resuming it.
+        resumes (int): Queries that resumed a cached tree.
+        misses (int): Queries that started a new tree.
+        evictions (int): Trees evicted to respect the limits.
+    """
+
+    def __init__(self, graph, max_bytes: int = 256 * 1024 * 1024, max_trees: int = None):
+        """Initializes an empty ShortestPathTreeCache.
+
+        Args:
+            graph (networkx.MultiDiGraph): The graph the trees are computed on.
+            max_bytes (int, optional): Memory budget for all cached trees. Defaults to 256 MiB.
+            max_trees (int, optional): Maximum number of cached trees. Defaults to None.
+        """
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.max_trees = max_trees
+        self.hits = 0
+        self.resumes = 0
+        self.misses = 0
+        self.evictions = 0
+        self._trees = OrderedDict()
+        self._csr = None
+
+    def __len__(self) -> int:
+        """Returns the number of cached trees."""
+        return len(self._trees)
+
+    def __contains__(self, source) -> bool:
+        """Checks whether a tree for a source node is cached."""
+        return source in self._trees
+
+    @property
+    def csr(self):
+        """CSRGraph: The compact representation of `graph`; a rebuilt one clears the cache."""
+        csr = CSRGraph.for_graph(self.graph)
+        if csr is not self._csr:
+            self._trees.clear()
+            self._csr = csr
+        return csr
+
+    @property
+    def nbytes(self) -> int:
+        """int: Approximate memory held by all cached trees."""
+        return sum(tree.nbytes for tree in self._trees.values())
+
+    def tree(self, source, target=None, counters=None) -> ShortestPathTree:
+        """Returns the tree of a source node, settled at least up to a target node.
+
+        Args:
+            source (Any): The source node identifier.
+            target (Any, optional): A target node identifier that must be settled (or
+                proven unreachable) in the returned tree. Defaults to None.
+            counters (SearchCounters, optional): Counters for the search work this call
+                does; a pure cache hit counts nothing. Defaults to None.
+
+        Returns:
+            ShortestPathTree: The cached or newly created tree.
+
+        Raises:
+            KeyError: If a node is not in the graph.
+        """
+        csr = self.csr
+        tree = self._trees.get(source)
+        if tree is None:
+            self.misses += 1
+            tree = ShortestPathTree(csr, csr.index[source])
+            self._trees[source] = tree
+            if target is not None:
+                tree.settle_until(csr.index[target], counters)
+        else:
+            self._trees.move_to_end(source)
+            if target is not None and tree.settle_until(csr.index[target], counters):
+                self.resumes += 1
+            else:
+                self.hits += 1
+        self._evict()
+        return tree
+
+    def distance(self, source, target) -> float:
+        """Returns the shortest path cost between two nodes.
+
+        Args:
+            source (Any): The source node identifier.
+            target (Any): The target node identifier.
+
+        Returns:
+            float: The cost, or infinity if the target is unreachable.
+        """
+        return self.tree(source, target).distance(self.csr.index[target])
+
+    def path(self, source, target) -> list:
+        """Returns the shortest path between two nodes.
+
+        Args:
+            source (Any): The source node identifier.
+            target (Any): The target node identifier.
+
+        Returns:
+            list: The node identifiers from `source` to `target`, or an empty list if unreachable.
+        """
+        csr = self.csr
+        indices = self.tree(source, target).path(csr.index[target])
+        return [csr.node_ids[index].item() for index in indices]
+
+    def clear(self):
+        """Removes all cached trees."""
+        self._trees.clear()
+
+    def stats(self) -> dict:
+        """Returns the cache counters.
+
+        Returns:
+            dict: Hits, resumes, misses, evictions, the number of trees and their memory.
+        """
+        return {
+            "hits": self.hits,
+            "resumes": self.resumes,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "trees": len(self._trees),
+            "bytes": self.nbytes,
+        }
+
+    def _evict(self):
+        """Drops least recently used trees until the limits hold, keeping the newest one."""
+        trees = self._trees
+        total = self.nbytes
+        while len(trees) > 1 and (total > self.max_bytes or (self.max_trees and len(trees) > self.max_trees)):
+            _, tree = trees.popitem(last=False)
+            total -= tree.nbytes
+            self.evictions += 1
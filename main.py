@@ -1,9 +1,10 @@
 import random
 import asyncio
 from core import FeatureFlagManager, FlagsmithProvider, GraphVisualizer, GraphStyler, GraphProcessor, \
-    AlgorithmComparator, PathReconstructor
+    AlgorithmComparator, PathReconstructor, SpatialIndex
 from utils.graph_initializer import initialize_graph
 from algorithms import DijkstraAlgorithm, AStarAlgorithm, BFSAlgorithm
+from core.profiling import Profiler
 from credentials import flagsmith_api_key
 
 # Initialize Feature Flags
@@ -13,14 +14,47 @@ feature_flags = FeatureFlagManager(provider=flagsmith_provider)
 # Define a fixed location
 GRAPH_LOCATION = "Gliwice, Poland"
 
+# Optional (latitude, longitude) route endpoints; random nodes are used when unset
+START_COORDINATES = None
+END_COORDINATES = None
+
+
+def select_nodes(graph_instance):
+    """
+    Selects the start and end nodes of a route.
+
+    Configured coordinates are snapped to their nearest nodes with the graph's spatial
+    index; otherwise two distinct random nodes are picked.
+
+    Args:
+        graph_instance (networkx.MultiDiGraph): The road network graph.
+
+    Returns:
+        tuple: The start and end node identifiers.
+    """
+    if START_COORDINATES is not None and END_COORDINATES is not None:
+        (start_lat, start_lon), (end_lat, end_lon) = START_COORDINATES, END_COORDINATES
+        start_node, end_node = SpatialIndex.for_graph(graph_instance).nearest_nodes(
+            [start_lon, end_lon], [start_lat, end_lat]
+        ).tolist()
+        return start_node, end_node
+
+    start_node = random.choice(list(graph_instance.nodes))
+    end_node = random.choice(list(graph_instance.nodes))
+
+    while start_node == end_node:
+        end_node = random.choice(list(graph_instance.nodes))
+    return start_node, end_node
+
 
 async def profile_visualizer():
     """
     Profiles and generates GIFs for all pathfinding algorithms if the feature flag is enabled.
 
-    This function initializes the graph instance, selects random start and end nodes, and executes
+    This function initializes the graph instance, selects the start and end nodes, and executes
     three pathfinding algorithms (Dijkstra, A*, BFS). If visualization is enabled, it generates GIFs
-    for each algorithm and saves them to disk.
+    for each algorithm and saves them to disk. If the 'enable-profiling' flag is also enabled, every
+    algorithm's visualization is profiled and its profiles are written to `results/profiles/`.
 
     Raises:
         Exception: If any error occurs during the execution of an algorithm or GIF generation.
@@ -33,11 +67,7 @@ async def profile_visualizer():
     styler = GraphStyler()
     visualizer = GraphVisualizer(graph_instance)
 
-    start_node = random.choice(list(graph_instance.nodes))
-    end_node = random.choice(list(graph_instance.nodes))
-
-    while start_node == end_node:
-        end_node = random.choice(list(graph_instance.nodes))
+    start_node, end_node = select_nodes(graph_instance)
 
     algorithms = [
         ("Dijkstra", DijkstraAlgorithm(graph_instance, visualizer, styler)),
@@ -45,6 +75,26 @@ async def profile_visualizer():
         ("BFS", BFSAlgorithm(graph_instance, visualizer, styler)),
     ]
 
+    profiler = Profiler() if feature_flags.is_enabled("enable-profiling") else None
+
+    async def visualize(name, algorithm):
+        """
+        Runs one algorithm with visualization, animates its path and saves the GIF.
+
+        Args:
+            name (str): The display name of the algorithm.
+            algorithm (GraphAlgorithm): The algorithm to visualize.
+        """
+        await algorithm.execute(start_node, end_node, plot=True)
+        reconstructor = PathReconstructor(graph_instance, visualizer, styler)
+        await reconstructor.reconstruct_path(
+            start_node, end_node, plot=True, path=algorithm.reconstruct(start_node, end_node)
+        )
+
+        gif_filename = f"{name.lower()}_visualization.gif"
+        await visualizer.save_gif(gif_filename, duration=100)
+        print(f"Saved GIF for {name}: {gif_filename}")
+
     async def run_visualization():
         """
         Executes the visualization for each algorithm and generates GIFs.
@@ -55,13 +105,10 @@ async def profile_visualizer():
         for name, algorithm in algorithms:
             print(f"Running {name} Algorithm...")
             try:
-                await algorithm.execute(start_node, end_node, plot=True)
-                reconstructor = PathReconstructor(graph_instance, visualizer, styler)
-                await reconstructor.reconstruct_path(start_node, end_node, plot=True)
-
-                gif_filename = f"{name.lower()}_visualization.gif"
-                await visualizer.save_gif(gif_filename, duration=100)
-                print(f"Saved GIF for {name}: {gif_filename}")
+                if profiler is not None:
+                    await profiler.call_async(f"{name} visualization", visualize, name, algorithm)
+                else:
+                    await visualize(name, algorithm)
             except Exception as error:
                 print(f"Error during {name}: {error}")
 
@@ -76,8 +123,11 @@ def compare_algorithms():
     """
     Compares pathfinding algorithms and generates visualizations if the feature flag is enabled.
 
-    This function initializes the graph instance, selects random start and end nodes, and compares
+    This function initializes the graph instance, selects the start and end nodes, and compares
     algorithms using a pre-defined AlgorithmComparator. It also generates visualizations for the comparison.
+    The 'enable-profiling' flag additionally writes a profile of every algorithm to `results/profiles/`.
+    The 'enable-contraction-hierarchies' flag adds Contraction Hierarchies to the compared algorithms;
+    it is off by default because its preprocessing takes seconds on a city-sized graph.
 
     Raises:
         Exception: If there is an error during comparison or visualization generation.
@@ -87,16 +137,15 @@ def compare_algorithms():
         return
 
     graph_instance = initialize_graph(GRAPH_LOCATION)
-    start_node = random.choice(list(graph_instance.nodes))
-    end_node = random.choice(list(graph_instance.nodes))
-
-    while start_node == end_node:
-        end_node = random.choice(list(graph_instance.nodes))
+    start_node, end_node = select_nodes(graph_instance)
 
     print(f"Selected start node: {start_node}, end node: {end_node}")
 
-    comparator = AlgorithmComparator(graph_instance, start_node, end_node)
-    comparator.run_comparison(plot=False)
+    comparator = AlgorithmComparator(
+        graph_instance, start_node, end_node,
+        contraction_hierarchies=feature_flags.is_enabled("enable-contraction-hierarchies"),
+    )
+    comparator.run_comparison(plot=False, profile=feature_flags.is_enabled("enable-profiling"))
     comparator.generate_visualizations()
     print("Comparison charts generated successfully.")
 
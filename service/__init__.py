@@ -0,0 +1,5 @@
+from .routing_service import RoutingService
+
+__all__ = [
+    "RoutingService",
+]
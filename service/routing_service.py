@@ -0,0 +1,364 @@
+"""
+Routing Service Module
+
+A small local HTTP routing service built on `asyncio` streams, without external
+dependencies. It listens on a TCP port or a Unix domain socket and answers JSON
+requests:
+
+- `POST /route` with `{"start": node, "end": node}` or `{"origin": [lat, lon],
+  "destination": [lat, lon]}` and an optional `"algorithm"` (see
+  `core.query_engine.QUERY_ALGORITHMS`, default "dijkstra").
+- `POST /matrix` with `{"sources": [...], "targets": [...]}` node identifiers.
+- `GET /stats` with request counts and latency percentiles per endpoint.
+- `GET /health`.
+
+Route queries arriving within `batch_window` seconds of each other are collected
+into one batch and answered together by a `QueryEngine`. The blocking engine call
+runs on a helper thread while the engine's worker processes do the searching, so the
+event loop keeps accepting and parsing requests. Every response carries its
+end-to-end latency in `latency_ms` and in the `X-Response-Time` header.
+
+Run it as a module, for example:
+
+    python -m service.routing_service --place "Gliwice, Poland" --port 8080 --workers 4
+
+Classes:
+    RoutingService: The HTTP front end, the micro-batcher and the query engine.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from core.query_engine import QUERY_DIJKSTRA, QueryEngine
+from core.spatial_index import SpatialIndex
+
+logger = logging.getLogger(__name__)
+
+#: Largest accepted request body, in bytes.
+MAX_BODY_BYTES = 1024 * 1024
+
+_ENDPOINTS = {"/route": "POST", "/matrix": "POST", "/stats": "GET", "/health": "GET"}
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error"}
+
+
+class _HTTPError(Exception):
+    """An error answered with a specific HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RoutingService:
+    """
+    Asynchronous routing service answering route and matrix requests over HTTP.
+
+    Attributes:
+        graph (networkx.MultiDiGraph): The graph being routed on.
+        engine (QueryEngine): The engine answering the queries.
+        batch_window (float): How long, in seconds, a route query waits for others to batch with.
+        max_batch (int): The batch size that is dispatched without waiting for the window to end.
+        batches (int): Number of route batches dispatched so far.
+        batched_queries (int): Number of route queries answered in those batches.
+    """
+
+    def __init__(self, graph, workers: int = 0, batch_window: float = 0.005, max_batch: int = 256,
+                 hierarchy=None, latency_samples: int = 10_000):
+        """
+        Initializes the RoutingService and its query engine.
+
+        Args:
+            graph (networkx.MultiDiGraph): The weighted graph to route on.
+            workers (int, optional): The number of engine worker processes; 0 searches on
+                a helper thread of this process. Defaults to 0.
+            batch_window (float, optional): The micro-batching window in seconds. Defaults to 0.005.
+            max_batch (int, optional): The largest batch of route queries. Defaults to 256.
+            hierarchy (ContractionHierarchy, optional): Enables "contraction_hierarchies"
+                queries. Defaults to None.
+            latency_samples (int, optional): How many recent request latencies are kept
+                for `stats`. Defaults to 10000.
+        """
+        self.graph = graph
+        self.engine = QueryEngine(graph, workers=workers, batch_size=max(1, max_batch // max(workers, 1)),
+                                  hierarchy=hierarchy)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.batched_queries = 0
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="routing")
+        self._pending = []
+        self._flush_handle = None
+        self._tasks = set()
+        self._latencies = defaultdict(lambda: deque(maxlen=latency_samples))
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080, path: str = None):
+        """
+        Starts listening for requests.
+
+        Args:
+            host (str, optional): The TCP host. Defaults to "127.0.0.1".
+            port (int, optional): The TCP port; 0 picks a free one. Defaults to 8080.
+            path (str, optional): A Unix domain socket path, used instead of TCP when given.
+                Defaults to None.
+
+        Returns:
+            asyncio.base_events.Server: The listening server.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def close(self):
+        """Stops listening, waits for dispatched batches and shuts the engine down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown()
+        self.engine.close()
+
+    async def route(self, algorithm: str, start, end):
+        """
+        Answers one route query as part of the next micro-batch.
+
+        Args:
+            algorithm (str): One of `core.query_engine.QUERY_ALGORITHMS`.
+            start (Any): The start node identifier.
+            end (Any): The end node identifier.
+
+        Returns:
+            QueryResult: The answer.
+
+        Raises:
+            ValueError: If the algorithm is not available.
+            KeyError: If a node is not in the graph.
+        """
+        self.engine.validate(algorithm, start, end)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((algorithm, start, end), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    async def matrix(self, sources, targets) -> np.ndarray:
+        """
+        Computes a distance matrix on the engine without blocking the event loop.
+
+        Args:
+            sources (Sequence): Source node identifiers.
+            targets (Sequence): Target node identifiers.
+
+        Returns:
+            numpy.ndarray: A `len(sources) x len(targets)` array of costs.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.engine.distance_matrix, list(sources), list(targets))
+
+    def stats(self) -> dict:
+        """
+        Summarizes the recent request latencies and the batching.
+
+        Returns:
+            dict: Per endpoint the request count and the p50, p95 and max latency in
+                milliseconds, plus the number of batches and batched route queries.
+        """
+        endpoints = {}
+        for endpoint, samples in self._latencies.items():
+            values = np.fromiter(samples, dtype=np.float64)
+            endpoints[endpoint] = {
+                "count": len(values),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p95_ms": float(np.percentile(values, 95)),
+                "max_ms": float(values.max()),
+            }
+        return {"endpoints": endpoints, "batches": self.batches, "batched_queries": self.batched_queries}
+
+    def _flush(self):
+        """Dispatches the pending route queries as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.batched_queries += len(batch)
+        task = asyncio.get_running_loop().create_task(self._answer(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _answer(self, batch: list):
+        """Runs a batch on the engine and resolves the futures of its queries."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, lambda: list(self.engine.run(q for q, _ in batch)))
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for result in results:
+            future = batch[result.index][1]
+            if not future.done():
+                future.set_result(result)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answers one HTTP request on a connection and closes it."""
+        started = time.perf_counter()
+        endpoint = "invalid"
+        try:
+            method, path, body = await _read_request(reader)
+            endpoint = path if path in _ENDPOINTS else endpoint
+            status, payload = 200, await self._dispatch(method, path, body)
+        except _HTTPError as error:
+            status, payload = error.status, {"error": str(error)}
+        except (ValueError, KeyError, TypeError) as error:
+            status, payload = 400, {"error": f"{type(error).__name__}: {error}"}
+        except Exception as error:
+            logger.exception("Error handling routing request")
+            status, payload = 500, {"error": str(error)}
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._latencies[endpoint].append(latency_ms)
+        payload["latency_ms"] = latency_ms
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"X-Response-Time: {latency_ms:.3f}ms\r\nConnection: close\r\n\r\n".encode("ascii") + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, endpoint: str, body: bytes) -> dict:
+        """Routes a parsed request to its endpoint and returns the JSON payload."""
+        if endpoint not in _ENDPOINTS:
+            raise _HTTPError(404, f"Unknown endpoint {endpoint}.")
+        if method != _ENDPOINTS[endpoint]:
+            raise _HTTPError(405, f"{endpoint} expects {_ENDPOINTS[endpoint]}.")
+        if endpoint == "/stats":
+            return self.stats()
+        if endpoint == "/health":
+            return {"status": "ok", "nodes": self.engine.csr.node_count}
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError as error:
+            raise _HTTPError(400, f"Invalid JSON: {error}")
+        if not isinstance(request, dict):
+            raise _HTTPError(400, "The request body must be a JSON object.")
+        if endpoint == "/route":
+            return await self._route_endpoint(request)
+        return await self._matrix_endpoint(request)
+
+    async def _route_endpoint(self, request: dict) -> dict:
+        """Answers `POST /route`."""
+        if "origin" in request or "destination" in request:
+            (start_lat, start_lon), (end_lat, end_lon) = request["origin"], request["destination"]
+            start, end = SpatialIndex.for_graph(self.graph).nearest_nodes(
+                [start_lon, end_lon], [start_lat, end_lat]
+            ).tolist()
+        else:
+            start, end = request["start"], request["end"]
+        result = await self.route(request.get("algorithm", QUERY_DIJKSTRA), start, end)
+        return {
+            "algorithm": result.algorithm,
+            "start": result.start,
+            "end": result.end,
+            "nodes": result.path.tolist(),
+            "keys": result.path.keys.tolist(),
+            "cost": _finite(result.cost),
+            "search_ms": result.seconds * 1000,
+        }
+
+    async def _matrix_endpoint(self, request: dict) -> dict:
+        """Answers `POST /matrix`."""
+        matrix = await self.matrix(request["sources"], request["targets"])
+        return {"costs": [[_finite(cost) for cost in row] for row in matrix.tolist()]}
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple:
+    """Reads the request line, headers and body of one HTTP/1.1 request.
+
+    Returns:
+        tuple: `(method, path, body)`.
+
+    Raises:
+        _HTTPError: If the request is malformed or its body is too large.
+    """
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise _HTTPError(400, "Malformed request line.")
+    method, target, _ = request_line
+    length = 0
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    if length > MAX_BODY_BYTES:
+        raise _HTTPError(413, f"Request bodies are limited to {MAX_BODY_BYTES} bytes.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], body
+
+
+def _finite(value: float):
+    """Returns a cost as JSON-compatible value, None for infinity."""
+    return value if math.isfinite(value) else None
+
+
+async def _serve(arguments):
+    """Loads the graph, starts the service and serves until interrupted."""
+    from utils import initialize_graph
+
+    service = RoutingService(
+        initialize_graph(arguments.place),
+        workers=arguments.workers,
+        batch_window=arguments.batch_window,
+        max_batch=arguments.max_batch,
+    )
+    server = await service.start(arguments.host, arguments.port, arguments.unix_socket)
+    address = arguments.unix_socket or server.sockets[0].getsockname()
+    print(f"Routing service for {arguments.place} listening on {address}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    """
+    Serves routing requests for one place until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Serve routing requests over HTTP.")
+    parser.add_argument("--place", default="Gliwice, Poland", help="Place name of the graph.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host.")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port.")
+    parser.add_argument("--unix-socket", help="Serve on this Unix domain socket instead of TCP.")
+    parser.add_argument("--workers", type=int, default=0, help="Query engine worker processes.")
+    parser.add_argument("--batch-window", type=float, default=0.005, help="Micro-batching window in seconds.")
+    parser.add_argument("--max-batch", type=int, default=256, help="Largest batch of route queries.")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("Routing service stopped.")
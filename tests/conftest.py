@@ -0,0 +1,64 @@
+"""
+Shared fixtures for tests that must run without access to OpenStreetMap.
+
+The fixtures build small synthetic road networks shaped like graphs produced by
+`osmnx`, so that algorithms and utilities can be exercised offline.
+"""
+import random
+import networkx as nx
+import pytest
+from utils import prepare_graph
+
+
+def build_grid_graph(rows: int = 6, cols: int = 6, seed: int = 7):
+    """
+    Builds a synthetic grid-shaped road network.
+
+    Nodes carry `x`/`y` coordinates in degrees around Gliwice, neighbouring nodes are
+    connected in both directions and a few parallel edges are added so the graph
+    exercises MultiDiGraph edge keys. Edge lengths are in metres and never shorter than
+    the great-circle distance between their end nodes, as in OSM data.
+
+    Args:
+        rows (int): Number of grid rows.
+        cols (int): Number of grid columns.
+        seed (int): Seed for the random speed limits and parallel edges.
+
+    Returns:
+        networkx.MultiDiGraph: The prepared graph with `weight` on every edge.
+    """
+    rng = random.Random(seed)
+    graph = nx.MultiDiGraph(crs="epsg:4326")
+    lon_step, lat_step = 0.002, 0.0015
+
+    def node_id(row, col):
+        return 1000 + row * cols + col
+
+    for row in range(rows):
+        for col in range(cols):
+            graph.add_node(node_id(row, col), x=18.66 + col * lon_step, y=50.29 + row * lat_step)
+
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in ((0, 1), (1, 0)):
+                n_row, n_col = row + d_row, col + d_col
+                if n_row >= rows or n_col >= cols:
+                    continue
+                length = 143.0 if d_col else 167.0
+                speed = rng.choice(["30", "50", "70", None])
+                for u, v in ((node_id(row, col), node_id(n_row, n_col)),
+                             (node_id(n_row, n_col), node_id(row, col))):
+                    attributes = {"length": length * rng.uniform(1.0, 1.3)}
+                    if speed is not None:
+                        attributes["maxspeed"] = speed
+                    graph.add_edge(u, v, **attributes)
+                    if rng.random() < 0.1:
+                        graph.add_edge(u, v, length=attributes["length"] * 1.1, maxspeed="90")
+
+    return prepare_graph(graph)
+
+
+@pytest.fixture
+def grid_graph():
+    """Provides a freshly built 6x6 synthetic road network."""
+    return build_grid_graph()
@@ -18,7 +18,7 @@ async def test_a_star_execution():
         1. Initialize the graph for "Gliwice, Poland".
         2. Set up the GraphVisualizer and GraphStyler.
         3. Execute the A* algorithm between the start and end nodes.
-        4. Assert that the end node has a designated "previous" node.
+        4. Assert that the search state holds a predecessor for the end node.
 
     Raises:
         AssertionError: If the path is not designated correctly.
@@ -32,7 +32,7 @@ async def test_a_star_execution():
     start_node, end_node = list(graph.nodes)[:2]
     await algorithm.execute(start_node, end_node, plot=False)
 
-    assert graph.nodes[end_node]["previous"] is not None, "The path has not been designated correctly"
+    assert algorithm.state.previous(end_node) is not None, "The path has not been designated correctly"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,128 @@
+import copy
+import os
+import numpy as np
+import pytest
+from benchmarks.regression import (
+    BASELINE_DIR,
+    METHOD_MANN_WHITNEY,
+    STATUS_IMPROVEMENT,
+    STATUS_REGRESSION,
+    STATUS_UNCHANGED,
+    bootstrap_ratio,
+    check_regressions,
+    compare_reports,
+    load_baseline,
+    mann_whitney,
+    regressions,
+    save_baseline,
+)
+from benchmarks.suite import run_suite
+
+
+@pytest.fixture
+def report(grid_graph):
+    """
+    A small suite report of the grid graph, shared by the comparison tests.
+    """
+    return run_suite(grid_graph, ["dijkstra", "csr_dijkstra"], pairs=20, warmup=5, trials=3, graph_name="grid")
+
+
+def _scaled(report: dict, factor: float) -> dict:
+    """
+    Copies a report with every latency sample multiplied by a factor.
+    """
+    scaled = copy.deepcopy(report)
+    for result in scaled["algorithms"].values():
+        result["samples_ms"] = (np.asarray(result["samples_ms"]) * factor).tolist()
+    return scaled
+
+
+def test_statistics():
+    """
+    Tests the Mann-Whitney p-value and the bootstrap ratio on clearly shifted and identical samples.
+
+    Raises:
+        AssertionError: If a shift is not detected or identical samples look different.
+    """
+    rng = np.random.default_rng(1)
+    baseline = rng.lognormal(0, 0.2, 200)
+
+    assert mann_whitney(baseline, baseline * 1.3) < 0.001
+    assert mann_whitney(baseline * 1.3, baseline) > 0.999
+    assert mann_whitney(baseline, baseline) > 0.4
+    assert mann_whitney([1, 1, 1], [1, 1, 1]) == 1.0
+
+    ratio, low, high = bootstrap_ratio(baseline, baseline * 1.3)
+    assert ratio == pytest.approx(1.3) and low <= ratio <= high
+    ratio, low, high = bootstrap_ratio(baseline, rng.lognormal(0, 0.2, 150))
+    assert low < 1 < high
+
+
+@pytest.mark.parametrize("method", ["bootstrap", METHOD_MANN_WHITNEY])
+def test_compare_reports(report, method):
+    """
+    Tests that slower, faster and identical reports get the expected status.
+
+    Raises:
+        AssertionError: If a status is wrong or mismatched workloads are compared.
+    """
+    slower = compare_reports(report, _scaled(report, 1.5), method=method)
+    assert [row["status"] for row in slower] == [STATUS_REGRESSION] * 2
+    assert slower[0]["change"] == pytest.approx(0.5)
+    assert regressions(slower) == slower
+
+    faster = compare_reports(report, _scaled(report, 0.5), method=method)
+    assert {row["status"] for row in faster} == {STATUS_IMPROVEMENT}
+    assert regressions(compare_reports(report, _scaled(report, 1.05), method=method)) == []
+    assert {row["status"] for row in compare_reports(report, report, method=method)} == {STATUS_UNCHANGED}
+
+    other = copy.deepcopy(report)
+    other["settings"]["seed"] = 1
+    with pytest.raises(ValueError):
+        compare_reports(report, other, method=method)
+
+
+def test_baseline_round_trip(grid_graph, report, tmp_path):
+    """
+    Tests that a stored baseline is reloaded and re-run with its own settings.
+
+    Raises:
+        AssertionError: If the baseline changes on disk or the re-run uses other settings.
+    """
+    save_baseline(report, str(tmp_path))
+    baseline = load_baseline("grid", str(tmp_path))
+    current, rows = check_regressions(grid_graph, baseline, threshold=10.0)
+
+    assert baseline == report
+    assert current["settings"] == report["settings"] and list(current["algorithms"]) == list(report["algorithms"])
+    assert [row["algorithm"] for row in rows] == ["dijkstra", "csr_dijkstra"] and regressions(rows) == []
+    with pytest.raises(FileNotFoundError):
+        load_baseline("nowhere", str(tmp_path))
+
+
+@pytest.mark.performance
+def test_stored_baselines():
+    """
+    Checks the current code against every stored baseline; skipped when none are stored.
+
+    The baseline directory can be set with the `BENCHMARK_BASELINE_DIR` environment variable,
+    and the check can be run alone with `pytest -m performance`.
+
+    Raises:
+        AssertionError: If an algorithm regressed against its baseline.
+    """
+    from utils import initialize_graph
+
+    directory = os.environ.get("BENCHMARK_BASELINE_DIR", BASELINE_DIR)
+    files = sorted(name for name in os.listdir(directory) if name.endswith(".json")) if os.path.isdir(directory) else []
+    if not files:
+        pytest.skip(f"No baselines stored in {directory}.")
+
+    failures = []
+    for name in files:
+        baseline = load_baseline(name[:-len(".json")], directory)
+        graph = initialize_graph(baseline["graph"]["name"])
+        _, rows = check_regressions(graph, baseline)
+        place = baseline["graph"]["name"]
+        failures += [f"{place}: {row['algorithm']} {row['change']:+.1%}" for row in regressions(rows)]
+    assert not failures, "Benchmark regressions: " + ", ".join(failures)
@@ -0,0 +1,42 @@
+import gc
+import json
+import pytest
+from benchmarks.suite import ALGORITHMS, make_workload, run_suite, save_report
+
+
+def test_workload_is_reproducible(grid_graph):
+    """
+    Tests that the same seed draws the same origin-destination pairs.
+
+    Raises:
+        AssertionError: If the workload depends on anything but the graph and the seed.
+    """
+    assert make_workload(grid_graph, 30, seed=3) == make_workload(grid_graph.copy(), 30, seed=3)
+    assert make_workload(grid_graph, 30, seed=3) != make_workload(grid_graph, 30, seed=4)
+
+
+def test_suite_report(grid_graph, tmp_path):
+    """
+    Tests the content of a suite report and that it round-trips through JSON.
+
+    Raises:
+        AssertionError: If a statistic is missing, inconsistent, or the report is not serializable.
+    """
+    report = run_suite(grid_graph, list(ALGORITHMS), pairs=25, warmup=5, trials=3, graph_name="grid")
+    path = tmp_path / "suite.json"
+    save_report(report, str(path))
+
+    assert json.loads(path.read_text()) == report
+    assert gc.isenabled()
+    assert report["graph"] == {"name": "grid", "nodes": 36, "edges": grid_graph.number_of_edges()}
+    for name, result in report["algorithms"].items():
+        latency = result["latency_ms"]
+        assert latency["min"] <= latency["median"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+        assert len(result["samples_ms"]) == 3 and len(result["samples_ms"][0]) == 25
+        assert result["throughput_qps"] > 0 and result["unreachable"] == 0
+        assert result["settled_nodes"]["max"] > 0, name
+    dijkstra, a_star = report["algorithms"]["dijkstra"], report["algorithms"]["csr_a_star"]
+    assert a_star["settled_nodes"]["mean"] <= dijkstra["settled_nodes"]["mean"]
+    assert list(report["algorithms"]) == list(ALGORITHMS)
+    with pytest.raises(ValueError):
+        run_suite(grid_graph, ["teleport"])
@@ -1,3 +1,5 @@
+from collections import deque
+import networkx as nx
 import pytest
 from algorithms import BFSAlgorithm
 from core import GraphProcessor, GraphVisualizer, GraphStyler
@@ -33,5 +35,33 @@ async def test_bfs_execution():
     await algorithm.execute(start_node, end_node, plot=False)
 
     assert (
-            graph.nodes[end_node]["previous"] is not None
+            algorithm.state.previous(end_node) is not None
     ), "The path has not been designated correctly"
+
+
+@pytest.mark.asyncio
+async def test_bfs_discovers_each_node_once(grid_graph):
+    """
+    Tests that BFS enqueues every node at most once and stops when the end node is discovered.
+
+    Raises:
+        AssertionError: If the path is not hop-optimal or the end node gets expanded.
+    """
+    algorithm = BFSAlgorithm(grid_graph, None, GraphStyler())
+    start, end = 1000, 1035
+    discovered = []
+
+    algorithm.initialize_graph(plot=False)
+    algorithm.state.update(start, 0)
+    async for node in algorithm._node_iterator(deque([start]), plot=False):
+        discovered.append(node)
+        if node == end:
+            break
+
+    assert len(discovered) == len(set(discovered))
+    assert not algorithm.state.is_settled(end)
+
+    await algorithm.execute(start, end)
+    path = algorithm.path(start, end)
+    assert path[0] == start and path[-1] == end
+    assert len(path) - 1 == nx.shortest_path_length(grid_graph, start, end)
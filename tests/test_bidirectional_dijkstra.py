@@ -0,0 +1,69 @@
+import networkx as nx
+import pytest
+from algorithms import BidirectionalDijkstraAlgorithm, DijkstraAlgorithm
+from core import GraphStyler
+
+
+def _path_cost(graph, path):
+    """Sums the lightest edge weight along a node path."""
+    return sum(min(data["weight"] for data in graph[u][v].values()) for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.asyncio
+async def test_bidirectional_dijkstra_is_optimal(grid_graph):
+    """
+    Tests that bidirectional Dijkstra finds shortest paths between many node pairs.
+
+    Raises:
+        AssertionError: If a path is invalid or longer than networkx's shortest path.
+    """
+    algorithm = BidirectionalDijkstraAlgorithm(grid_graph, None, GraphStyler())
+    nodes = list(grid_graph.nodes)
+
+    for start, end in zip(nodes[::5], nodes[::-7]):
+        await algorithm.execute(start, end, plot=False)
+        path = algorithm.path(start, end)
+
+        assert path[0] == start and path[-1] == end
+        assert all(grid_graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+        expected = nx.shortest_path_length(grid_graph, start, end, weight="weight")
+        assert _path_cost(grid_graph, path) == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_bidirectional_dijkstra_settles_fewer_nodes(grid_graph):
+    """
+    Tests that the bidirectional search settles fewer nodes than Dijkstra for a nearby target.
+
+    Raises:
+        AssertionError: If the bidirectional search settles at least as many nodes.
+    """
+    start, end = 1014, 1021
+    dijkstra = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    bidirectional = BidirectionalDijkstraAlgorithm(grid_graph, None, GraphStyler())
+
+    await dijkstra.execute(start, end)
+    await bidirectional.execute(start, end)
+
+    def settled(state):
+        return sum(1 for node in grid_graph.nodes if state.is_settled(node))
+
+    assert settled(bidirectional.state) + settled(bidirectional.backward_state) < settled(dijkstra.state)
+
+
+@pytest.mark.asyncio
+async def test_bidirectional_dijkstra_unreachable():
+    """
+    Tests that no path is reported when the end node cannot be reached.
+
+    Raises:
+        AssertionError: If a path is returned.
+    """
+    graph = nx.MultiDiGraph()
+    graph.add_edge(1, 2, weight=1.0)
+    graph.add_edge(3, 2, weight=1.0)
+    algorithm = BidirectionalDijkstraAlgorithm(graph, None, GraphStyler())
+
+    await algorithm.execute(1, 3)
+
+    assert algorithm.path(1, 3) == []
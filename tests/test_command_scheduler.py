@@ -0,0 +1,95 @@
+import asyncio
+import networkx as nx
+import pytest
+from algorithms import CSRDijkstraAlgorithm, DijkstraAlgorithm
+from core import GraphStyler
+from core.command import Command, RunAlgorithmCommand
+from core.command_scheduler import CommandScheduler
+
+
+class _RecordingCommand(Command):
+    """Records when it runs and how many commands of its kind run at the same time."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, name, log, fail=False):
+        self.name = name
+        self.log = log
+        self.fail = fail
+
+    async def execute(self):
+        type(self).running += 1
+        type(self).peak = max(type(self).peak, type(self).running)
+        self.log.append(self.name)
+        await asyncio.sleep(0.001)
+        type(self).running -= 1
+        if self.fail:
+            raise RuntimeError(self.name)
+        return self.name
+
+
+def test_run_algorithm_command_returns_path(grid_graph):
+    """
+    Tests that executing a command runs the search and returns its path.
+
+    Raises:
+        AssertionError: If the command does not return the shortest path.
+    """
+    command = RunAlgorithmCommand(DijkstraAlgorithm(grid_graph, None, GraphStyler()), 1000, 1035)
+
+    path = command.execute()
+
+    assert path.tolist() == nx.shortest_path(grid_graph, 1000, 1035, weight="weight")
+    assert command.batch_key == (id(grid_graph), 1000)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_batches_routing_commands(grid_graph):
+    """
+    Tests that many routing commands are answered correctly in batches sharing a start node.
+
+    Raises:
+        AssertionError: If a path is wrong or commands were not batched.
+    """
+    algorithm = CSRDijkstraAlgorithm(grid_graph, None, GraphStyler())
+    queries = [(start, end) for start in (1000, 1017, 1035) for end in sorted(grid_graph.nodes)] * 2
+
+    async with CommandScheduler(concurrency=2, max_batch=50) as scheduler:
+        futures = scheduler.submit_many(RunAlgorithmCommand(algorithm, start, end) for start, end in queries)
+
+    for (start, end), future in zip(queries, futures):
+        expected = nx.shortest_path_length(grid_graph, start, end, weight="weight")
+        assert future.result().cost == pytest.approx(expected)
+    assert scheduler.executed == len(queries)
+    assert scheduler.batches == 3 * -(-2 * grid_graph.number_of_nodes() // 50)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priorities_concurrency_and_errors():
+    """
+    Tests priority order, the concurrency limit, per-command errors and cancelled futures.
+
+    Raises:
+        AssertionError: If commands run out of order, too many run at once, or results are wrong.
+    """
+    log = []
+    _RecordingCommand.peak = 0
+    scheduler = CommandScheduler(concurrency=3)
+    low = scheduler.submit_many([_RecordingCommand(f"low{i}", log) for i in range(6)], priority=5)
+    high = scheduler.submit(_RecordingCommand("high", log), priority=1)
+    failing = scheduler.submit(_RecordingCommand("failing", log, fail=True), priority=1)
+    cancelled = scheduler.submit(_RecordingCommand("cancelled", log), priority=9)
+    cancelled.cancel()
+
+    await scheduler.join()
+    await scheduler.close()
+
+    assert log[:2] == ["high", "failing"] and "cancelled" not in log
+    assert _RecordingCommand.peak == 3
+    assert [future.result() for future in low] == [f"low{i}" for i in range(6)]
+    assert high.result() == "high"
+    with pytest.raises(RuntimeError):
+        failing.result()
+    with pytest.raises(ValueError):
+        CommandScheduler(concurrency=0)
@@ -0,0 +1,117 @@
+import networkx as nx
+import pytest
+from algorithms import ContractionHierarchiesAlgorithm, DijkstraAlgorithm
+from core import AlgorithmComparator, ContractionHierarchy, CSRGraph, GraphStyler
+from tests.conftest import build_grid_graph
+
+
+def _path_cost(graph, path):
+    """Sums the lightest edge weight along a node path."""
+    return sum(min(data["weight"] for data in graph[u][v].values()) for u, v in zip(path, path[1:]))
+
+
+def test_hierarchy_distances_match_networkx(grid_graph):
+    """
+    Tests that hierarchy queries return exact distances and paths over original edges.
+
+    Raises:
+        AssertionError: If a distance differs from networkx or a path uses a shortcut.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    hierarchy = ContractionHierarchy.build(csr)
+    assert sorted(hierarchy.rank.tolist()) == list(range(csr.node_count))
+
+    for source in range(0, csr.node_count, 5):
+        expected = nx.single_source_dijkstra_path_length(grid_graph, csr.node_ids[source].item(), weight="weight")
+        for target in range(csr.node_count):
+            distance, path = hierarchy.query(source, target)
+            assert distance == pytest.approx(expected[csr.node_ids[target].item()])
+            nodes = [csr.node_ids[index].item() for index in path]
+            assert nodes[0] == csr.node_ids[source] and nodes[-1] == csr.node_ids[target]
+            assert _path_cost(grid_graph, nodes) == pytest.approx(distance)
+
+
+def test_hierarchy_save_and_load(tmp_path, grid_graph):
+    """
+    Tests that a stored hierarchy answers queries like the original and is bound to its graph.
+
+    Raises:
+        AssertionError: If the loaded hierarchy differs or a foreign graph is accepted.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    hierarchy = ContractionHierarchy.build(csr)
+    path = tmp_path / "ch" / "gliwice.npz"
+    hierarchy.save(str(path))
+
+    loaded = ContractionHierarchy.load(str(path), csr)
+
+    assert loaded.shortcut_count == hierarchy.shortcut_count
+    assert loaded.query(3, 31) == hierarchy.query(3, 31)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(str(path), CSRGraph.from_graph(build_grid_graph(3, 3)))
+
+
+@pytest.mark.asyncio
+async def test_contraction_hierarchies_algorithm(grid_graph):
+    """
+    Tests the algorithm wrapper: optimal unpacked paths and a smaller search space than Dijkstra.
+
+    Raises:
+        AssertionError: If a path is not optimal or the query settles too many nodes.
+    """
+    start, end = 1000, 1035
+    algorithm = ContractionHierarchiesAlgorithm(grid_graph, None, GraphStyler())
+    dijkstra = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    algorithm.prepare()
+
+    await algorithm.execute(start, end)
+    await dijkstra.execute(start, end)
+    path = algorithm.path(start, end)
+
+    assert path == dijkstra.path(start, end)
+    assert _path_cost(grid_graph, path) == pytest.approx(nx.shortest_path_length(grid_graph, start, end, "weight"))
+
+    settled = sum(
+        algorithm.state.is_settled(i) + algorithm.backward_state.is_settled(i) for i in range(len(grid_graph))
+    )
+    assert settled < sum(1 for node in grid_graph.nodes if dijkstra.state.is_settled(node))
+
+
+@pytest.mark.asyncio
+async def test_contraction_hierarchies_unreachable():
+    """
+    Tests that no path is reported when the end node cannot be reached.
+
+    Raises:
+        AssertionError: If a path is returned.
+    """
+    graph = nx.MultiDiGraph()
+    graph.add_edge(1, 2, weight=1.0)
+    graph.add_node(3)
+    algorithm = ContractionHierarchiesAlgorithm(graph, None, GraphStyler())
+
+    await algorithm.execute(1, 3)
+
+    assert algorithm.path(1, 3) == []
+
+
+def test_comparator_contraction_hierarchies_opt_in(grid_graph, monkeypatch):
+    """
+    Tests that the comparator only runs Contraction Hierarchies on request and reports failed preprocessing.
+
+    Raises:
+        AssertionError: If the hierarchy is compared by default or a preprocessing error aborts the comparison.
+    """
+    assert "Contraction Hierarchies" not in AlgorithmComparator(grid_graph, 1000, 1035).algorithms
+
+    def fail():
+        raise RuntimeError("preprocessing failed")
+
+    comparator = AlgorithmComparator(grid_graph, 1000, 1035, contraction_hierarchies=True)
+    monkeypatch.setattr(comparator.algorithms["Contraction Hierarchies"], "prepare", fail)
+    comparator.algorithms = {
+        name: comparator.algorithms[name] for name in ("Contraction Hierarchies", "Dijkstra")
+    }
+    comparator.run_comparison(plot=False)
+
+    assert [result["Algorithm"] for result in comparator.results] == ["Dijkstra"]
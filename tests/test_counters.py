@@ -0,0 +1,131 @@
+import heapq
+import pytest
+from algorithms import (
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CachedDijkstraAlgorithm,
+    ContractionHierarchiesAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    CSRDijkstraAlgorithm,
+    DijkstraAlgorithm,
+)
+from core import AlgorithmComparator, GraphStyler, SearchCounters
+from core.algorithm_comparator import COUNTER_METRICS, SETTLED_METRIC
+from core.counters import heap_operations, make_deque, CountingDeque
+
+SEARCHES = [
+    DijkstraAlgorithm,
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CSRDijkstraAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    ContractionHierarchiesAlgorithm,
+]
+
+
+def test_counting_operations_are_only_bound_when_collected():
+    """
+    Tests that searches without counters get the plain queue operations.
+
+    Raises:
+        AssertionError: If a plain operation is wrapped or a counting one miscounts.
+    """
+    assert heap_operations(None) == (heapq.heappush, heapq.heappop)
+    assert type(make_deque([1], None)) is not CountingDeque
+
+    counters = SearchCounters(trace_memory=False)
+    heap = [(0, "a")]
+    heappush, heappop = heap_operations(counters, heap)
+    heappush(heap, (2, "b"))
+    heappush(heap, (1, "c"))
+    assert [heappop(heap) for _ in range(3)] == [(0, "a"), (1, "c"), (2, "b")]
+    queue = make_deque([1, 2], counters)
+    queue.append(3)
+    queue.popleft()
+    assert (counters.heap_pushes, counters.heap_pops, counters.max_frontier) == (6, 4, 3)
+
+
+@pytest.mark.parametrize("algorithm_class", SEARCHES)
+def test_search_counters(grid_graph, algorithm_class):
+    """
+    Tests that every search reports consistent counters and none unless asked to.
+
+    Raises:
+        AssertionError: If the counters change the path, are inconsistent, or are kept when disabled.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+    expected = algorithm.run(1000, 1035)
+    assert expected.counters is None and algorithm.counters is None
+
+    algorithm.collect_counters = True
+    path = algorithm.run(1000, 1035)
+    counters = path.counters
+
+    assert path.cost == expected.cost and counters is algorithm.counters
+    assert 0 < counters.nodes_settled <= counters.heap_pops <= counters.heap_pushes
+    assert counters.stale_pops == counters.heap_pops - counters.nodes_settled
+    assert counters.edges_relaxed >= counters.nodes_settled and counters.max_frontier > 0
+    assert counters.peak_memory > 0
+
+    algorithm.collect_counters = False
+    assert algorithm.run(1000, 1035).counters is None and algorithm.counters is None
+
+
+@pytest.mark.asyncio
+async def test_counters_of_an_executed_search(grid_graph):
+    """
+    Tests that `execute` collects the same counters as `run`.
+
+    Raises:
+        AssertionError: If the counters of the two paths differ.
+    """
+    algorithm = CSRDijkstraAlgorithm(grid_graph, None, GraphStyler())
+    algorithm.collect_counters = True
+    expected = algorithm.run(1000, 1035).counters.as_dict()
+
+    await algorithm.execute(1000, 1035)
+
+    counted = algorithm.counters.as_dict()
+    assert {key: value for key, value in counted.items() if key != "peak_memory"} == {
+        key: value for key, value in expected.items() if key != "peak_memory"
+    }
+
+
+def test_comparator_counter_metrics(grid_graph):
+    """
+    Tests that the comparator adds the counters as metrics without changing the timed runs.
+
+    Raises:
+        AssertionError: If a counter metric is missing or counting stays enabled.
+    """
+    comparator = AlgorithmComparator(grid_graph, 1000, 1035)
+    comparator.run_comparison(plot=False, counters=True)
+
+    results = {result["Algorithm"]: result for result in comparator.results}
+    assert all(metric in result for result in results.values() for metric in COUNTER_METRICS.values())
+    assert results["A*"][SETTLED_METRIC] <= results["Dijkstra"][SETTLED_METRIC]
+    assert not any(algorithm.collect_counters for algorithm in comparator.algorithms.values())
+
+
+def test_cached_dijkstra_counts_its_own_work(grid_graph):
+    """
+    Tests that a cold cached query counts its search and a query answered from the tree counts nothing.
+
+    Raises:
+        AssertionError: If a cold query reports no work or a warm query reports any.
+    """
+    algorithm = CachedDijkstraAlgorithm(grid_graph, None, GraphStyler())
+    algorithm.collect_counters = True
+
+    cold = algorithm.run(1000, 1035).counters
+    tree = algorithm.cache.tree(1000)
+    assert cold.nodes_settled == tree.settled_count > 0
+    assert cold.edges_relaxed >= cold.nodes_settled and 0 < cold.heap_pops <= cold.heap_pushes
+    assert cold.stale_pops == cold.heap_pops - cold.nodes_settled
+
+    warm = algorithm.run(1000, 1001).counters
+    assert warm.as_dict() | {"peak_memory": 0} == dict.fromkeys(SearchCounters.FIELDS, 0)
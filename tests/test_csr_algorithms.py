@@ -0,0 +1,72 @@
+import networkx as nx
+import pytest
+from algorithms import CSRAStarAlgorithm, CSRBFSAlgorithm, CSRDijkstraAlgorithm
+from core import GraphStyler
+
+
+def _path_cost(graph, path):
+    """Sums the lightest edge weight along a node path."""
+    return sum(min(data["weight"] for data in graph[u][v].values()) for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [CSRDijkstraAlgorithm, CSRAStarAlgorithm])
+async def test_csr_weighted_search_is_optimal(grid_graph, algorithm_class):
+    """
+    Tests that the CSR Dijkstra and A* variants find a shortest path.
+
+    Raises:
+        AssertionError: If the path cost differs from networkx's shortest path cost.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+    start, end = 1000, 1035
+
+    await algorithm.execute(start, end, plot=False)
+
+    path = algorithm.path(start, end)
+    expected = nx.shortest_path_length(grid_graph, start, end, weight="weight")
+    assert path[0] == start and path[-1] == end
+    assert _path_cost(grid_graph, path) == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_csr_bfs_finds_fewest_edges(grid_graph):
+    """
+    Tests that the CSR BFS variant finds a path with the fewest edges.
+
+    Raises:
+        AssertionError: If the path is longer than networkx's unweighted shortest path.
+    """
+    algorithm = CSRBFSAlgorithm(grid_graph, None, GraphStyler())
+    start, end = 1000, 1035
+
+    await algorithm.execute(start, end, plot=False)
+
+    path = algorithm.path(start, end)
+    assert len(path) - 1 == nx.shortest_path_length(grid_graph, start, end)
+
+
+@pytest.mark.asyncio
+async def test_csr_bfs_level_synchronous_matches_queue_mode(grid_graph):
+    """
+    Tests that the level-synchronous frontier mode assigns the same hop counts as the queue mode.
+
+    Raises:
+        AssertionError: If a path is not hop-optimal or a level differs between the two modes.
+    """
+    queue_mode = CSRBFSAlgorithm(grid_graph, None, GraphStyler())
+    frontier_mode = CSRBFSAlgorithm(grid_graph, None, GraphStyler(), level_synchronous=True)
+    start = 1000
+    expected = nx.single_source_shortest_path_length(grid_graph, start)
+
+    for end in (1001, 1021, 1035):
+        await queue_mode.execute(start, end)
+        await frontier_mode.execute(start, end)
+        path = frontier_mode.path(start, end)
+
+        assert path[0] == start and path[-1] == end
+        assert all(grid_graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+        assert len(path) - 1 == expected[end]
+        for node in range(len(grid_graph)):
+            if frontier_mode.state.is_reached(node):
+                assert frontier_mode.state.distance(node) == expected[frontier_mode.csr.node_ids[node].item()]
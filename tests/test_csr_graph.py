@@ -0,0 +1,99 @@
+import networkx as nx
+import numpy as np
+from core import CSRGraph
+
+
+def test_csr_matches_graph_adjacency(grid_graph):
+    """
+    Tests that the CSR arrays describe the same adjacency as the networkx graph.
+
+    Parallel edges must be collapsed to the lightest edge and keep its key.
+
+    Raises:
+        AssertionError: If any out-edge or weight differs.
+    """
+    csr = CSRGraph.from_graph(grid_graph)
+
+    assert csr.node_count == grid_graph.number_of_nodes()
+    assert len(csr.offsets) == csr.node_count + 1
+    for node in grid_graph.nodes:
+        i = csr.index[node]
+        targets, weights = csr.neighbors(i)
+        expected = {}
+        for _, v, key, w in grid_graph.out_edges(node, keys=True, data="weight"):
+            if v not in expected or w < expected[v][0]:
+                expected[v] = (w, key)
+        assert sorted(csr.node_ids[targets].tolist()) == sorted(expected)
+        for edge in range(csr.offsets[i], csr.offsets[i + 1]):
+            v = csr.node_ids[csr.targets[edge]].item()
+            assert csr.weights[edge] == expected[v][0]
+            assert csr.keys[edge] == expected[v][1]
+
+
+def test_reverse_transposes_edges(grid_graph):
+    """
+    Tests that `reverse` stores every edge in the opposite direction.
+
+    Raises:
+        AssertionError: If the reverse graph does not contain the transposed edges.
+    """
+    csr = CSRGraph.from_graph(grid_graph)
+    reverse = csr.reverse()
+
+    forward = {
+        (i, int(csr.targets[e]), float(csr.weights[e]))
+        for i in range(csr.node_count) for e in range(csr.offsets[i], csr.offsets[i + 1])
+    }
+    backward = {
+        (int(reverse.targets[e]), i, float(reverse.weights[e]))
+        for i in range(reverse.node_count) for e in range(reverse.offsets[i], reverse.offsets[i + 1])
+    }
+    assert forward == backward
+    assert reverse.reverse() is csr
+
+
+def test_for_graph_caches_and_invalidates(grid_graph):
+    """
+    Tests that `for_graph` reuses the representation until the graph changes or is invalidated.
+
+    Raises:
+        AssertionError: If the cache is not reused or not invalidated.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    assert CSRGraph.for_graph(grid_graph) is csr
+
+    grid_graph.add_node(1)
+    rebuilt = CSRGraph.for_graph(grid_graph)
+    assert rebuilt is not csr
+
+    grid_graph.add_edge(1000, 1035, weight=0.5)
+    added = CSRGraph.for_graph(grid_graph)
+    assert added is not rebuilt and added.edge_count == rebuilt.edge_count + 1
+
+    grid_graph.remove_edge(1000, 1035)
+    removed = CSRGraph.for_graph(grid_graph)
+    assert removed is not added and removed.edge_count == rebuilt.edge_count
+
+    nx.set_edge_attributes(grid_graph, 2.0, "weight")
+    assert set(CSRGraph.for_graph(grid_graph).weights.tolist()) == {2.0}
+
+    for data in grid_graph[1000][1001].values():
+        data["weight"] = 0.25
+    CSRGraph.invalidate(grid_graph)
+    assert 0.25 in CSRGraph.for_graph(grid_graph).weights.tolist()
+
+
+def test_simple_undirected_graph():
+    """
+    Tests conversion of a simple undirected graph with default weights.
+
+    Raises:
+        AssertionError: If edges are not stored in both directions with weight 1.
+    """
+    graph = nx.Graph()
+    graph.add_edge("a", "b")
+    csr = CSRGraph.from_graph(graph)
+
+    assert csr.edge_count == 2
+    assert np.all(csr.weights == 1)
+    assert csr.nbytes > 0
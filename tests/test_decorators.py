@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import pytest
+from algorithms import DijkstraAlgorithm
+from core import GraphStyler
+from core.decorators import (
+    collect_timings,
+    get_timing_sink,
+    log_execution,
+    log_timing,
+    measure_time,
+    set_timing_sink,
+    PHASE_RECONSTRUCT,
+    PHASE_RESET,
+    PHASE_SEARCH,
+)
+
+
+@pytest.mark.asyncio
+async def test_coroutines_and_async_generators_are_timed_when_awaited(caplog):
+    """
+    Tests that coroutine and asynchronous generator timings cover the awaited work.
+
+    Raises:
+        AssertionError: If a timing only covers creating the coroutine or the completion is logged early.
+    """
+    @log_execution
+    @measure_time(phase=PHASE_SEARCH)
+    async def wait():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    @measure_time
+    async def count():
+        for value in range(3):
+            await asyncio.sleep(0.005)
+            yield value
+
+    with caplog.at_level(logging.INFO, logger="core.decorators"), collect_timings() as records:
+        assert await wait() == "done"
+        assert [value async for value in count()] == [0, 1, 2]
+
+    coroutine, generator = records
+    assert coroutine.name.endswith("wait") and coroutine.phase == PHASE_SEARCH
+    assert coroutine.nanoseconds >= 20_000_000 and generator.nanoseconds >= 15_000_000
+    assert [record.message for record in caplog.records][-1] == "Execution has been completed: wait"
+
+
+@pytest.mark.asyncio
+async def test_query_phases_are_separated(grid_graph):
+    """
+    Tests that a search emits nested reset, search and reconstruct records.
+
+    Raises:
+        AssertionError: If a phase is missing or the search time includes the reset.
+    """
+    algorithm = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+
+    with collect_timings() as records:
+        await algorithm.execute(1000, 1035)
+        algorithm.reconstruct(1000, 1035)
+
+    reset, search, reconstruct = records
+    assert (reset.phase, search.phase, reconstruct.phase) == (PHASE_RESET, PHASE_SEARCH, PHASE_RECONSTRUCT)
+    assert reset.parent is search and search.name == "DijkstraAlgorithm.execute"
+    assert search.self_nanoseconds == search.nanoseconds - reset.nanoseconds
+    assert search.as_dict()["parent"] is None and reset.as_dict()["parent"] == "DijkstraAlgorithm.execute"
+
+
+def test_timing_sink_is_pluggable():
+    """
+    Tests that records reach a custom sink and that the default sink can be restored.
+
+    Raises:
+        AssertionError: If a record does not reach the sink or the previous sink is not returned.
+    """
+    received = []
+
+    @measure_time
+    def work():
+        return sum(range(1000))
+
+    previous = set_timing_sink(received.append)
+    try:
+        work()
+    finally:
+        assert set_timing_sink(None) == received.append
+    assert previous is log_timing and get_timing_sink() is log_timing
+    assert len(received) == 1 and received[0].nanoseconds > 0
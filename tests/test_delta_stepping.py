@@ -0,0 +1,81 @@
+import networkx as nx
+import numpy as np
+import pytest
+from core import CSRGraph
+from core.delta_stepping import DeltaSteppingEngine, delta_stepping
+from core.shortest_paths import predecessor_path, single_source_dijkstra
+
+
+@pytest.mark.parametrize("delta", [None, 0.5, 3.0, 1e9])
+def test_delta_stepping_matches_dijkstra(grid_graph, delta):
+    """
+    Tests that delta-stepping returns exact distances and a valid shortest path tree for any delta.
+
+    Raises:
+        AssertionError: If a distance differs or a tree path does not add up to it.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    expected = single_source_dijkstra(csr, 7)[0]
+
+    distances, predecessors = delta_stepping(csr, 7, delta)
+
+    np.testing.assert_allclose(distances, expected)
+    for target in range(csr.node_count):
+        path = predecessor_path(predecessors, 7, target)
+        cost = sum(csr.weights[csr.edge_index(u, v)] for u, v in zip(path, path[1:]))
+        assert cost == pytest.approx(distances[target])
+
+
+def test_delta_stepping_process_pool(grid_graph):
+    """
+    Tests the shared-memory process pool and reuse of one engine for several sources.
+
+    Raises:
+        AssertionError: If parallel phases are not used or a distance differs.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+
+    with DeltaSteppingEngine(csr, delta=1.0, workers=2, parallel_threshold=1) as engine:
+        for source in (0, 20, 35):
+            distances, _ = engine.run(source)
+            np.testing.assert_allclose(distances, single_source_dijkstra(csr, source)[0])
+        assert engine.parallel_phases > 0
+
+
+def test_delta_stepping_unreachable_and_validation():
+    """
+    Tests unreachable nodes and parameter validation.
+
+    Raises:
+        AssertionError: If unreachable nodes get a distance or bad parameters are accepted.
+    """
+    graph = nx.MultiDiGraph()
+    graph.add_edge(1, 2, weight=1.0)
+    graph.add_node(3)
+    csr = CSRGraph.from_graph(graph)
+
+    distances, predecessors = delta_stepping(csr, 0)
+
+    assert distances.tolist() == [0.0, 1.0, np.inf]
+    assert predecessors.tolist() == [-1, 0, -1]
+    with pytest.raises(ValueError):
+        DeltaSteppingEngine(csr, delta=0)
+    with pytest.raises(ValueError):
+        DeltaSteppingEngine(csr, workers=-1)
+
+
+def test_delta_stepping_benchmark_rows(grid_graph):
+    """
+    Tests that the benchmark times every engine and setting.
+
+    Raises:
+        AssertionError: If a run is missing from the benchmark rows.
+    """
+    from benchmarks.delta_stepping import benchmark_delta_stepping
+
+    rows = benchmark_delta_stepping(grid_graph, sources=2, deltas=(None, 2.0), workers=(0,))
+
+    engines = [row["engine"] for row in rows]
+    assert engines.count("dijkstra") == engines.count("csr_dijkstra") == 2
+    assert engines.count("delta_stepping") == 4
+    assert all(row["seconds"] >= 0 and row["nodes"] == len(grid_graph) for row in rows)
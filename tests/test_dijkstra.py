@@ -33,7 +33,7 @@ async def test_dijkstra_execution():
     await algorithm.execute(start_node, end_node, plot=False)
 
     assert (
-            graph.nodes[end_node]["previous"] is not None
+            algorithm.state.previous(end_node) is not None
     ), "The path has not been designated correctly"
 
 
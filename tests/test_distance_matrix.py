@@ -0,0 +1,72 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms import distance_matrix
+from core import CSRGraph
+from core.shortest_paths import predecessor_path
+
+
+def _expected_matrix(graph, sources, targets):
+    """Builds the reference matrix with one networkx search per source."""
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    for i, source in enumerate(sources):
+        lengths = nx.single_source_dijkstra_path_length(graph, source, weight="weight")
+        for j, target in enumerate(targets):
+            matrix[i, j] = lengths.get(target, np.inf)
+    return matrix
+
+
+@pytest.mark.parametrize("sources, targets", [
+    ([1000, 1007, 1000, 1020], [1035, 1003, 1014]),
+    ([1000, 1035], [1001, 1002, 1003, 1004, 1030]),
+    ([1005, 1012, 1019, 1026, 1033], [1000, 1000]),
+])
+def test_distance_matrix_matches_networkx(grid_graph, sources, targets):
+    """
+    Tests the matrix in both search directions, including duplicate sources and targets.
+
+    Raises:
+        AssertionError: If any entry differs from networkx.
+    """
+    matrix = distance_matrix(grid_graph, sources, targets)
+
+    assert matrix.shape == (len(sources), len(targets))
+    np.testing.assert_allclose(matrix, _expected_matrix(grid_graph, sources, targets))
+
+
+def test_distance_matrix_predecessors(grid_graph):
+    """
+    Tests that the returned shortest path trees reproduce the matrix costs.
+
+    Raises:
+        AssertionError: If a tree path does not add up to the matrix entry.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    sources, targets = [1000, 1021], [1035, 1008, 1021]
+
+    matrix, predecessors = distance_matrix(grid_graph, sources, targets, return_predecessors=True)
+
+    assert predecessors.shape == (len(sources), csr.node_count)
+    for i, source in enumerate(sources):
+        for j, target in enumerate(targets):
+            path = predecessor_path(predecessors[i], csr.index[source], csr.index[target])
+            nodes = [csr.node_ids[index].item() for index in path]
+            cost = sum(min(d["weight"] for d in grid_graph[u][v].values()) for u, v in zip(nodes, nodes[1:]))
+            assert nodes[0] == source and nodes[-1] == target
+            assert cost == pytest.approx(matrix[i, j])
+
+
+def test_distance_matrix_unreachable():
+    """
+    Tests that unreachable pairs are infinite.
+
+    Raises:
+        AssertionError: If an unreachable pair gets a finite cost.
+    """
+    graph = nx.MultiDiGraph()
+    graph.add_edge(1, 2, weight=2.0)
+    graph.add_node(3)
+
+    matrix = distance_matrix(graph, [1, 3], [2, 3])
+
+    np.testing.assert_array_equal(matrix, [[2.0, np.inf], [np.inf, 0.0]])
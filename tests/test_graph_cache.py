@@ -0,0 +1,90 @@
+import osmnx as ox
+import pytest
+from unittest.mock import patch
+from utils import GraphSnapshotStore, initialize_graph
+from utils.graph_initializer import WEIGHTING_VERSION
+
+
+def test_snapshot_round_trip(tmp_path, grid_graph):
+    """
+    Tests that a stored snapshot loads back as an identical weighted graph.
+
+    Raises:
+        AssertionError: If nodes, edges or weights differ after loading.
+    """
+    store = GraphSnapshotStore(str(tmp_path))
+    store.save(grid_graph, "Gliwice, Poland", "drive", WEIGHTING_VERSION)
+
+    loaded = store.load(" gliwice, poland ", "drive", WEIGHTING_VERSION)
+
+    assert loaded is not None, "Snapshot was not found under the normalized place name"
+    assert set(loaded.nodes) == set(grid_graph.nodes)
+    for edge in grid_graph.edges:
+        assert loaded.edges[edge]["weight"] == grid_graph.edges[edge]["weight"]
+    assert store.load("Gliwice, Poland", "walk", WEIGHTING_VERSION) is None
+    assert store.load("Gliwice, Poland", "drive", WEIGHTING_VERSION + 1) is None
+
+
+def test_initialize_graph_uses_snapshot_offline(tmp_path, grid_graph):
+    """
+    Tests that `initialize_graph` never contacts OSM once a snapshot exists.
+
+    Raises:
+        AssertionError: If the snapshot is not used.
+    """
+    store = GraphSnapshotStore(str(tmp_path))
+    store.save(grid_graph, "Gliwice, Poland", "drive", WEIGHTING_VERSION)
+
+    with patch("utils.graph_initializer.ox.graph_from_place") as download:
+        graph = initialize_graph("Gliwice, Poland", store=store)
+
+    download.assert_not_called()
+    assert graph.number_of_edges() == grid_graph.number_of_edges()
+
+
+def test_initialize_graph_from_local_graphml(tmp_path, grid_graph):
+    """
+    Tests building a snapshot from a local GraphML file instead of downloading it.
+
+    Raises:
+        AssertionError: If the imported graph is not weighted or not stored.
+    """
+    source = tmp_path / "gliwice.graphml"
+    ox.save_graphml(grid_graph, source)
+    store = GraphSnapshotStore(str(tmp_path / "snapshots"))
+
+    with patch("utils.graph_initializer.ox.graph_from_place") as download:
+        graph = initialize_graph("Gliwice, Poland", source_file=str(source), store=store)
+
+    download.assert_not_called()
+    assert all("weight" in data for _, _, data in graph.edges(data=True))
+    assert store.exists("Gliwice, Poland", "drive", WEIGHTING_VERSION)
+
+
+def test_corrupted_snapshot_is_ignored(tmp_path):
+    """
+    Tests that an unreadable snapshot is treated as missing.
+
+    Raises:
+        AssertionError: If the corrupted snapshot is returned.
+    """
+    store = GraphSnapshotStore(str(tmp_path))
+    path = store.path_for("Gliwice, Poland", "drive", WEIGHTING_VERSION)
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(b"not a pickle")
+
+    assert store.load("Gliwice, Poland", "drive", WEIGHTING_VERSION) is None
+
+
+def test_unsupported_source_file(tmp_path):
+    """
+    Tests that unsupported local source files are rejected.
+
+    Raises:
+        AssertionError: If no ValueError is raised.
+    """
+    source = tmp_path / "gliwice.csv"
+    source.write_text("")
+
+    with pytest.raises(ValueError):
+        initialize_graph("Gliwice, Poland", source_file=str(source), store=GraphSnapshotStore(str(tmp_path)))
@@ -0,0 +1,83 @@
+import networkx as nx
+import pytest
+from algorithms import AStarAlgorithm, CSRAStarAlgorithm, DijkstraAlgorithm
+from core import CSRGraph, GraphStyler, TravelTimeHeuristic
+
+
+def _settled_count(state):
+    """Counts the nodes settled in the current generation of a search state."""
+    values = state.settled.values() if isinstance(state.settled, dict) else state.settled
+    return sum(1 for settled in values if settled == state.generation)
+
+
+def test_travel_time_heuristic_is_admissible(grid_graph):
+    """
+    Tests that the travel-time heuristic never overestimates the remaining cost.
+
+    Raises:
+        AssertionError: If any estimate exceeds the true shortest path cost.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    heuristic = TravelTimeHeuristic.for_csr(csr)
+    target = 1035
+    distances = nx.single_source_dijkstra_path_length(grid_graph.reverse(), target, weight="weight")
+    vectorized = heuristic.estimates_to(csr.index[target])
+
+    assert heuristic.usable and heuristic.max_speed == pytest.approx(90)
+    for node, distance in distances.items():
+        estimate = heuristic.estimate(csr.index[node], csr.index[target])
+        assert estimate <= distance + 1e-9
+        assert vectorized[csr.index[node]] == pytest.approx(estimate)
+
+
+def test_travel_time_heuristic_is_consistent(grid_graph):
+    """
+    Tests that the heuristic satisfies h(u) <= w(u, v) + h(v) for every edge.
+
+    Raises:
+        AssertionError: If any edge violates consistency.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    heuristic = TravelTimeHeuristic.for_csr(csr)
+    target = csr.index[1035]
+
+    for u, v, weight in grid_graph.edges(data="weight"):
+        h_u = heuristic.estimate(csr.index[u], target)
+        h_v = heuristic.estimate(csr.index[v], target)
+        assert h_u <= weight + h_v + 1e-9
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [AStarAlgorithm, CSRAStarAlgorithm])
+async def test_a_star_prunes_and_stays_optimal(grid_graph, algorithm_class):
+    """
+    Tests that A* with the travel-time heuristic settles fewer nodes than Dijkstra
+    while finding a path of the same cost.
+
+    Raises:
+        AssertionError: If A* settles as many nodes or returns a longer path.
+    """
+    start, end = 1007, 1010
+    a_star = algorithm_class(grid_graph, None, GraphStyler())
+    dijkstra = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+
+    await a_star.execute(start, end)
+    await dijkstra.execute(start, end)
+
+    a_star_path = a_star.path(start, end)
+    expected = nx.shortest_path_length(grid_graph, start, end, weight="weight")
+    cost = sum(min(d["weight"] for d in grid_graph[u][v].values()) for u, v in zip(a_star_path, a_star_path[1:]))
+    assert cost == pytest.approx(expected)
+
+    assert _settled_count(a_star.state) < _settled_count(dijkstra.state)
+
+
+def test_unknown_heuristic_is_rejected(grid_graph):
+    """
+    Tests that an unsupported heuristic mode raises a ValueError.
+
+    Raises:
+        AssertionError: If no ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        AStarAlgorithm(grid_graph, None, GraphStyler(), heuristic="manhattan")
@@ -32,10 +32,12 @@ async def test_full_pipeline_integration():
     await algorithm.execute(start_node, end_node, plot=True)
 
     # Path reconstruction
-    await reconstructor.reconstruct_path(start_node, end_node, plot=True)
+    await reconstructor.reconstruct_path(
+        start_node, end_node, plot=True, path=algorithm.path(start_node, end_node)
+    )
 
     # Checking the results
     assert (
-            graph.nodes[end_node]["previous"] is not None
+            algorithm.state.previous(end_node) is not None
     ), "The path has not been designated correctly"
     assert len(visualizer.frames) > 0, "Visualization has not been generated"
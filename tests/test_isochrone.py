@@ -0,0 +1,70 @@
+import networkx as nx
+import pytest
+from algorithms import isochrones, isochrones_in_minutes, minutes_to_weight, reachable_within
+
+
+def test_isochrones_match_bounded_dijkstra(grid_graph):
+    """
+    Tests reached nodes, costs and boundary edges for several budgets computed in one pass.
+
+    Raises:
+        AssertionError: If an isochrone differs from networkx's cutoff search.
+    """
+    budgets = [5.0, 10.0, 15.0]
+    result = isochrones(grid_graph, 1014, budgets)
+
+    assert [isochrone.budget for isochrone in result] == budgets
+    for isochrone in result:
+        expected = nx.single_source_dijkstra_path_length(grid_graph, 1014, cutoff=isochrone.budget, weight="weight")
+        assert isochrone.nodes == set(expected)
+        for node, cost in expected.items():
+            assert isochrone.costs[node] == pytest.approx(cost)
+
+        expected_boundary = {
+            (u, v, key) for u, v, key in grid_graph.edges(keys=True) if u in expected and v not in expected
+        }
+        # Parallel edges are collapsed to the lightest one.
+        assert {(u, v) for u, v, _, _ in isochrone.boundary_edges} == {(u, v) for u, v, _ in expected_boundary}
+        for u, v, key, fraction in isochrone.boundary_edges:
+            assert (u, v, key) in expected_boundary
+            assert 0.0 <= fraction < 1.0
+            assert expected[u] + fraction * grid_graph.edges[u, v, key]["weight"] == pytest.approx(isochrone.budget)
+
+    assert result[0].nodes < result[1].nodes < result[2].nodes
+
+
+def test_reachable_within_zero_budget_and_validation(grid_graph):
+    """
+    Tests the single-budget helper and budget validation.
+
+    Raises:
+        AssertionError: If a zero budget reaches more than the source or bad budgets are accepted.
+    """
+    isochrone = reachable_within(grid_graph, 1000, 0)
+
+    assert isochrone.costs == {1000: 0.0}
+    assert all(u == 1000 and fraction == 0.0 for u, _, _, fraction in isochrone.boundary_edges)
+    with pytest.raises(ValueError):
+        isochrones(grid_graph, 1000, [])
+    with pytest.raises(ValueError):
+        reachable_within(grid_graph, 1000, -1)
+
+
+def test_isochrones_in_minutes():
+    """
+    Tests that travel times in minutes are converted with the weights of `initialize_graph`.
+
+    Each edge is 1 km at 60 km/h, one minute of travel, with the weight `length / maxspeed`.
+
+    Raises:
+        AssertionError: If a travel time reaches the wrong nodes or is converted incorrectly.
+    """
+    graph = nx.MultiDiGraph()
+    for u, v in ((1, 2), (2, 3), (3, 4)):
+        graph.add_edge(u, v, length=1000.0, maxspeed=60, weight=1000.0 / 60)
+
+    one, two = isochrones_in_minutes(graph, 1, [1, 2.5])
+
+    assert one.nodes == {1, 2} and two.nodes == {1, 2, 3}
+    assert one.minutes == pytest.approx(1) and two.minutes == pytest.approx(2.5)
+    assert minutes_to_weight(5) == pytest.approx(83.333, abs=1e-3)
@@ -0,0 +1,83 @@
+import networkx as nx
+import pytest
+from algorithms import AStarAlgorithm, CSRAStarAlgorithm
+from core import CSRGraph, GraphStyler, LandmarkHeuristic
+from core.shortest_paths import single_source_dijkstra
+from tests.conftest import build_grid_graph
+
+
+@pytest.mark.parametrize("strategy", ["farthest", "avoid"])
+def test_landmark_bounds_are_admissible(grid_graph, strategy):
+    """
+    Tests that ALT bounds never exceed true distances for either selection strategy.
+
+    Raises:
+        AssertionError: If a bound overestimates or landmarks are duplicated.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    landmarks = LandmarkHeuristic.build(csr, k=4, strategy=strategy, seed=3)
+    assert len(set(landmarks.landmarks.tolist())) == 4
+
+    for target in (0, 17, 35):
+        distances = single_source_dijkstra(csr.reverse(), target)[0]
+        bound = landmarks.bind(target, source=5, active=2)
+        for node in range(csr.node_count):
+            assert landmarks.estimate(node, target) <= distances[node] + 1e-9
+            assert bound(node) <= distances[node] + 1e-9
+
+
+def test_single_source_dijkstra_matches_networkx(grid_graph):
+    """
+    Tests the one-to-all CSR search used for preprocessing.
+
+    Raises:
+        AssertionError: If any distance differs from networkx.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    distances, predecessors = single_source_dijkstra(csr, csr.index[1000])
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="weight")
+
+    for node, distance in expected.items():
+        assert distances[csr.index[node]] == pytest.approx(distance)
+    assert predecessors[csr.index[1000]] == -1
+
+
+def test_landmarks_save_and_load(tmp_path, grid_graph):
+    """
+    Tests that landmark tables survive a save/load round trip and are bound to their graph.
+
+    Raises:
+        AssertionError: If the tables differ or a foreign graph is accepted.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    landmarks = LandmarkHeuristic.build(csr, k=3)
+    path = tmp_path / "landmarks" / "gliwice.npz"
+    landmarks.save(str(path))
+
+    loaded = LandmarkHeuristic.load(str(path), csr)
+
+    assert (loaded.forward == landmarks.forward).all()
+    assert (loaded.landmarks == landmarks.landmarks).all()
+    with pytest.raises(ValueError):
+        LandmarkHeuristic.load(str(path), CSRGraph.from_graph(build_grid_graph(3, 3)))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [AStarAlgorithm, CSRAStarAlgorithm])
+async def test_alt_a_star_is_optimal(grid_graph, algorithm_class):
+    """
+    Tests that A* in "alt" mode finds shortest paths.
+
+    Raises:
+        AssertionError: If a path is longer than networkx's shortest path.
+    """
+    csr = CSRGraph.for_graph(grid_graph)
+    algorithm = algorithm_class(grid_graph, None, GraphStyler(), heuristic="alt",
+                                landmarks=LandmarkHeuristic.for_csr(csr, k=4))
+    nodes = list(grid_graph.nodes)
+
+    for start, end in zip(nodes[::4], nodes[::-5]):
+        await algorithm.execute(start, end)
+        path = algorithm.path(start, end)
+        cost = sum(min(d["weight"] for d in grid_graph[u][v].values()) for u, v in zip(path, path[1:]))
+        assert cost == pytest.approx(nx.shortest_path_length(grid_graph, start, end, weight="weight"))
@@ -0,0 +1,136 @@
+import networkx as nx
+import pytest
+from algorithms import (
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CachedDijkstraAlgorithm,
+    ContractionHierarchiesAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    CSRDijkstraAlgorithm,
+    DijkstraAlgorithm,
+)
+from core import AlgorithmComparator, GraphStyler, Path, PathReconstructor
+
+
+@pytest.fixture
+def cheap_parallel_graph(grid_graph):
+    """Provides the grid graph where every connection has a cheaper parallel edge with a non-zero key."""
+    for u, v, data in list(grid_graph.edges(data=True)):
+        grid_graph.add_edge(u, v, length=data["length"], maxspeed=data["maxspeed"], weight=data["weight"] / 2)
+    return grid_graph
+
+
+def _cheapest_key(graph, u, v):
+    """Returns the key of the lightest edge from `u` to `v`."""
+    return min(graph[u][v], key=lambda key: graph[u][v][key]["weight"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [
+    DijkstraAlgorithm,
+    AStarAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CSRDijkstraAlgorithm,
+    CSRAStarAlgorithm,
+    CachedDijkstraAlgorithm,
+    ContractionHierarchiesAlgorithm,
+])
+async def test_reconstruct_uses_relaxed_edges(cheap_parallel_graph, algorithm_class):
+    """
+    Tests that weighted searches report the parallel edges they relaxed and the true cost.
+
+    Raises:
+        AssertionError: If a key is not the cheapest parallel edge or the costs are wrong.
+    """
+    graph = cheap_parallel_graph
+    algorithm = algorithm_class(graph, None, GraphStyler())
+    start, end = 1000, 1035
+
+    await algorithm.execute(start, end, plot=False)
+    path = algorithm.reconstruct(start, end)
+
+    assert path.tolist() == algorithm.path(start, end)
+    assert path.cost == pytest.approx(nx.shortest_path_length(graph, start, end, weight="weight"))
+    assert len(path.costs) == len(path.nodes) == len(path) + 1
+    for (u, v, key), before, after in zip(path.edges, path.costs, path.costs[1:]):
+        assert key == _cheapest_key(graph, u, v) != 0
+        assert after - before == pytest.approx(graph.edges[u, v, key]["weight"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm", [
+    lambda graph: BFSAlgorithm(graph, None, GraphStyler()),
+    lambda graph: CSRBFSAlgorithm(graph, None, GraphStyler()),
+    lambda graph: CSRBFSAlgorithm(graph, None, GraphStyler(), level_synchronous=True),
+])
+async def test_bfs_reconstruct_records_discovering_edge(cheap_parallel_graph, algorithm):
+    """
+    Tests that BFS paths carry an existing edge key and costs summed over those edges.
+
+    Raises:
+        AssertionError: If an edge does not exist or the cumulative costs do not add up.
+    """
+    graph = cheap_parallel_graph
+    search = algorithm(graph)
+    await search.execute(1000, 1035, plot=False)
+    path = search.reconstruct(1000, 1035)
+
+    assert len(path) == nx.shortest_path_length(graph, 1000, 1035)
+    assert path.cost == pytest.approx(sum(graph.edges[edge]["weight"] for edge in path.edges))
+
+
+def test_path_from_keys_and_empty(cheap_parallel_graph):
+    """
+    Tests building paths from node lists, with unknown keys resolving to the cheapest edge.
+
+    Raises:
+        AssertionError: If the keys, costs or the empty path are wrong.
+    """
+    graph = cheap_parallel_graph
+    path = Path.from_keys(graph, [1000, 1001, 1007], [0, None])
+
+    assert path.edges == [(1000, 1001, 0), (1001, 1007, _cheapest_key(graph, 1001, 1007))]
+    assert path.cost == pytest.approx(graph.edges[1000, 1001, 0]["weight"] + graph.edges[path.edges[1]]["weight"])
+
+    empty = Path.empty()
+    assert not empty and len(empty) == 0 and empty.cost == float("inf") and empty.edges == []
+    assert Path.from_keys(graph, [1000]).cost == 0.0
+
+
+def test_comparator_cost_uses_edge_weights(cheap_parallel_graph):
+    """
+    Tests that the comparator reports the weighted path cost rather than one per edge.
+
+    Raises:
+        AssertionError: If the reported cost is not the shortest path cost.
+    """
+    graph = cheap_parallel_graph
+    comparator = AlgorithmComparator(graph, 1000, 1035)
+    comparator.algorithms = {"Dijkstra": comparator.algorithms["Dijkstra"]}
+
+    comparator.run_comparison(plot=False)
+
+    expected = nx.shortest_path_length(graph, 1000, 1035, weight="weight")
+    assert comparator.results[0]["Total Cost"] == pytest.approx(expected)
+    assert comparator.results[0]["Steps"] == len(nx.shortest_path(graph, 1000, 1035, weight="weight")) - 1
+
+
+@pytest.mark.asyncio
+async def test_reconstructor_styles_used_edges(cheap_parallel_graph):
+    """
+    Tests that the path reconstructor styles the parallel edges of the path, not key 0.
+
+    Raises:
+        AssertionError: If a styled edge is not on the path.
+    """
+    graph = cheap_parallel_graph
+    algorithm = DijkstraAlgorithm(graph, None, GraphStyler())
+    await algorithm.execute(1000, 1035, plot=False)
+    path = algorithm.reconstruct(1000, 1035)
+
+    await PathReconstructor(graph, None, GraphStyler()).reconstruct_path(1000, 1035, path=path)
+
+    styled = {edge for edge in graph.edges(keys=True) if graph.edges[edge].get("color") == "#ADD8E6"}
+    assert styled == set(path.edges)
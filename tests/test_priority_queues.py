@@ -0,0 +1,134 @@
+import random
+import networkx as nx
+import pytest
+from algorithms import AStarAlgorithm, DijkstraAlgorithm
+from core import GraphStyler
+from core.priority_queues import PRIORITY_QUEUES, PriorityQueue, make_priority_queue
+
+
+@pytest.mark.parametrize("kind", PRIORITY_QUEUES)
+def test_priority_queue_pops_in_order(kind):
+    """
+    Tests that every queue pops nodes by their lowest pushed priority, with decrease-key.
+
+    Raises:
+        AssertionError: If a node is popped out of order or more than once.
+    """
+    rng = random.Random(11)
+    queue = make_priority_queue(kind)
+    expected = {}
+    last = 0.0
+    popped = []
+
+    for _ in range(2000):
+        if queue and rng.random() < 0.3:
+            priority, node = queue.pop()
+            assert priority == expected.pop(node) and priority >= last
+            last = priority
+            popped.append(node)
+        else:
+            node = rng.randrange(300)
+            priority = last + rng.uniform(0, 50)
+            queue.push(node, priority)
+            if node not in expected or priority < expected[node]:
+                expected[node] = priority
+        assert len(queue) == len(expected)
+
+    while queue:
+        priority, node = queue.pop()
+        assert priority == expected.pop(node) and priority >= last
+        last = priority
+        popped.append(node)
+    assert not expected
+    assert queue.pops == len(popped) == queue.pushes - queue.decrease_keys
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_radix_heap_rejects_non_monotone_priorities():
+    """
+    Tests that the radix heap refuses priorities below the last popped one.
+
+    Raises:
+        AssertionError: If the push is accepted.
+    """
+    queue = make_priority_queue("radix")
+    queue.push("a", 5.0)
+    queue.pop()
+
+    with pytest.raises(ValueError):
+        queue.push("b", 4.0)
+
+
+def test_incomplete_priority_queue_is_rejected():
+    """
+    Tests that a queue without all queue operations cannot be instantiated.
+
+    Raises:
+        AssertionError: If the incomplete queue is created.
+    """
+    class PushOnlyQueue(PriorityQueue):
+        def __len__(self) -> int:
+            return 0
+
+        def push(self, node, priority: float):
+            pass
+
+    with pytest.raises(TypeError):
+        PushOnlyQueue()
+
+
+def test_unknown_priority_queue():
+    """
+    Tests that unknown queue kinds are rejected by the algorithms.
+
+    Raises:
+        AssertionError: If no ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        DijkstraAlgorithm(nx.MultiDiGraph(), None, GraphStyler(), priority_queue="fibonacci")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [DijkstraAlgorithm, AStarAlgorithm])
+@pytest.mark.parametrize("kind", PRIORITY_QUEUES)
+async def test_search_with_each_priority_queue(grid_graph, algorithm_class, kind):
+    """
+    Tests that Dijkstra and A* stay optimal with every queue and that only lazy queues pop stale entries.
+
+    Raises:
+        AssertionError: If the path cost is not optimal or an indexed queue reports stale pops.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler(), priority_queue=kind)
+    start, end = 1000, 1035
+
+    await algorithm.execute(start, end)
+
+    path = algorithm.path(start, end)
+    cost = sum(min(d["weight"] for d in grid_graph[u][v].values()) for u, v in zip(path, path[1:]))
+    assert cost == pytest.approx(nx.shortest_path_length(grid_graph, start, end, weight="weight"))
+    stats = algorithm.queue.stats()
+    assert stats["pops"] <= len(grid_graph)
+    if kind in ("indexed", "pairing"):
+        assert stats["stale_pops"] == 0
+        assert stats["peak_size"] <= len(grid_graph)
+    assert stats["pushes"] - stats["decrease_keys"] == stats["pops"] + len(algorithm.queue)
+
+
+@pytest.mark.parametrize("kind", PRIORITY_QUEUES)
+def test_alt_search_with_a_dead_end(grid_graph, kind):
+    """
+    Tests that A* with ALT bounds handles nodes that cannot reach the target with every queue.
+
+    Removing the out-edges of a node makes the ALT bound infinite for every node that
+    cannot reach the target anymore.
+
+    Raises:
+        AssertionError: If the search fails or the path cost is not optimal.
+    """
+    grid_graph.remove_edges_from(list(grid_graph.out_edges(1000, keys=True)))
+
+    for start, end in ((1001, 1005), (1033, 1017), (1034, 1000)):
+        algorithm = AStarAlgorithm(grid_graph, None, GraphStyler(), heuristic="alt", priority_queue=kind)
+        path = algorithm.run(start, end)
+        assert path.cost == pytest.approx(nx.shortest_path_length(grid_graph, start, end, weight="weight"))
@@ -0,0 +1,100 @@
+import os
+import pstats
+import pytest
+from algorithms import DijkstraAlgorithm
+from core import AlgorithmComparator, GraphStyler
+from core.decorators import set_phase_hook, timed, PHASE_SEARCH
+from core.profiling import Profiler, MODE_CPROFILE, MODE_SAMPLING, PHASE_OTHER
+
+
+def _queries(algorithm, count: int = 200):
+    """
+    Runs the same query repeatedly, timed as the search phase like the comparator does.
+    """
+    for _ in range(count):
+        with timed("queries", PHASE_SEARCH):
+            algorithm.run(1000, 1035)
+    return count
+
+
+def test_profiles_per_phase(grid_graph, tmp_path):
+    """
+    Tests that cProfile statistics and sampled stacks are written per phase.
+
+    Raises:
+        AssertionError: If a phase is missing, its statistics are misattributed or a stack is malformed.
+    """
+    algorithm = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    profiler = Profiler(str(tmp_path), interval=0.0005)
+
+    assert profiler.call("A*", _queries, algorithm) == 200
+
+    names = sorted(os.path.basename(path) for path in profiler.files)
+    for phase in ("reset", "search", "reconstruct"):
+        assert f"a_star_{phase}.pstats" in names
+    functions = {function for _, _, function in pstats.Stats(str(tmp_path / "a_star_search.pstats")).stats}
+    assert "_process_edge" in functions and "trace" not in functions
+    functions = {function for _, _, function in pstats.Stats(str(tmp_path / "a_star_reconstruct.pstats")).stats}
+    assert "trace" in functions and "_process_edge" not in functions
+
+    lines = (tmp_path / "a_star.collapsed").read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("search;") and "dijkstra.py:_expand" in line for line in lines)
+    assert all(line.split(";")[0] in ("reset", "search", "reconstruct", PHASE_OTHER) for line in lines)
+    assert set_phase_hook(None) is None
+
+
+@pytest.mark.asyncio
+async def test_profiled_coroutine(grid_graph, tmp_path):
+    """
+    Tests that a coroutine function can be profiled with cProfile alone.
+
+    Raises:
+        AssertionError: If the result is lost or sampled files are written.
+    """
+    algorithm = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    profiler = Profiler(str(tmp_path), modes=[MODE_CPROFILE])
+
+    await profiler.call_async("Dijkstra", algorithm.execute, 1000, 1035)
+
+    assert profiler.files and all(path.endswith(".pstats") for path in profiler.files)
+    assert algorithm.reconstruct(1000, 1035)
+    with pytest.raises(ValueError):
+        Profiler(str(tmp_path), modes=["perf"])
+
+
+def test_nested_profiling_is_rejected(tmp_path):
+    """
+    Tests that a profiler refuses to profile two calls at once and recovers afterwards.
+
+    Raises:
+        AssertionError: If the nested call is profiled or the phase hook is left installed.
+    """
+    profiler = Profiler(str(tmp_path), modes=[MODE_SAMPLING])
+
+    with pytest.raises(RuntimeError):
+        profiler.call("outer", profiler.call, "inner", sum, [1, 2])
+    assert profiler.call("again", sum, [1, 2]) == 3
+    assert set_phase_hook(None) is None
+
+
+def _pstats_files(directory) -> list:
+    """
+    Lists the statistics files in a directory.
+    """
+    return sorted(path.name for path in directory.iterdir() if path.suffix == ".pstats")
+
+
+def test_comparator_profiles(grid_graph, tmp_path):
+    """
+    Tests that the comparator writes a profile of every algorithm when asked to.
+
+    Raises:
+        AssertionError: If an algorithm has no search profile or profiling changed the results.
+    """
+    comparator = AlgorithmComparator(grid_graph, 1000, 1035, contraction_hierarchies=True)
+    comparator.run_comparison(plot=False, profile=True, profile_dir=str(tmp_path))
+
+    for name in ("dijkstra", "a_star", "bfs", "bidirectional_dijkstra", "contraction_hierarchies"):
+        assert (tmp_path / f"{name}_search.pstats").exists()
+    assert len(comparator.results) == 5 and len(_pstats_files(tmp_path)) >= 5
@@ -0,0 +1,80 @@
+import random
+import networkx as nx
+import pytest
+from algorithms import CSRAStarAlgorithm, CSRBFSAlgorithm, CSRDijkstraAlgorithm
+from core import ContractionHierarchy, CSRGraph, GraphStyler
+from core.query_engine import QUERY_A_STAR, QUERY_ALGORITHMS, QUERY_BFS, QUERY_DIJKSTRA, QueryEngine
+
+
+def _queries(graph, count: int, seed: int = 5) -> list:
+    """Returns random queries covering every algorithm."""
+    rng = random.Random(seed)
+    nodes = sorted(graph.nodes)
+    return [(QUERY_ALGORITHMS[i % len(QUERY_ALGORITHMS)], rng.choice(nodes), rng.choice(nodes)) for i in range(count)]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_query_engine_answers_every_query(grid_graph, workers):
+    """
+    Tests that in-process and pooled engines return optimal paths for every algorithm.
+
+    Raises:
+        AssertionError: If a result is missing, duplicated or not a shortest (or fewest-edge) path.
+    """
+    hierarchy = ContractionHierarchy.for_csr(CSRGraph.for_graph(grid_graph))
+    queries = _queries(grid_graph, 40)
+
+    with QueryEngine(grid_graph, workers=workers, batch_size=7, hierarchy=hierarchy) as engine:
+        results = list(engine.run(queries))
+
+    assert sorted(result.index for result in results) == list(range(len(queries)))
+    for result in results:
+        assert (result.algorithm, result.start, result.end) == queries[result.index]
+        assert result.path.tolist()[0] == result.start and result.path.tolist()[-1] == result.end
+        if result.algorithm == QUERY_BFS:
+            assert len(result.path) == nx.shortest_path_length(grid_graph, result.start, result.end)
+        else:
+            expected = nx.shortest_path_length(grid_graph, result.start, result.end, weight="weight")
+            assert result.cost == pytest.approx(expected)
+
+
+def test_query_engine_unreachable_and_validation(grid_graph):
+    """
+    Tests empty results for unreachable nodes and the rejection of invalid queries.
+
+    Raises:
+        AssertionError: If an unreachable query returns a path or invalid input is accepted.
+    """
+    grid_graph.add_node(1)
+
+    with QueryEngine(grid_graph, workers=0) as engine:
+        assert not engine.query(QUERY_DIJKSTRA, 1000, 1).path
+        assert engine.query(QUERY_DIJKSTRA, 1000, 1000).cost == 0.0
+        with pytest.raises(ValueError):
+            list(engine.run([("contraction_hierarchies", 1000, 1035)]))
+        with pytest.raises(ValueError):
+            engine.query("teleport", 1000, 1035)
+        with pytest.raises(KeyError):
+            engine.query(QUERY_DIJKSTRA, 1000, -5)
+    with pytest.raises(ValueError):
+        QueryEngine(grid_graph, workers=0, batch_size=0)
+
+
+def test_query_engine_uses_the_csr_searches(grid_graph):
+    """
+    Tests that pooled queries return exactly the paths of the CSR search classes.
+
+    Raises:
+        AssertionError: If a worker path differs from the path of the matching search class.
+    """
+    searches = {
+        QUERY_DIJKSTRA: CSRDijkstraAlgorithm(grid_graph, None, GraphStyler()),
+        QUERY_A_STAR: CSRAStarAlgorithm(grid_graph, None, GraphStyler()),
+        QUERY_BFS: CSRBFSAlgorithm(grid_graph, None, GraphStyler(), level_synchronous=True),
+    }
+    queries = [(algorithm, start, end) for algorithm in searches for start, end in ((1000, 1035), (1030, 1005))]
+
+    with QueryEngine(grid_graph, workers=1, batch_size=2) as engine:
+        for result in engine.run(queries):
+            expected = searches[result.algorithm].run(result.start, result.end)
+            assert result.path.tolist() == expected.tolist() and result.cost == expected.cost
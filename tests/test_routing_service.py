@@ -0,0 +1,83 @@
+import asyncio
+import json
+import networkx as nx
+import pytest
+from service import RoutingService
+
+
+async def _request(port: int, method: str, path: str, payload: dict = None):
+    """Sends one HTTP request to the local service and returns the status, headers and JSON body."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, json.loads(content)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [0, 1])
+async def test_concurrent_routes_are_batched(grid_graph, workers):
+    """
+    Tests that concurrent route requests are answered correctly from shared micro-batches.
+
+    Raises:
+        AssertionError: If a cost is wrong, latency is missing, or no batching happened.
+    """
+    service = RoutingService(grid_graph, workers=workers, batch_window=0.05)
+    server = await service.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    pairs = [(1000, 1035), (1005, 1030), (1012, 1001), (1020, 1020)] * 3
+    try:
+        responses = await asyncio.gather(*(
+            _request(port, "POST", "/route", {"start": start, "end": end}) for start, end in pairs
+        ))
+        status, _, stats = await _request(port, "GET", "/stats")
+    finally:
+        await service.close()
+
+    for (start, end), (status, headers, body) in zip(pairs, responses):
+        assert status == 200
+        assert body["nodes"][0] == start and body["nodes"][-1] == end
+        assert body["cost"] == pytest.approx(nx.shortest_path_length(grid_graph, start, end, weight="weight"))
+        assert body["latency_ms"] > 0 and headers["X-Response-Time"].endswith("ms")
+    assert service.batched_queries == len(pairs)
+    assert service.batches < len(pairs)
+    assert stats["endpoints"]["/route"]["count"] == len(pairs)
+
+
+@pytest.mark.asyncio
+async def test_matrix_coordinates_and_errors(grid_graph):
+    """
+    Tests the matrix endpoint, coordinate snapping and the error responses.
+
+    Raises:
+        AssertionError: If a response has the wrong status or content.
+    """
+    service = RoutingService(grid_graph, workers=0, batch_window=0.001)
+    server = await service.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    origin = [grid_graph.nodes[1000]["y"] + 1e-5, grid_graph.nodes[1000]["x"]]
+    destination = [grid_graph.nodes[1035]["y"], grid_graph.nodes[1035]["x"] - 1e-5]
+    try:
+        _, _, matrix = await _request(port, "POST", "/matrix", {"sources": [1000, 1007], "targets": [1035, 1000]})
+        _, _, snapped = await _request(port, "POST", "/route", {"origin": origin, "destination": destination})
+        unknown_node = await _request(port, "POST", "/route", {"start": 1000, "end": -1})
+        unknown_algorithm = await _request(port, "POST", "/route", {"start": 1000, "end": 1035, "algorithm": "x"})
+        not_found = await _request(port, "GET", "/nowhere")
+        wrong_method = await _request(port, "GET", "/route")
+    finally:
+        await service.close()
+
+    lengths = dict(nx.all_pairs_dijkstra_path_length(grid_graph, weight="weight"))
+    assert matrix["costs"] == [
+        [pytest.approx(lengths[1000][1035]), 0.0],
+        [pytest.approx(lengths[1007][1035]), pytest.approx(lengths[1007][1000])],
+    ]
+    assert (snapped["start"], snapped["end"]) == (1000, 1035)
+    assert unknown_node[0] == unknown_algorithm[0] == 400
+    assert not_found[0] == 404 and wrong_method[0] == 405
@@ -0,0 +1,119 @@
+import asyncio
+import networkx as nx
+import pytest
+from algorithms import (
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    CSRDijkstraAlgorithm,
+    DijkstraAlgorithm,
+)
+from core import GraphStyler, TimeSlice
+from core.scheduling import run_with_deadline
+
+SEARCHES = [
+    DijkstraAlgorithm,
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CSRDijkstraAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", SEARCHES)
+async def test_searches_yield_to_the_event_loop(grid_graph, algorithm_class):
+    """
+    Tests that a search without visualization lets other tasks run while it searches.
+
+    Raises:
+        AssertionError: If the search never paused, another task was starved, or the path changed.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+    algorithm.time_slice = TimeSlice(seconds=None, steps=3)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(algorithm.time_slice.step_count)
+            await asyncio.sleep(0)
+
+    task = asyncio.ensure_future(ticker())
+    await algorithm.execute(1000, 1035)
+    task.cancel()
+
+    assert algorithm.time_slice.pauses > 0 and not algorithm.interrupted
+    assert len(ticks) >= algorithm.time_slice.pauses
+    assert algorithm.path(1000, 1035)[-1] == 1035
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", SEARCHES)
+async def test_deadline_returns_best_known_path(grid_graph, algorithm_class):
+    """
+    Tests that a search stops at its deadline and still returns a path from the start node.
+
+    Raises:
+        AssertionError: If the search was not interrupted or the partial path is not a valid path.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+    algorithm.time_slice = TimeSlice(seconds=None, steps=5)
+
+    path = await run_with_deadline(algorithm, 1000, 1035, timeout=1e-9)
+
+    assert algorithm.interrupted and algorithm.time_slice.step_count == 5 and algorithm.time_slice.timeout is None
+    assert path.tolist()[0] == 1000
+    assert len(path) > 0 and all(grid_graph.has_edge(*edge) for edge in path.edges)
+
+
+@pytest.mark.asyncio
+async def test_complete_search_within_deadline(grid_graph):
+    """
+    Tests that a search finishing before its deadline returns the optimal path and keeps the timeout.
+
+    Raises:
+        AssertionError: If the path is not optimal or the algorithm's timeout was changed.
+    """
+    algorithm = CSRDijkstraAlgorithm(grid_graph, None, GraphStyler())
+
+    path = await run_with_deadline(algorithm, 1000, 1035, timeout=60)
+
+    assert not algorithm.interrupted and algorithm.time_slice.timeout is None
+    assert path.cost == pytest.approx(nx.shortest_path_length(grid_graph, 1000, 1035, weight="weight"))
+
+
+@pytest.mark.asyncio
+async def test_search_can_be_cancelled(grid_graph):
+    """
+    Tests that cancelling the task running a search stops the search at its next pause.
+
+    Raises:
+        AssertionError: If the search finished before the cancellation or ignored it.
+    """
+    algorithm = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    algorithm.time_slice = TimeSlice(seconds=None, steps=1)
+
+    task = asyncio.ensure_future(algorithm.execute(1000, 1035))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert 0 < algorithm.time_slice.step_count < grid_graph.number_of_nodes()
+
+
+def test_time_slice_validation():
+    """
+    Tests that non-positive budgets are rejected.
+
+    Raises:
+        AssertionError: If an invalid budget is accepted.
+    """
+    for options in ({"seconds": 0}, {"steps": 0}, {"timeout": -1}):
+        with pytest.raises(ValueError):
+            TimeSlice(**options)
@@ -0,0 +1,73 @@
+import copy
+import networkx as nx
+import pytest
+from algorithms import AStarAlgorithm, BFSAlgorithm, DijkstraAlgorithm, CSRDijkstraAlgorithm
+from core import SearchState, GraphStyler
+
+
+@pytest.mark.parametrize("nodes", [4, ["a", "b", "c", "d"]])
+def test_reset_invalidates_entries(nodes):
+    """
+    Tests that `reset` invalidates distances, predecessors and settled flags.
+
+    Both the dense (list-backed) and keyed (dict-backed) variants are checked.
+
+    Raises:
+        AssertionError: If an entry from the previous generation is still visible.
+    """
+    state = SearchState(nodes)
+    first, second = (0, 1) if isinstance(nodes, int) else ("a", "b")
+
+    state.update(first, 0)
+    state.update(second, 2.5, first)
+    state.settle(second)
+    assert state.path(first, second) == [first, second]
+
+    state.reset()
+
+    assert state.distance(second) == float("inf")
+    assert state.previous(second) is None
+    assert not state.is_settled(second)
+    assert not state.is_reached(first)
+    assert state.path(first, second) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [DijkstraAlgorithm, AStarAlgorithm, BFSAlgorithm])
+async def test_search_leaves_graph_untouched(grid_graph, algorithm_class):
+    """
+    Tests that searching without visualization does not modify node or edge attributes.
+
+    Raises:
+        AssertionError: If any attribute other than the start/end node size changed.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+    start, end = 1000, 1035
+    before = copy.deepcopy(grid_graph)
+
+    await algorithm.execute(start, end, plot=False)
+
+    for node in grid_graph.nodes:
+        changed = {k for k, v in grid_graph.nodes[node].items() if before.nodes[node].get(k) != v}
+        assert changed <= {"size"}
+    for edge in grid_graph.edges:
+        assert grid_graph.edges[edge] == before.edges[edge]
+    assert algorithm.path(start, end)[-1] == end
+
+
+@pytest.mark.asyncio
+async def test_instances_share_graph(grid_graph):
+    """
+    Tests that two algorithm instances can search the same graph independently.
+
+    Raises:
+        AssertionError: If one search affects the result of the other.
+    """
+    first = DijkstraAlgorithm(grid_graph, None, GraphStyler())
+    second = CSRDijkstraAlgorithm(grid_graph, None, GraphStyler())
+
+    await first.execute(1000, 1035)
+    await second.execute(1035, 1000)
+
+    assert first.path(1000, 1035) == nx.shortest_path(grid_graph, 1000, 1035, weight="weight")
+    assert second.path(1035, 1000) == nx.shortest_path(grid_graph, 1035, 1000, weight="weight")
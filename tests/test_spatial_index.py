@@ -0,0 +1,133 @@
+import math
+import numpy as np
+import pytest
+from core import SpatialIndex
+from core.spatial_index import SPATIAL_INDEX_KEY
+from utils import GraphSnapshotStore, initialize_graph
+from utils.graph_initializer import WEIGHTING_VERSION
+
+
+def _random_points(graph, count: int, seed: int = 3, margin: float = 0.01):
+    """Returns random longitudes and latitudes around the bounding box of a graph."""
+    rng = np.random.default_rng(seed)
+    xs = [data["x"] for _, data in graph.nodes(data=True)]
+    ys = [data["y"] for _, data in graph.nodes(data=True)]
+    return (
+        rng.uniform(min(xs) - margin, max(xs) + margin, count),
+        rng.uniform(min(ys) - margin, max(ys) + margin, count),
+    )
+
+
+def _project(x, y, lat0):
+    """Projects like the index does, for brute-force reference distances."""
+    metres = 6_371_009 * math.pi / 180
+    return np.asarray(x) * metres * math.cos(math.radians(lat0)), np.asarray(y) * metres
+
+
+def test_nearest_nodes_match_brute_force(grid_graph):
+    """
+    Tests batch node snapping against an exhaustive search, including points outside the graph.
+
+    Raises:
+        AssertionError: If a snapped distance differs from the brute-force minimum.
+    """
+    index = SpatialIndex.from_graph(grid_graph, cell_size=150.0)
+    xs, ys = _random_points(grid_graph, 2000)
+    nodes, distances = index.nearest_nodes(xs, ys, return_distance=True)
+
+    ids = list(grid_graph.nodes)
+    lat0 = np.mean([grid_graph.nodes[node]["y"] for node in ids])
+    nx_, ny_ = _project([grid_graph.nodes[n]["x"] for n in ids], [grid_graph.nodes[n]["y"] for n in ids], lat0)
+    qx, qy = _project(xs, ys, lat0)
+    expected = np.hypot(qx[:, None] - nx_[None, :], qy[:, None] - ny_[None, :]).min(axis=1)
+
+    assert distances == pytest.approx(expected)
+    lookup = dict(zip(ids, range(len(ids))))
+    snapped = np.hypot(qx - nx_[[lookup[n] for n in nodes]], qy - ny_[[lookup[n] for n in nodes]])
+    assert snapped == pytest.approx(expected)
+
+
+def test_nearest_node_scalar(grid_graph):
+    """
+    Tests that a point on a node snaps to that node and scalars come back as scalars.
+
+    Raises:
+        AssertionError: If the wrong node or a non-scalar result is returned.
+    """
+    index = SpatialIndex.from_graph(grid_graph)
+    data = grid_graph.nodes[1007]
+
+    node, distance = index.nearest_nodes(data["x"], data["y"], return_distance=True)
+
+    assert node == 1007
+    assert distance == pytest.approx(0.0, abs=1e-6)
+
+
+def test_nearest_edges_match_brute_force(grid_graph):
+    """
+    Tests batch edge snapping against an exhaustive point-to-segment search.
+
+    Raises:
+        AssertionError: If a distance differs, or an edge or position is inconsistent with it.
+    """
+    index = SpatialIndex.from_graph(grid_graph, cell_size=120.0)
+    xs, ys = _random_points(grid_graph, 500, seed=11, margin=0.003)
+    edges, positions, distances = index.nearest_edges(xs, ys, return_distance=True)
+
+    lat0 = np.mean([data["y"] for _, data in grid_graph.nodes(data=True)])
+    qx, qy = _project(xs, ys, lat0)
+
+    def segment_distances(u, v, px, py):
+        ax, ay = _project(grid_graph.nodes[u]["x"], grid_graph.nodes[u]["y"], lat0)
+        bx, by = _project(grid_graph.nodes[v]["x"], grid_graph.nodes[v]["y"], lat0)
+        t = np.clip(((px - ax) * (bx - ax) + (py - ay) * (by - ay)) / ((bx - ax) ** 2 + (by - ay) ** 2), 0, 1)
+        return t, np.hypot(ax + t * (bx - ax) - px, ay + t * (by - ay) - py)
+
+    expected = np.min([segment_distances(u, v, qx, qy)[1] for u, v in grid_graph.edges()], axis=0)
+    assert distances == pytest.approx(expected)
+
+    for (u, v, key), position, distance, px, py in zip(edges.tolist(), positions, distances, qx, qy):
+        assert grid_graph.has_edge(u, v, key)
+        t, d = segment_distances(u, v, px, py)
+        assert position == pytest.approx(t)
+        assert d == pytest.approx(distance)
+
+
+def test_index_is_persisted_with_snapshot(tmp_path, grid_graph):
+    """
+    Tests that the index is built once, stored in the snapshot and loaded back with the graph.
+
+    Raises:
+        AssertionError: If the loaded graph lacks the index or the index answers differently.
+    """
+    store = GraphSnapshotStore(str(tmp_path))
+    store.save(grid_graph, "Gliwice, Poland", "drive", WEIGHTING_VERSION)
+
+    upgraded = initialize_graph("Gliwice, Poland", store=store)
+    assert isinstance(upgraded.graph[SPATIAL_INDEX_KEY], SpatialIndex)
+    assert SpatialIndex.for_graph(upgraded) is upgraded.graph[SPATIAL_INDEX_KEY]
+
+    loaded = store.load("Gliwice, Poland", "drive", WEIGHTING_VERSION)
+    xs, ys = _random_points(grid_graph, 100)
+    assert SPATIAL_INDEX_KEY in loaded.graph
+    assert np.array_equal(
+        loaded.graph[SPATIAL_INDEX_KEY].nearest_nodes(xs, ys), SpatialIndex.from_graph(grid_graph).nearest_nodes(xs, ys)
+    )
+
+
+def test_index_without_coordinates(grid_graph):
+    """
+    Tests that nodes without coordinates are skipped and an empty index returns no match.
+
+    Raises:
+        AssertionError: If an unlocated node is returned or an empty index fails.
+    """
+    for node in grid_graph.nodes:
+        del grid_graph.nodes[node]["x"]
+    index = SpatialIndex.from_graph(grid_graph)
+
+    nodes, distances = index.nearest_nodes([18.66], [50.29], return_distance=True)
+    edges, positions = index.nearest_edges([18.66], [50.29])
+
+    assert nodes.tolist() == [-1] and np.isinf(distances[0])
+    assert edges.tolist() == [[-1, -1, -1]] and np.isnan(positions[0])
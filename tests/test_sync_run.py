@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from algorithms import (
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CachedDijkstraAlgorithm,
+    ContractionHierarchiesAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    CSRDijkstraAlgorithm,
+    DijkstraAlgorithm,
+)
+from core import GraphAlgorithm, GraphStyler
+
+ALGORITHMS = [
+    DijkstraAlgorithm,
+    AStarAlgorithm,
+    BFSAlgorithm,
+    BidirectionalDijkstraAlgorithm,
+    CSRDijkstraAlgorithm,
+    CSRAStarAlgorithm,
+    CSRBFSAlgorithm,
+    lambda graph, visualizer, styler: CSRBFSAlgorithm(graph, visualizer, styler, level_synchronous=True),
+    ContractionHierarchiesAlgorithm,
+    CachedDijkstraAlgorithm,
+]
+QUERIES = [(1000, 1035), (1035, 1000), (1007, 1028), (1014, 1014)]
+
+
+@pytest.mark.parametrize("algorithm_class", ALGORITHMS)
+def test_run_matches_execute(grid_graph, algorithm_class):
+    """
+    Tests that the synchronous path returns the same paths as the asynchronous one.
+
+    Raises:
+        AssertionError: If `run` and `execute` disagree on a path, its keys or its cost.
+    """
+    algorithm = algorithm_class(grid_graph, None, GraphStyler())
+
+    for start, end in QUERIES:
+        asyncio.run(algorithm.execute(start, end))
+        expected = algorithm.reconstruct(start, end)
+        path = algorithm.run(start, end)
+
+        assert path.tolist() == expected.tolist() == algorithm.path(start, end)
+        assert path.keys.tolist() == expected.keys.tolist()
+        assert path.cost == pytest.approx(expected.cost)
+
+
+def test_run_unreachable_and_default(grid_graph):
+    """
+    Tests the empty result of an unreachable query and the default `run` of a subclass.
+
+    Raises:
+        AssertionError: If an unreachable query returns a path or the default `run` differs.
+    """
+    grid_graph.add_node(1)
+
+    class Driven(DijkstraAlgorithm):
+        run = GraphAlgorithm.run
+
+    for algorithm_class in (DijkstraAlgorithm, CSRDijkstraAlgorithm, BidirectionalDijkstraAlgorithm):
+        assert not algorithm_class(grid_graph, None, GraphStyler()).run(1000, 1)
+    assert Driven(grid_graph, None, GraphStyler()).run(1000, 1035).tolist() == (
+        DijkstraAlgorithm(grid_graph, None, GraphStyler()).run(1000, 1035).tolist()
+    )
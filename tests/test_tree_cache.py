@@ -0,0 +1,100 @@
+import networkx as nx
+import pytest
+from algorithms import CachedDijkstraAlgorithm, ContractionHierarchiesAlgorithm
+from core import GraphStyler, ShortestPathTreeCache
+
+
+class _FrameCounter:
+    """Visualizer stand-in counting captured frames."""
+
+    def __init__(self):
+        self.frames = 0
+
+    async def capture_frame(self):
+        self.frames += 1
+
+
+def test_tree_cache_resumes_and_hits(grid_graph):
+    """
+    Tests that repeated sources reuse their tree and farther targets resume it.
+
+    Raises:
+        AssertionError: If a distance is wrong or the counters do not match the queries.
+    """
+    cache = ShortestPathTreeCache(grid_graph)
+    expected = nx.single_source_dijkstra_path_length(grid_graph, 1000, weight="weight")
+    near, far = sorted(expected, key=expected.get)[3], max(expected, key=expected.get)
+
+    assert cache.distance(1000, near) == pytest.approx(expected[near])
+    settled_near = cache.tree(1000).settled_count
+    assert cache.distance(1000, far) == pytest.approx(expected[far])
+    assert cache.distance(1000, near) == pytest.approx(expected[near])
+
+    assert settled_near < cache.tree(1000).settled_count == len(grid_graph)
+    assert cache.misses == 1 and cache.resumes == 1 and cache.hits == 3
+    path = cache.path(1000, far)
+    assert path[0] == 1000 and path[-1] == far
+    assert all(grid_graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+def test_tree_cache_evicts_least_recently_used(grid_graph):
+    """
+    Tests eviction by tree count and by memory budget.
+
+    Raises:
+        AssertionError: If the wrong trees are kept or the memory bound is exceeded.
+    """
+    cache = ShortestPathTreeCache(grid_graph, max_trees=2)
+    for source in (1000, 1001, 1000, 1002):
+        cache.distance(source, 1035)
+    assert 1000 in cache and 1002 in cache and 1001 not in cache
+    assert cache.evictions == 1
+
+    budget = cache.tree(1000).nbytes * 2
+    bounded = ShortestPathTreeCache(grid_graph, max_bytes=budget)
+    for source in (1000, 1001, 1002, 1003):
+        bounded.distance(source, 1035)
+        assert bounded.nbytes <= budget
+    assert 1003 in bounded and 1000 not in bounded
+
+
+def test_tree_cache_unreachable_and_graph_change():
+    """
+    Tests unreachable targets and that a rebuilt graph representation clears the cache.
+
+    Raises:
+        AssertionError: If an unreachable target gets a path or stale trees survive.
+    """
+    graph = nx.MultiDiGraph()
+    graph.add_edge(1, 2, weight=1.0)
+    graph.add_node(3)
+    cache = ShortestPathTreeCache(graph)
+
+    assert cache.distance(1, 3) == float("inf") and cache.path(1, 3) == []
+    graph.add_edge(3, 1, weight=1.0)
+    graph.add_node(4)
+    assert cache.distance(3, 2) == pytest.approx(2.0)
+    assert 1 not in cache
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("algorithm_class", [CachedDijkstraAlgorithm, ContractionHierarchiesAlgorithm])
+async def test_path_algorithms_plot(grid_graph, algorithm_class):
+    """
+    Tests that the algorithms answering from precomputed data style their path when plotting.
+
+    Raises:
+        AssertionError: If the path is wrong or no frame is captured.
+    """
+    visualizer = _FrameCounter()
+    algorithm = algorithm_class(grid_graph, visualizer, GraphStyler())
+
+    await algorithm.execute(1000, 1035, plot=True)
+    await algorithm.execute(1000, 1021)
+
+    path = algorithm.path(1000, 1021)
+    cost = sum(min(d["weight"] for d in grid_graph[u][v].values()) for u, v in zip(path, path[1:]))
+    assert path[0] == 1000 and path[-1] == 1021
+    assert cost == pytest.approx(nx.shortest_path_length(grid_graph, 1000, 1021, weight="weight"))
+    assert visualizer.frames > 0
+    assert any(data.get("color") == "#2432B0" for _, _, data in grid_graph.edges(data=True))
@@ -1,3 +1,4 @@
-from .graph_initializer import initialize_graph
+from .graph_initializer import initialize_graph, load_graph_file, prepare_graph
+from .graph_cache import GraphSnapshotStore
 
-__all__ = ["initialize_graph"]
+__all__ = ["initialize_graph", "load_graph_file", "prepare_graph", "GraphSnapshotStore"]
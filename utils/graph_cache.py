@@ -0,0 +1,145 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_DIR = os.path.join("cache", "graphs")
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class GraphSnapshotStore:
+    """Persistent on-disk store for fully initialized road network graphs.
+
+    Downloading a city from OpenStreetMap and computing edge weights takes minutes,
+    while unpickling the finished graph takes a fraction of a second. The store keeps
+    one snapshot file per (place name, network type, weighting version) so that
+    repeated runs, tests and comparison scripts work fully offline once a snapshot
+    has been written.
+
+    Attributes:
+        directory (str): The directory in which snapshot files are kept.
+    """
+
+    def __init__(self, directory: str = DEFAULT_SNAPSHOT_DIR):
+        """Initializes the GraphSnapshotStore.
+
+        Args:
+            directory (str, optional): The directory in which snapshot files are kept.
+                Defaults to "cache/graphs".
+        """
+        self.directory = directory
+
+    @staticmethod
+    def snapshot_key(place_name: str, network_type: str, weighting_version: int) -> str:
+        """Builds the key identifying a snapshot.
+
+        The place name is normalized (case and surrounding whitespace) so that
+        "Gliwice, Poland" and " gliwice, poland" share one snapshot.
+
+        Args:
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            str: A hexadecimal digest usable as a file name.
+        """
+        raw = f"{place_name.strip().lower()}|{network_type}|{weighting_version}|{SNAPSHOT_FORMAT_VERSION}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, place_name: str, network_type: str, weighting_version: int) -> str:
+        """Returns the file path of the snapshot for the given key components.
+
+        Args:
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            str: The absolute or relative path of the snapshot file.
+        """
+        key = self.snapshot_key(place_name, network_type, weighting_version)
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def exists(self, place_name: str, network_type: str, weighting_version: int) -> bool:
+        """Checks whether a snapshot is stored for the given key components.
+
+        Args:
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            bool: True if a snapshot file exists, False otherwise.
+        """
+        return os.path.exists(self.path_for(place_name, network_type, weighting_version))
+
+    def load(self, place_name: str, network_type: str, weighting_version: int):
+        """Loads a stored snapshot.
+
+        Unreadable or corrupted snapshot files are logged and treated as missing,
+        so the caller falls back to rebuilding the graph.
+
+        Args:
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            networkx.MultiDiGraph | None: The stored graph, or None if no usable snapshot exists.
+        """
+        path = self.path_for(place_name, network_type, weighting_version)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as snapshot_file:
+                return pickle.load(snapshot_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable graph snapshot {path}: {e}")
+            return None
+
+    def save(self, graph, place_name: str, network_type: str, weighting_version: int) -> str:
+        """Stores a snapshot of the given graph.
+
+        The snapshot is written to a temporary file first and moved into place,
+        so a crash while saving never leaves a truncated snapshot behind.
+
+        Args:
+            graph (networkx.MultiDiGraph): The fully initialized graph to store.
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            str: The path of the written snapshot file.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(place_name, network_type, weighting_version)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as snapshot_file:
+                pickle.dump(graph, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+    def remove(self, place_name: str, network_type: str, weighting_version: int):
+        """Deletes the snapshot for the given key components, if present.
+
+        Args:
+            place_name (str): The name of the place the graph was built for.
+            network_type (str): The OSM network type, e.g. "drive".
+            weighting_version (int): The version of the edge weighting scheme.
+
+        Returns:
+            None
+        """
+        path = self.path_for(place_name, network_type, weighting_version)
+        if os.path.exists(path):
+            os.remove(path)
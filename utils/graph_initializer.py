@@ -1,7 +1,21 @@
+import os
+import logging
 import osmnx as ox
+from utils.graph_cache import GraphSnapshotStore
 
+logger = logging.getLogger(__name__)
 
-def initialize_graph(place_name: str):
+#: Bump whenever the node defaults or edge weighting below change, so stale snapshots are not reused.
+WEIGHTING_VERSION = 1
+
+
+def initialize_graph(
+        place_name: str,
+        network_type: str = "drive",
+        source_file: str = None,
+        store: GraphSnapshotStore = None,
+        refresh: bool = False,
+):
     """
     Initializes a road network graph for a specified place using the osmnx library.
 
@@ -9,9 +23,23 @@ def initialize_graph(place_name: str):
     location. Node properties and edge weights are initialized to support routing
     and other graph-based computations.
 
+    The fully weighted graph is stored in a `GraphSnapshotStore` keyed by place name,
+    network type and `WEIGHTING_VERSION`. Subsequent calls load the snapshot from
+    local disk and never contact OpenStreetMap, so they work fully offline. The
+    snapshot also carries the graph's `SpatialIndex`, so coordinates can be snapped
+    to nodes and edges without rebuilding it; older snapshots without an index are
+    upgraded in place on first load.
+
     Args:
         place_name (str): The name of the place to generate the road network graph.
             This can be a city name, district, or any location recognized by OpenStreetMap (OSM).
+        network_type (str, optional): The OSM network type to download. Defaults to "drive".
+        source_file (str, optional): A local `.osm`/`.xml` or `.graphml` file used instead
+            of downloading from OSM when no snapshot exists yet. Defaults to None.
+        store (GraphSnapshotStore, optional): The snapshot store to use. Defaults to a store
+            in "cache/graphs".
+        refresh (bool, optional): Whether to ignore an existing snapshot and rebuild it.
+            Defaults to False.
 
     Returns:
         networkx.classes.multidigraph.MultiDiGraph: A directed graph object with initialized
@@ -50,8 +78,68 @@ def initialize_graph(place_name: str):
         - If the `maxspeed` attribute is missing or not a valid integer, a default value
           of `40` is applied.
     """
-    graph = ox.graph_from_place(place_name, network_type="drive")
+    from core.spatial_index import SPATIAL_INDEX_KEY, SpatialIndex
+
+    store = store or GraphSnapshotStore()
+
+    if not refresh:
+        graph = store.load(place_name, network_type, WEIGHTING_VERSION)
+        if graph is not None:
+            if SPATIAL_INDEX_KEY not in graph.graph:
+                SpatialIndex.for_graph(graph)
+                store.save(graph, place_name, network_type, WEIGHTING_VERSION)
+            return graph
+
+    if source_file is not None:
+        graph = load_graph_file(source_file)
+    else:
+        graph = ox.graph_from_place(place_name, network_type=network_type)
+
+    prepare_graph(graph)
+    SpatialIndex.for_graph(graph)
+    path = store.save(graph, place_name, network_type, WEIGHTING_VERSION)
+    logger.info(f"Stored graph snapshot for '{place_name}' ({network_type}): {path}")
+    return graph
+
+
+def load_graph_file(path: str):
+    """
+    Loads a raw road network graph from a local file.
+
+    This is the offline stand-in for downloading a place from OpenStreetMap.
+
+    Args:
+        path (str): Path to an OSM XML export (`.osm` or `.xml`) or to a graph previously
+            saved with `osmnx.save_graphml` (`.graphml`).
 
+    Returns:
+        networkx.classes.multidigraph.MultiDiGraph: The unweighted graph read from the file.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+        FileNotFoundError: If the file does not exist.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Graph source file not found: {path}")
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".graphml":
+        return ox.load_graphml(path)
+    if extension in (".osm", ".xml"):
+        return ox.graph_from_xml(path)
+    raise ValueError(f"Unsupported graph source file type: {extension}")
+
+
+def prepare_graph(graph):
+    """
+    Applies the default node attributes and edge weights to a raw road network graph.
+
+    Args:
+        graph (networkx.MultiDiGraph): The graph to prepare. It is modified in place.
+
+    Returns:
+        networkx.classes.multidigraph.MultiDiGraph: The same graph, for convenience.
+    """
     # Initialize nodes with default values
     for node in graph.nodes:
         graph.nodes[node].update({